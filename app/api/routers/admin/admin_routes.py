@@ -0,0 +1,52 @@
+from typing import Annotated
+
+from fastapi import Query, Depends, APIRouter, HTTPException, status
+
+from app.core import get_settings
+from app.core.settings import Settings
+from app.core.mongo_client import mongo_client_manager
+from app.api.routers.dependencies.user_deps import get_current_user
+
+
+def admin_endpoints_enabled(settings: Annotated[Settings, Depends(get_settings)]) -> None:
+    """admin_endpoints_enabled Hide the admin routes unless ``ADMIN_ENDPOINTS_ENABLED`` is set.
+
+    :param settings: Application settings
+    :type settings: Settings
+    :raises HTTPException: 404 when the admin endpoints are disabled
+    """
+    if not settings.ADMIN_ENDPOINTS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["System"],
+    responses={404: {"description": "Not found"}},
+    dependencies=[Depends(get_current_user), Depends(admin_endpoints_enabled)],
+)
+
+
+@admin_router.get(
+    "/slow-queries",
+    summary="Slowest MongoDB query shapes",
+    response_description="🐢🔎 Query shapes with the most slow executions since the application started",
+)
+async def list_slow_queries(
+    limit: Annotated[int, Query(ge=1, le=100, description="Number of shapes returned")] = 10,
+) -> dict:
+    """list_slow_queries _summary_
+
+    Query shapes recorded by the command listener of the shared client, ranked by their number of executions
+    over ``MONGO_SLOW_QUERY_THRESHOLD_MS``. The plan summary is only filled when the logger runs in DEBUG.
+
+    :param limit: Number of shapes returned
+    :type limit: int
+    :return: Threshold in use and the slowest shapes
+    :rtype: dict
+    """
+    query_listener = mongo_client_manager.query_listener
+    return {
+        "threshold_ms": query_listener.threshold_ms,
+        "shapes": query_listener.top_slow_shapes(limit),
+    }
@@ -5,11 +5,17 @@ from fastapi import Depends, Request, APIRouter, HTTPException, status
 from pydantic import ValidationError
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.core.security import create_access_token, create_refresh_token, verify_refresh_token
+from app.core.security import (
+    PasswordHashingBusyError,
+    create_access_token,
+    create_refresh_token,
+    verify_refresh_token,
+)
 from app.domain.entities.user import User
 from app.services.user_service import UserService
 from app.schemas.pydantic.auth_schemas import TokenSchema, TokenPayload
 from app.api.routers.dependencies.user_deps import get_current_user
+from app.api.routers.dependencies.service_deps import get_user_service
 
 auth_router = APIRouter(
     prefix="/auth",
@@ -21,7 +27,7 @@ auth_router = APIRouter(
 
 @auth_router.post("/login", summary="Sign in user")
 async def login(
-    service: Annotated[UserService, Depends()],
+    service: Annotated[UserService, Depends(get_user_service)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> TokenSchema:
     """Sign in user.
@@ -40,6 +46,12 @@ async def login(
             "access_token": create_access_token(user.id),
             "refresh_token": create_refresh_token(user.id),
         }
+    except PasswordHashingBusyError as busy_error:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(busy_error),
+            headers={"Retry-After": "1"},
+        ) from busy_error
     except Exception as error:
         print(error)
         raise HTTPException(
@@ -59,7 +71,7 @@ async def test_token(user: Annotated[User, Depends(get_current_user)]):
 async def refresh_token(
     request: Request,
     refresh_token: str,
-    service: Annotated[UserService, Depends()],
+    service: Annotated[UserService, Depends(get_user_service)],
 ) -> TokenSchema:
     """Refresh token.
 
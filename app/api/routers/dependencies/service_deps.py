@@ -0,0 +1,11 @@
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+from app.infrastructure.container import get_container
+
+
+def get_task_service() -> TaskService:
+    return get_container().task_service
+
+
+def get_user_service() -> UserService:
+    return get_container().user_service
@@ -8,8 +8,9 @@ from fastapi.security import OAuth2PasswordBearer
 
 from app.core import get_settings
 from app.domain.entities.user import User
-from app.services.user_service import UserService
+from app.services.user_service import UserService, authenticated_user_cache
 from app.schemas.pydantic.auth_schemas import TokenPayload
+from app.api.routers.dependencies.service_deps import get_user_service
 
 oauth2_bearer = OAuth2PasswordBearer(
     tokenUrl=f"{get_settings().get_api_prefix}/auth/login",
@@ -21,7 +22,7 @@ print(f"{get_settings().get_api_prefix}/auth/login")
 
 
 async def get_current_user(
-    service: Annotated[UserService, Depends()],
+    service: Annotated[UserService, Depends(get_user_service)],
     token: Annotated[str, Depends(oauth2_bearer)],
 ) -> User:
     try:
@@ -45,6 +46,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from error
 
+    user = authenticated_user_cache.get(token_data.sub)
+    if user is not None:
+        return user
+
     user = await service.get_user_by_id(token_data.sub)
 
     if not user:
@@ -53,4 +58,5 @@ async def get_current_user(
             detail="Could not find user",
         )
 
+    authenticated_user_cache.set(token_data.sub, user)
     return user
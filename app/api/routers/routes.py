@@ -3,10 +3,11 @@ from fastapi import APIRouter
 from app.api.routers.auth.auth_routes import auth_router
 from app.api.routers.user.user_routes import user_router
 from app.api.routers.tasks.task_routes import task_router
+from app.api.routers.admin.admin_routes import admin_router
 
 router = APIRouter()
 
-routers = [auth_router, user_router, task_router]
+routers = [auth_router, user_router, task_router, admin_router]
 
 
 for route in routers:
@@ -1,18 +1,43 @@
+import io
+import csv
+from uuid import UUID
 from typing import Annotated
 
-from fastapi import Body, Query, Depends, APIRouter, HTTPException
+from fastapi import Body, Query, Header, Depends, Request, APIRouter, HTTPException
+from pydantic import ValidationError
+from fastapi.responses import Response, StreamingResponse
 
+from app.core import get_settings
+from app.utils.etag import build_etag, etag_matches
 from app.core.logger import logger
+from app.utils.task_export import MEDIA_TYPES
 from app.domain.entities.user import User
 from app.services.task_service import TaskService
-from app.schemas.pydantic.task_schemas import TaskRead, TaskCreate, TaskUpdate, TaskFilters
+from app.utils.versioned_cache import canonical_key
+from app.schemas.fastapi.responses import PydanticJSONResponse, get_type_adapter
+from app.schemas.pydantic.task_schemas import (
+    TaskRead,
+    TaskCreate,
+    TaskUpdate,
+    TaskFilters,
+    TaskReadMany,
+    TaskImportResult,
+    TaskBulkCreateResult,
+)
+from app.utils.enums.export_format_enum import ExportFormat
 from app.schemas.pydantic.common_schemas import (
+    BulkSelection,
     CommonResponse,
+    BulkWriteResult,
+    ListQueryParams,
     PaginationOptions,
     CommonListResponse,
     FilterCapabilities,
 )
 from app.api.routers.dependencies.user_deps import get_current_user
+from app.api.routers.dependencies.service_deps import get_task_service
+from app.infrastructure.models.odm.beanie_task_model import SubTaskNotFoundError
+from app.infrastructure.datasource.build_pagination_datasource import InvalidCursorError
 
 task_router = APIRouter(
     prefix="/task",
@@ -30,7 +55,7 @@ task_router = APIRouter(
 async def create_task(
     current_user: Annotated[User, Depends(get_current_user)],
     task_data: TaskCreate,
-    service: Annotated[TaskService, Depends()],
+    service: Annotated[TaskService, Depends(get_task_service)],
 ) -> CommonResponse[TaskRead]:
     try:
         created_task = await service.create_task(current_user, task_data)
@@ -38,6 +63,12 @@ async def create_task(
             "message": "Task created successfully.",
             "result": created_task,
         }
+    except SubTaskNotFoundError as error:
+        raise HTTPException(
+            status_code=422,
+            detail=str(error),
+            headers={"X-Error": "Sub tasks not found"},
+        ) from error
     except Exception as error:
         msg = f"Task creation failed, error: {error}"
         logger.error(msg)
@@ -48,22 +79,84 @@ async def create_task(
         ) from error
 
 
+def check_bulk_size(items_count: int) -> None:
+    """check_bulk_size Reject the bulk requests targeting more than ``TASK_BULK_MAX_ITEMS`` tasks.
+
+    :param items_count: Number of tasks in the request
+    :type items_count: int
+    :raises HTTPException: When there are too many tasks
+    """
+    max_items = get_settings().TASK_BULK_MAX_ITEMS
+    if items_count > max_items:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {max_items} tasks can be processed at once",
+            headers={"X-Error": "Too many tasks"},
+        )
+
+
+@task_router.post(
+    "/bulk-create",
+    summary="Create many tasks",
+    response_description="📝📦 Outcome of each task creation",
+)
+async def create_tasks(
+    current_user: Annotated[User, Depends(get_current_user)],
+    tasks_data: list[TaskCreate],
+    service: Annotated[TaskService, Depends(get_task_service)],
+) -> CommonResponse[TaskBulkCreateResult]:
+    check_bulk_size(len(tasks_data))
+
+    try:
+        result = await service.create_tasks(current_user, tasks_data)
+        return {
+            "message": "Tasks processed successfully.",
+            "result": result,
+        }
+    except Exception as error:
+        msg = f"Bulk task creation failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Bulk task creation failed",
+            headers={"X-Error": "Bulk task creation failed"},
+        ) from error
+
+
 @task_router.get(
     "/read/{task_id}",
     summary="Get task",
     response_description="📝🧩 Founded Task",
+    response_model=CommonResponse[TaskRead],
 )
 async def get_task(
     current_user: Annotated[User, Depends(get_current_user)],
-    service: Annotated[TaskService, Depends()],
+    service: Annotated[TaskService, Depends(get_task_service)],
     task_id: str,
-) -> CommonResponse[TaskRead]:
+    if_none_match: Annotated[
+        str | None,
+        Header(description="ETag of the task held by the client, answered by a 304 while it is current"),
+    ] = None,
+) -> Response:
     try:
+        if if_none_match:
+            version = await service.get_task_version(task_id)
+            etag = build_etag(task_id, version)
+            if version is not None and etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+
         retrieved_task = await service.get_task_by_id(task_id)
-        return {
-            "message": "Task retrieved successfully.",
-            "result": retrieved_task,
-        }
+        # Derived from the task sent, so the tag never claims a newer version than the payload
+        task_fields = retrieved_task if isinstance(retrieved_task, dict) else retrieved_task.model_dump()
+        etag = build_etag(task_id, task_fields.get("updated_at") or task_fields.get("created_at"))
+        return PydanticJSONResponse(
+            {
+                "message": "Task retrieved successfully.",
+                "result": retrieved_task,
+            },
+            CommonResponse[TaskRead],
+            headers={"ETag": etag},
+        )
     except Exception as error:
         msg = f"Task retrieval failed, error: {error}"
         logger.error(msg)
@@ -74,32 +167,93 @@ async def get_task(
         ) from error
 
 
+@task_router.post(
+    "/read-many",
+    summary="Get many tasks",
+    response_description="📝🧩 Founded tasks and the IDs not found",
+    response_model=CommonResponse[TaskReadMany],
+)
+async def get_tasks(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    task_ids: Annotated[list[UUID], Body(embed=True, alias="ids", min_length=1, description="IDs of the tasks")],
+) -> PydanticJSONResponse:
+    check_bulk_size(len(task_ids))
+    try:
+        tasks, missing = await service.get_tasks_by_ids(task_ids)
+        return PydanticJSONResponse(
+            {
+                "message": "Tasks retrieved successfully.",
+                "result": {"tasks": tasks, "missing": missing},
+            },
+            CommonResponse[TaskReadMany],
+        )
+    except Exception as error:
+        msg = f"Tasks retrieval failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Tasks retrieval failed",
+            headers={"X-Error": "Tasks retrieval failed"},
+        ) from error
+
+
 @task_router.post(
     "/list",
     summary="List tasks",
     response_description="📝🔎 List of tasks in dependence of filters and sorts applied",
+    response_model=CommonListResponse[TaskRead],
 )
 async def list_tasks(
     # current_user: Annotated[User, Depends(get_current_user)],
-    service: Annotated[TaskService, Depends()],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    query_params: Annotated[ListQueryParams, Query()],
     pagination_options: Annotated[
         PaginationOptions[FilterCapabilities[TaskFilters]] | None,
         Body(description="Pagination options"),
     ] = None,
-    page: Annotated[int, Query(description="Current page retrieved")] = 0,
-    offset: Annotated[int, Query(description="Number of items per page")] = 10,
-) -> CommonListResponse[TaskRead]:
+    if_none_match: Annotated[
+        str | None,
+        Header(description="ETag of the page held by the client, answered by a 304 while it is current"),
+    ] = None,
+) -> Response:
     try:
-        tasks = await service.list_tasks(
-            pagination_options.filters if pagination_options else None,
-            pagination_options.build_sorts_options() if pagination_options else None,
-            page,
-            offset,
+        task_filters = pagination_options.filters if pagination_options else None
+        cache_key = canonical_key(
+            pagination_options.model_dump(mode="json") if pagination_options else None,
+            query_params.model_dump(),
         )
-        return {
-            "total": len(tasks),
-            "data": tasks,
-        }
+
+        # Read before the page, so a write landing in between can only make the tag older than the payload
+        last_modified, count = await service.get_task_list_version(task_filters)
+        etag = build_etag(cache_key, last_modified, count)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        async def render_page() -> bytes:
+            tasks, total, next_cursor = await service.list_tasks_page(
+                task_filters,
+                pagination_options.build_sorts_options() if pagination_options else None,
+                query_params,
+                include_total=query_params.include_total,
+            )
+            return PydanticJSONResponse(
+                {
+                    "total": total,
+                    "data": tasks,
+                    "next_cursor": next_cursor,
+                },
+                CommonListResponse[TaskRead],
+            ).body
+
+        body = await service.get_task_list_response(cache_key, render_page)
+        return Response(body, media_type=PydanticJSONResponse.media_type, headers={"ETag": etag})
+    except InvalidCursorError as error:
+        raise HTTPException(
+            status_code=400,
+            detail=str(error),
+            headers={"X-Error": "Invalid cursor"},
+        ) from error
     except Exception as error:
         msg = f"Task retrieval failed, error: {error}"
         logger.error(msg)
@@ -110,6 +264,130 @@ async def list_tasks(
         ) from error
 
 
+@task_router.get(
+    "/export",
+    summary="Export tasks",
+    response_description="📝📤 Every task matching the filters, streamed as NDJSON or CSV",
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def export_tasks(
+    service: Annotated[TaskService, Depends(get_task_service)],
+    export_format: Annotated[ExportFormat, Query(alias="format", description="Format of the export")] = (
+        ExportFormat.NDJSON
+    ),
+    filters: Annotated[
+        str | None,
+        Query(description="JSON encoded FilterCapabilities[TaskFilters], same as the filters of /task/list"),
+    ] = None,
+    *,
+    compress: Annotated[bool, Query(alias="gzip", description="Whether the export is gzipped")] = False,
+) -> StreamingResponse:
+    try:
+        task_filters = (
+            get_type_adapter(FilterCapabilities[TaskFilters]).validate_json(filters) if filters is not None else None
+        )
+    except ValidationError as validation_error:
+        raise HTTPException(
+            status_code=422,
+            detail=validation_error.errors(include_url=False, include_context=False),
+            headers={"X-Error": "Invalid filters"},
+        ) from validation_error
+
+    try:
+        chunks = service.export_tasks(task_filters, export_format, compress=compress)
+    except Exception as error:
+        msg = f"Task export failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Task export failed",
+            headers={"X-Error": "Task export failed"},
+        ) from error
+
+    filename = f"tasks.{export_format.value}{'.gz' if compress else ''}"
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if compress else MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@task_router.post(
+    "/import",
+    summary="Import tasks",
+    response_description="📝📥 Summary of the import",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+                "text/csv": {"schema": {"type": "string", "format": "binary"}},
+            },
+        },
+    },
+)
+async def import_tasks(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    import_format: Annotated[ExportFormat, Query(alias="format", description="Format of the upload")] = (
+        ExportFormat.NDJSON
+    ),
+) -> CommonResponse[TaskImportResult]:
+    try:
+        summary = await service.import_tasks(
+            current_user,
+            request.stream(),
+            import_format,
+            compressed=request.headers.get("content-encoding", "").lower() == "gzip",
+        )
+        if summary["failed"]:
+            summary["error_report"] = str(request.url_for("get_import_report", import_id=summary["import_id"]).path)
+        return {
+            "message": "Tasks imported successfully.",
+            "result": summary,
+        }
+    except Exception as error:
+        msg = f"Task import failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Task import failed",
+            headers={"X-Error": "Task import failed"},
+        ) from error
+
+
+@task_router.get(
+    "/import/{import_id}/errors",
+    summary="Download import errors",
+    response_description="📝📥 Rejected rows of an import, as CSV",
+    response_class=Response,
+)
+async def get_import_report(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    import_id: str,
+) -> Response:
+    report = await service.get_import_report(current_user, import_id)
+    if report is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Import report not found",
+            headers={"X-Error": "Import report not found"},
+        )
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["line", "error"])
+    writer.writeheader()
+    writer.writerows(report)
+    return Response(
+        buffer.getvalue(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="import-{import_id}-errors.csv"'},
+    )
+
+
 @task_router.put(
     "/{task_id}",
     summary="Update task",
@@ -117,7 +395,7 @@ async def list_tasks(
 )
 async def update_task(
     current_user: Annotated[User, Depends(get_current_user)],
-    service: Annotated[TaskService, Depends()],
+    service: Annotated[TaskService, Depends(get_task_service)],
     task_id: str,
     task_data: TaskUpdate,
 ) -> CommonResponse[TaskRead]:
@@ -127,6 +405,12 @@ async def update_task(
             "message": "Task updated successfully.",
             "result": updated_task,
         }
+    except SubTaskNotFoundError as error:
+        raise HTTPException(
+            status_code=422,
+            detail=str(error),
+            headers={"X-Error": "Sub tasks not found"},
+        ) from error
     except Exception as error:
         msg = f"Task update failed, error: {error}"
         logger.error(msg)
@@ -144,7 +428,7 @@ async def update_task(
 )
 async def archive_task(
     current_user: Annotated[User, Depends(get_current_user)],
-    service: Annotated[TaskService, Depends()],
+    service: Annotated[TaskService, Depends(get_task_service)],
     task_id: str,
 ) -> CommonResponse[TaskRead]:
     try:
@@ -170,7 +454,7 @@ async def archive_task(
 )
 async def delete_task(
     current_user: Annotated[User, Depends(get_current_user)],
-    service: Annotated[TaskService, Depends()],
+    service: Annotated[TaskService, Depends(get_task_service)],
     task_id: str,
 ) -> CommonResponse[TaskRead]:
     try:
@@ -187,3 +471,93 @@ async def delete_task(
             detail="Task deletion attempt failed",
             headers={"X-Error": "Task deletion attempt failed"},
         ) from error
+
+
+@task_router.post(
+    "/bulk-update",
+    summary="Update many tasks",
+    response_description="📝🔄 Number of matched and updated tasks",
+)
+async def update_tasks(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    selection: Annotated[BulkSelection[FilterCapabilities[TaskFilters]], Body(description="Tasks to update")],
+    task_data: Annotated[TaskUpdate, Body(description="Fields to update")],
+) -> CommonResponse[BulkWriteResult]:
+    check_bulk_size(len(selection.ids or []))
+    try:
+        result = await service.update_tasks(current_user, selection, task_data)
+        return {
+            "message": "Tasks updated successfully.",
+            "result": result,
+        }
+    except SubTaskNotFoundError as error:
+        raise HTTPException(
+            status_code=422,
+            detail=str(error),
+            headers={"X-Error": "Sub tasks not found"},
+        ) from error
+    except Exception as error:
+        msg = f"Bulk task update failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Bulk task update failed",
+            headers={"X-Error": "Bulk task update failed"},
+        ) from error
+
+
+@task_router.post(
+    "/bulk-archive",
+    summary="Archive many tasks",
+    response_description="📝📁 Number of matched and archived tasks",
+)
+async def archive_tasks(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    selection: BulkSelection[FilterCapabilities[TaskFilters]],
+    *,
+    is_archived: Annotated[bool, Query(description="Archived status to set, false restores the tasks")] = True,
+) -> CommonResponse[BulkWriteResult]:
+    check_bulk_size(len(selection.ids or []))
+    try:
+        result = await service.archive_tasks(current_user, selection, is_archived=is_archived)
+        return {
+            "message": "Tasks archived successfully." if is_archived else "Tasks restored successfully.",
+            "result": result,
+        }
+    except Exception as error:
+        msg = f"Bulk task archiving failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Bulk task archiving failed",
+            headers={"X-Error": "Bulk task archiving failed"},
+        ) from error
+
+
+@task_router.post(
+    "/bulk-delete",
+    summary="Delete many tasks",
+    response_description="📝💥 Number of deleted tasks",
+)
+async def delete_tasks(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[TaskService, Depends(get_task_service)],
+    selection: BulkSelection[FilterCapabilities[TaskFilters]],
+) -> CommonResponse[BulkWriteResult]:
+    check_bulk_size(len(selection.ids or []))
+    try:
+        result = await service.delete_tasks(selection)
+        return {
+            "message": "Tasks deleted successfully.",
+            "result": result,
+        }
+    except Exception as error:
+        msg = f"Bulk task deletion failed, error: {error}"
+        logger.error(msg)
+        raise HTTPException(
+            status_code=500,
+            detail="Bulk task deletion failed",
+            headers={"X-Error": "Bulk task deletion failed"},
+        ) from error
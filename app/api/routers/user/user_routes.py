@@ -4,12 +4,14 @@ from fastapi import Depends, Request, APIRouter, HTTPException, status
 from pydantic import ValidationError
 
 from app.main import logger
+from app.core.security import PasswordHashingBusyError
 from app.core.rate_limiting import limiter
 from app.domain.entities.user import User
 from app.services.user_service import UserService
 from app.schemas.pydantic.user_schemas import UserRead, UserCreate, UserUpdate, UserUpdatePassword
 from app.schemas.pydantic.common_schemas import CommonResponse
 from app.api.routers.dependencies.user_deps import get_current_user
+from app.api.routers.dependencies.service_deps import get_user_service
 
 user_router = APIRouter(
     prefix="/user",
@@ -25,7 +27,11 @@ user_router = APIRouter(
     response_description="User information",
 )
 @limiter.limit("5/hour")
-async def create_user(request: Request, user_data: UserCreate, service: Annotated[UserService, Depends()]) -> UserRead:
+async def create_user(
+    request: Request,
+    user_data: UserCreate,
+    service: Annotated[UserService, Depends(get_user_service)],
+) -> UserRead:
     """create_user _summary_
 
     _extended_summary_
@@ -41,6 +47,12 @@ async def create_user(request: Request, user_data: UserCreate, service: Annotate
     """
     try:
         return await service.create_user(user_data)
+    except PasswordHashingBusyError as busy_error:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(busy_error),
+            headers={"X-Error": "User creation failed", "Retry-After": "1"},
+        ) from busy_error
     except ValidationError as validation_error:
         msg = f"User creation failed, validation error: {validation_error}"
         logger.error(msg)
@@ -84,7 +96,7 @@ async def update_user_password(
     request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     new_password_payload: UserUpdatePassword,
-    service: Annotated[UserService, Depends()],
+    service: Annotated[UserService, Depends(get_user_service)],
 ) -> dict:
     """Update user password.
 
@@ -97,6 +109,12 @@ async def update_user_password(
     try:
         result = await service.update_user_password(current_user.id, new_password_payload)
         return {"message": "User password updated successfully" if result else "User password update failed"}
+    except PasswordHashingBusyError as busy_error:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(busy_error),
+            headers={"X-Error": "User password update failed", "Retry-After": "1"},
+        ) from busy_error
     except ValidationError as validation_error:
         msg = f"User password update failed, validation error: {validation_error}"
         logger.error(msg)
@@ -125,7 +143,7 @@ async def update_user_info(
     request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     user_data: UserUpdate,
-    service: Annotated[UserService, Depends()],
+    service: Annotated[UserService, Depends(get_user_service)],
 ) -> CommonResponse[UserRead]:
     try:
         updated_user = await service.update_user(current_user.id, user_data)
@@ -155,7 +173,7 @@ async def update_user_info(
 )
 async def delete_user(
     current_user: Annotated[User, Depends(get_current_user)],
-    service: Annotated[UserService, Depends()],
+    service: Annotated[UserService, Depends(get_user_service)],
 ) -> dict:
     try:
         result = await service.delete_user(current_user.id)
@@ -0,0 +1,454 @@
+import asyncio
+from abc import ABC, abstractmethod
+from time import monotonic
+from uuid import uuid4
+from functools import lru_cache
+from collections.abc import Callable, Iterable, Awaitable
+
+from app.core import get_settings
+from app.core.logger import logger
+from app.utils.lru_ttl_cache import LRUTTLCache
+
+# Delay between two lookups of a key another process is computing
+LOCK_POLL_INTERVAL_SECONDS = 0.05
+
+# Deletes a key only while it still holds the given value, so an expired lock taken over by another process is kept
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class CacheStats:
+    """CacheStats
+
+    Counters shared by a backend and every namespaced view of it.
+    """
+
+    def __init__(self) -> None:
+        """__init__ Start every counter at zero."""
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.status = "Not sampled yet"
+
+    def as_dict(self) -> dict[str, int | float | str | None]:
+        """as_dict Counters along with the hit ratio.
+
+        :return: Hits, misses, errors, hit ratio and last known status
+        :rtype: dict[str, int | float | str | None]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "status": self.status,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class CacheBackend(ABC):
+    """CacheBackend
+
+    Byte oriented key/value cache. Keys are prefixed by the namespace of the backend, so several layers can share
+    the same store without colliding, and ``get_or_set`` lets a single caller compute a missing value while the
+    others wait for it.
+    """
+
+    name = "abstract"
+
+    def __init__(self, namespace: str = "", lock_ttl_seconds: float = 10, stats: CacheStats | None = None) -> None:
+        """__init__ _summary_
+
+        :param namespace: Prefix of every key, e.g. ``quick_td:tasks``
+        :type namespace: str
+        :param lock_ttl_seconds: Lifetime of the lock taken by ``get_or_set``, bounds how long the other callers wait
+        :type lock_ttl_seconds: float
+        :param stats: Counters to update, shared with the backend this one is a view of
+        :type stats: CacheStats | None
+        """
+        self.namespace = namespace
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self._stats = stats or CacheStats()
+        self._computations: dict[str, asyncio.Future[bytes]] = {}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}" if self.namespace else key
+
+    @abstractmethod
+    def namespaced(self, namespace: str) -> "CacheBackend":
+        """View of the same store whose keys are prefixed by ``namespace`` too.
+
+        :param namespace: Nested namespace, e.g. ``tasks``
+        :type namespace: str
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: CacheBackend
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _set(self, key: str, value: bytes, ttl_seconds: float | None, *, only_if_missing: bool) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _delete(self, keys: list[str]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _delete_if_equal(self, key: str, value: bytes) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _incr(self, key: str, amount: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _ping(self) -> bool:
+        raise NotImplementedError
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the connections of the backend, if any."""
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        # A failing cache behaves as an empty one rather than failing the requests using it
+        logger.error(f"Cache {operation} failed: {error}")
+        self._stats.errors += 1
+        self._stats.status = "Not reachable"
+
+    async def get(self, key: str) -> bytes | None:
+        """Value stored under ``key``.
+
+        :param key: _description_
+        :type key: str
+        :return: ``None`` on a miss, or when the store cannot be reached
+        :rtype: bytes | None
+        """
+        return (await self.mget([key]))[0]
+
+    async def mget(self, keys: Iterable[str]) -> list[bytes | None]:
+        """Values stored under ``keys``, in a single round trip.
+
+        :param keys: _description_
+        :type keys: Iterable[str]
+        :return: Values in the order of ``keys``, ``None`` for the misses
+        :rtype: list[bytes | None]
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            values = await self._get_many([self._key(key) for key in keys])
+        except Exception as error:  # noqa: BLE001
+            self._record_error("read", error)
+            values = [None] * len(keys)
+        hits = sum(value is not None for value in values)
+        self._stats.hits += hits
+        self._stats.misses += len(values) - hits
+        return values
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key``.
+
+        :param key: _description_
+        :type key: str
+        :param value: _description_
+        :type value: bytes
+        :param ttl_seconds: Lifetime of the entry, ``None`` keeps it until it is evicted
+        :type ttl_seconds: float | None
+        """
+        try:
+            await self._set(self._key(key), value, ttl_seconds, only_if_missing=False)
+        except Exception as error:  # noqa: BLE001
+            self._record_error("write", error)
+
+    async def delete(self, *keys: str) -> int:
+        """Drop the entries stored under ``keys``.
+
+        :return: Number of entries dropped
+        :rtype: int
+        """
+        if not keys:
+            return 0
+        try:
+            return await self._delete([self._key(key) for key in keys])
+        except Exception as error:  # noqa: BLE001
+            self._record_error("delete", error)
+            return 0
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        """Atomically add ``amount`` to the counter stored under ``key``, missing counters start at zero.
+
+        :param key: _description_
+        :type key: str
+        :param amount: _description_
+        :type amount: int
+        :return: New value of the counter, ``amount`` when the store cannot be reached
+        :rtype: int
+        """
+        try:
+            return await self._incr(self._key(key), amount)
+        except Exception as error:  # noqa: BLE001
+            self._record_error("increment", error)
+            return amount
+
+    async def ping(self) -> str:
+        """Check that the store answers, the result is reported as the status of the cache.
+
+        :return: ``Up``, ``Down`` or ``Not reachable``
+        :rtype: str
+        """
+        try:
+            self._stats.status = "Up" if await self._ping() else "Down"
+        except Exception as error:  # noqa: BLE001
+            self._record_error("ping", error)
+        return self._stats.status
+
+    async def _compute_and_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        ttl_seconds: float | None,
+    ) -> bytes:
+        lock_key = self._key(f"{key}:lock")
+        lock_token = uuid4().bytes
+        deadline = monotonic() + self.lock_ttl_seconds
+        locked = False
+        try:
+            # Only the lock holder computes, the other processes poll the key until it is filled or the lock expires
+            while not (locked := await self._set(lock_key, lock_token, self.lock_ttl_seconds, only_if_missing=True)):
+                await asyncio.sleep(LOCK_POLL_INTERVAL_SECONDS)
+                value = (await self._get_many([self._key(key)]))[0]
+                if value is not None:
+                    return value
+                if monotonic() >= deadline:
+                    break
+        except Exception as error:  # noqa: BLE001
+            self._record_error("lock", error)
+
+        try:
+            value = await compute()
+            await self.set(key, value, ttl_seconds)
+            return value
+        finally:
+            if locked:
+                await self._release_lock(lock_key, lock_token)
+
+    async def _release_lock(self, lock_key: str, lock_token: bytes) -> None:
+        # Once expired, the lock may have been taken by another process, it is only dropped if still ours
+        try:
+            await self._delete_if_equal(lock_key, lock_token)
+        except Exception as error:  # noqa: BLE001
+            self._record_error("unlock", error)
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        ttl_seconds: float | None = None,
+    ) -> bytes:
+        """get_or_set Value stored under ``key``, computed and stored on a miss.
+
+        Concurrent misses in the process share one computation, and across processes a short lived lock lets
+        a single one compute the value, so an expired entry never sends a burst of identical queries.
+
+        :param key: _description_
+        :type key: str
+        :param compute: Coroutine function computing the value
+        :type compute: Callable[[], Awaitable[bytes]]
+        :param ttl_seconds: Lifetime of the stored value
+        :type ttl_seconds: float | None
+        :return: Cached or computed value
+        :rtype: bytes
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        full_key = self._key(key)
+        computation = self._computations.get(full_key)
+        if computation is None:
+            computation = asyncio.ensure_future(self._compute_and_set(key, compute, ttl_seconds))
+            self._computations[full_key] = computation
+            computation.add_done_callback(lambda _: self._computations.pop(full_key, None))
+        return await asyncio.shield(computation)
+
+    def stats(self) -> dict[str, int | float | str | None]:
+        """Usage counters of the backend, shared by its namespaced views.
+
+        :return: Backend name, namespace, status, hits, misses, errors and hit ratio
+        :rtype: dict[str, int | float | str | None]
+        """
+        return {"backend": self.name, "namespace": self.namespace, **self._stats.as_dict()}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """MemoryCacheBackend
+
+    Backend keeping the entries in an ``LRUTTLCache`` of the process. Fast, but every worker holds its own copy.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_size: int,
+        namespace: str = "",
+        lock_ttl_seconds: float = 10,
+        store: LRUTTLCache[str, bytes] | None = None,
+        stats: CacheStats | None = None,
+    ) -> None:
+        """__init__ _summary_
+
+        :param max_size: Maximum number of entries, counters and locks included
+        :type max_size: int
+        :param namespace: Prefix of every key
+        :type namespace: str
+        :param lock_ttl_seconds: Lifetime of the lock taken by ``get_or_set``
+        :type lock_ttl_seconds: float
+        :param store: Entries to share, used by the namespaced views
+        :type store: LRUTTLCache[str, bytes] | None
+        :param stats: Counters to share, used by the namespaced views
+        :type stats: CacheStats | None
+        """
+        super().__init__(namespace, lock_ttl_seconds, stats)
+        self._store: LRUTTLCache[str, bytes] = store if store is not None else LRUTTLCache(max_size=max_size)
+        self._stats.status = "Up"
+
+    def namespaced(self, namespace: str) -> "MemoryCacheBackend":  # noqa: D102
+        return MemoryCacheBackend(
+            self._store.max_size,
+            self._key(namespace),
+            self.lock_ttl_seconds,
+            self._store,
+            self._stats,
+        )
+
+    async def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [self._store.get(key) for key in keys]
+
+    async def _set(self, key: str, value: bytes, ttl_seconds: float | None, *, only_if_missing: bool) -> bool:
+        if only_if_missing and key in self._store:
+            return False
+        self._store.set(key, value, ttl_seconds)
+        return True
+
+    async def _delete(self, keys: list[str]) -> int:
+        return sum(self._store.invalidate(key) for key in keys)
+
+    async def _delete_if_equal(self, key: str, value: bytes) -> bool:
+        return self._store.get(key) == value and self._store.invalidate(key)
+
+    async def _incr(self, key: str, amount: int) -> int:
+        value = int(self._store.get(key) or 0) + amount
+        self._store.set(key, str(value).encode())
+        return value
+
+    async def _ping(self) -> bool:
+        return True
+
+    def stats(self) -> dict[str, int | float | str | None]:  # noqa: D102
+        return {**super().stats(), "size": len(self._store), "max_size": self._store.max_size}
+
+
+class RedisCacheBackend(CacheBackend):
+    """RedisCacheBackend
+
+    Backend speaking the Redis protocol through ``redis.asyncio``, so the entries are shared by every worker and
+    pod. Works with Redis, Valkey, KeyDB or any compatible server, and with ``fakeredis`` in tests.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str | None = None,
+        namespace: str = "",
+        lock_ttl_seconds: float = 10,
+        client: object | None = None,
+        stats: CacheStats | None = None,
+    ) -> None:
+        """__init__ _summary_
+
+        :param url: Server URL, e.g. ``redis://localhost:6379/0``, ignored when ``client`` is given
+        :type url: str | None
+        :param namespace: Prefix of every key
+        :type namespace: str
+        :param lock_ttl_seconds: Lifetime of the lock taken by ``get_or_set``
+        :type lock_ttl_seconds: float
+        :param client: ``redis.asyncio.Redis`` compatible client to use
+        :type client: object | None
+        :param stats: Counters to share, used by the namespaced views
+        :type stats: CacheStats | None
+        :raises RuntimeError: When no client is given and the ``redis`` package is not installed
+        """
+        super().__init__(namespace, lock_ttl_seconds, stats)
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio  # noqa: PLC0415
+            except ImportError as error:
+                msg = (
+                    "CACHE_BACKEND=redis requires the redis package, install the redis extra with "
+                    "`pip install quick-td-backend[redis]` or `uv sync --extra redis`"
+                )
+                raise RuntimeError(msg) from error
+            client = redis_asyncio.from_url(url)
+        self._client = client
+
+    def namespaced(self, namespace: str) -> "RedisCacheBackend":  # noqa: D102
+        return RedisCacheBackend(
+            namespace=self._key(namespace),
+            lock_ttl_seconds=self.lock_ttl_seconds,
+            client=self._client,
+            stats=self._stats,
+        )
+
+    async def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        return await self._client.mget(keys)
+
+    async def _set(self, key: str, value: bytes, ttl_seconds: float | None, *, only_if_missing: bool) -> bool:
+        ttl_milliseconds = max(int(ttl_seconds * 1000), 1) if ttl_seconds is not None else None
+        return bool(await self._client.set(key, value, px=ttl_milliseconds, nx=only_if_missing))
+
+    async def _delete(self, keys: list[str]) -> int:
+        return await self._client.delete(*keys)
+
+    async def _delete_if_equal(self, key: str, value: bytes) -> bool:
+        return bool(await self._client.eval(RELEASE_LOCK_SCRIPT, 1, key, value))
+
+    async def _incr(self, key: str, amount: int) -> int:
+        return await self._client.incrby(key, amount)
+
+    async def _ping(self) -> bool:
+        return bool(await self._client.ping())
+
+    async def close(self) -> None:  # noqa: D102
+        await self._client.aclose()
+
+
+@lru_cache
+def get_cache_backend() -> CacheBackend:
+    """get_cache_backend Shared cache backend selected by ``CACHE_BACKEND``.
+
+    :return: Backend namespaced by ``CACHE_NAMESPACE``, layers get their own view through ``namespaced``
+    :rtype: CacheBackend
+    """
+    settings = get_settings()
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            settings.CACHE_REDIS_URL,
+            settings.CACHE_NAMESPACE,
+            settings.CACHE_LOCK_TTL_SECONDS,
+        )
+    return MemoryCacheBackend(
+        settings.CACHE_MAX_SIZE,
+        settings.CACHE_NAMESPACE,
+        settings.CACHE_LOCK_TTL_SECONDS,
+    )
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import UTC, datetime
+from contextlib import suppress
+
+from psutil import disk_usage, cpu_percent, virtual_memory
+
+from app.core import get_settings
+from app.core.cache import CacheBackend, get_cache_backend
+from app.core.logger import logger
+from app.core.mongo_client import MongoClientManager, mongo_client_manager
+
+
+class SystemMetricsSampler:
+    """SystemMetricsSampler
+
+    Background task that refreshes the CPU, memory, disk, database and cache ping figures every
+    ``HEALTH_SAMPLER_INTERVAL_SECONDS``. Healthchecks only read the last snapshot, so a probe never waits on
+    ``psutil`` or on a database round trip.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float | None = None,
+        client_manager: MongoClientManager = mongo_client_manager,
+        cache_backend: CacheBackend | None = None,
+    ) -> None:
+        """__init__ _summary_
+
+        :param interval_seconds: Seconds between samples, defaults to ``HEALTH_SAMPLER_INTERVAL_SECONDS``
+        :type interval_seconds: float | None
+        :param client_manager: Shared MongoDB client used for the ping
+        :type client_manager: MongoClientManager
+        :param cache_backend: Cache to ping, defaults to the one returned by ``get_cache_backend``
+        :type cache_backend: CacheBackend | None
+        """
+        self._interval_seconds = interval_seconds
+        self._client_manager = client_manager
+        self._cache_backend = cache_backend
+        self._task: asyncio.Task | None = None
+        self._snapshot: dict[str, str | float | None] = {
+            "cpu_usage": None,
+            "memory_usage": None,
+            "disk_usage": None,
+            "database_connection": "Not sampled yet",
+            "cache_connection": "Not sampled yet",
+            "sampled_at": None,
+        }
+
+    @property
+    def interval_seconds(self) -> float:
+        """interval_seconds Seconds between two samples."""
+        return self._interval_seconds or get_settings().HEALTH_SAMPLER_INTERVAL_SECONDS
+
+    @property
+    def is_running(self) -> bool:
+        """is_running Whether the background task is alive."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def snapshot(self) -> dict[str, str | float | None]:
+        """Last sampled figures, never touches the system or the database."""
+        return dict(self._snapshot)
+
+    async def refresh(self) -> dict[str, str | float | None]:
+        """Take a new sample and store it as the current snapshot.
+
+        :return: The new snapshot
+        :rtype: dict[str, str | float | None]
+        """
+        database_connection, cache_connection = await asyncio.gather(
+            self._client_manager.ping(),
+            (self._cache_backend or get_cache_backend()).ping(),
+        )
+        self._snapshot = {
+            # interval=None compares against the previous call, so it returns immediately
+            "cpu_usage": cpu_percent(interval=None),
+            "memory_usage": virtual_memory().percent,
+            "disk_usage": disk_usage("/").percent,
+            "database_connection": database_connection,
+            "cache_connection": cache_connection,
+            "sampled_at": datetime.now(tz=UTC).isoformat(),
+        }
+        return self.snapshot
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as error:  # noqa: BLE001
+                logger.error(f"System metrics sampling failed: {error}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Launch the background task, calling it twice is a no-op."""
+        if self.is_running:
+            return
+        # The first cpu_percent(interval=None) call only primes psutil and always reports 0.0
+        cpu_percent(interval=None)
+        self._task = asyncio.create_task(self._run(), name="system-metrics-sampler")
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+system_metrics_sampler = SystemMetricsSampler()
@@ -0,0 +1,239 @@
+import asyncio
+from time import monotonic
+from threading import Lock
+from contextlib import suppress
+
+from pymongo import monitoring
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from app.core import settings, get_settings
+from app.core.logger import logger
+from app.core.query_monitoring import SlowQueryListener
+
+
+class ConnectionPoolStatsListener(monitoring.ConnectionPoolListener):
+    """ConnectionPoolStatsListener
+
+    Keeps running counters of the driver connection pool events, so the pool usage can be reported
+    without touching the database. Callbacks are fired from the driver threads, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        """__init__ Start every counter at zero."""
+        self._lock = Lock()
+        self.open_connections = 0
+        self.checked_out_connections = 0
+        self.total_created = 0
+        self.total_closed = 0
+        self.total_checked_out = 0
+        self.total_check_out_failures = 0
+        self.pool_clears = 0
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:  # noqa: D102
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:  # noqa: D102
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:  # noqa: D102, ARG002
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:  # noqa: D102
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:  # noqa: D102, ARG002
+        with self._lock:
+            self.open_connections += 1
+            self.total_created += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:  # noqa: D102
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:  # noqa: D102, ARG002
+        with self._lock:
+            self.open_connections = max(self.open_connections - 1, 0)
+            self.total_closed += 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:  # noqa: D102
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:  # noqa: D102, ARG002
+        with self._lock:
+            self.total_check_out_failures += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:  # noqa: D102, ARG002
+        with self._lock:
+            self.checked_out_connections += 1
+            self.total_checked_out += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:  # noqa: D102, ARG002
+        with self._lock:
+            self.checked_out_connections = max(self.checked_out_connections - 1, 0)
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of the pool counters.
+
+        :return: Pool counters aggregated over every server the client talks to
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return {
+                "open_connections": self.open_connections,
+                "checked_out_connections": self.checked_out_connections,
+                "total_created": self.total_created,
+                "total_closed": self.total_closed,
+                "total_checked_out": self.total_checked_out,
+                "total_check_out_failures": self.total_check_out_failures,
+                "pool_clears": self.pool_clears,
+            }
+
+
+class MongoClientManager:
+    """MongoClientManager
+
+    Owns the single process-wide ``AsyncIOMotorClient``. The client is created once (on ``connect``, called
+    from the app lifespan) and shared by Beanie, the healthchecks and every other consumer, so all of them
+    reuse the same connection pool instead of opening a new one on each access.
+    """
+
+    def __init__(self, app_settings: settings.Settings | None = None) -> None:
+        """__init__ _summary_
+
+        :param app_settings: Settings to build the client from, defaults to the cached app settings
+        :type app_settings: settings.Settings | None
+        """
+        self._settings = app_settings
+        self._client: AsyncIOMotorClient | None = None
+        self._last_ping: tuple[str, float] | None = None
+        self._ping_lock = asyncio.Lock()
+        self.pool_listener = ConnectionPoolStatsListener()
+        self.query_listener = SlowQueryListener(
+            threshold_ms=self.settings.MONGO_SLOW_QUERY_THRESHOLD_MS,
+            max_shapes=self.settings.MONGO_QUERY_SHAPES_MAX,
+            explain=self.settings.MONGO_SLOW_QUERY_EXPLAIN,
+        )
+
+    @property
+    def settings(self) -> settings.Settings:
+        """Settings used to configure the client."""
+        return self._settings or get_settings()
+
+    @property
+    def client(self) -> AsyncIOMotorClient | None:
+        """Shared client, ``None`` until ``connect`` has been called."""
+        return self._client
+
+    @property
+    def is_connected(self) -> bool:
+        """is_connected Whether the shared client has been created."""
+        return self._client is not None
+
+    def build_client_options(self) -> dict:
+        """build_client_options Driver keyword arguments derived from the settings.
+
+        :return: Keyword arguments for ``AsyncIOMotorClient``
+        :rtype: dict
+        """
+        options = {
+            "uuidRepresentation": "standard",
+            "maxPoolSize": self.settings.MONGO_MAX_POOL_SIZE,
+            "minPoolSize": self.settings.MONGO_MIN_POOL_SIZE,
+            "serverSelectionTimeoutMS": self.settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            "connectTimeoutMS": self.settings.MONGO_CONNECT_TIMEOUT_MS,
+            "event_listeners": [self.pool_listener, self.query_listener],
+        }
+        if self.settings.MONGO_MAX_IDLE_TIME_MS is not None:
+            options["maxIdleTimeMS"] = self.settings.MONGO_MAX_IDLE_TIME_MS
+        if self.settings.MONGO_WAIT_QUEUE_TIMEOUT_MS is not None:
+            options["waitQueueTimeoutMS"] = self.settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
+        if self.settings.mongo_compressors_list:
+            options["compressors"] = self.settings.mongo_compressors_list
+        return options
+
+    def connect(self) -> AsyncIOMotorClient | None:
+        """Create the shared client if it does not exist yet and return it.
+
+        :return: The shared client, or ``None`` when the configured database is not MongoDB
+        :rtype: AsyncIOMotorClient | None
+        """
+        if self._client is None and self.settings.DB_TYPE == "mongodb":
+            logger.info("Creating shared MongoDB client")
+            self._client = AsyncIOMotorClient(self.settings.DATABASE_URL, **self.build_client_options())
+            with suppress(RuntimeError):
+                self.query_listener.attach(asyncio.get_running_loop(), self.get_database)
+        return self._client
+
+    def get_database(self) -> AsyncIOMotorDatabase | None:
+        """get_database Application database on the shared client.
+
+        :return: The configured database, or ``None`` when there is no MongoDB client
+        :rtype: AsyncIOMotorDatabase | None
+        """
+        db_client = self.connect()
+        if db_client is None:
+            return None
+        return db_client[self.settings.MONGO_DATABASE_NAME]
+
+    async def ping(self) -> str:
+        """Send a ``ping`` command through the shared client.
+
+        :return: ``Up``, ``Down``, ``Not reachable`` or ``Not Connected``
+        :rtype: str
+        """
+        database = self.get_database()
+        if database is None:
+            return "Not Connected"
+
+        try:
+            pong = await database.command("ping")
+            result = "Up" if pong["ok"] == 1 else "Down"
+        except Exception as error:  # noqa: BLE001
+            logger.error(f"Error pinging database: {error}")
+            result = "Not reachable"
+
+        self._last_ping = (result, monotonic())
+        return result
+
+    async def cached_ping(self, max_age_seconds: float) -> str:
+        """cached_ping Last ping result if it is younger than ``max_age_seconds``, otherwise a fresh ping.
+
+        Concurrent callers share the same in-flight ping instead of each one sending its own.
+
+        :param max_age_seconds: Maximum age of a reusable ping result
+        :type max_age_seconds: float
+        :return: Same values as ``ping``
+        :rtype: str
+        """
+        async with self._ping_lock:
+            if self._last_ping is not None and monotonic() - self._last_ping[1] <= max_age_seconds:
+                return self._last_ping[0]
+            return await self.ping()
+
+    def is_pool_exhausted(self) -> bool:
+        """is_pool_exhausted Whether every connection allowed by ``MONGO_MAX_POOL_SIZE`` is checked out."""
+        max_pool_size = self.settings.MONGO_MAX_POOL_SIZE
+        return max_pool_size > 0 and self.pool_listener.checked_out_connections >= max_pool_size
+
+    def pool_stats(self) -> dict[str, int | bool | None]:
+        """pool_stats Connection pool usage of the shared client.
+
+        :return: Pool counters plus the configured pool bounds
+        :rtype: dict[str, int | bool | None]
+        """
+        return {
+            "connected": self.is_connected,
+            "max_pool_size": self.settings.MONGO_MAX_POOL_SIZE,
+            "min_pool_size": self.settings.MONGO_MIN_POOL_SIZE,
+            **self.pool_listener.stats(),
+        }
+
+    def close(self) -> None:
+        """Close the shared client, the next ``connect`` call creates a fresh one."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self._last_ping = None
+
+
+mongo_client_manager = MongoClientManager()
@@ -0,0 +1,241 @@
+import json
+import asyncio
+import logging
+from threading import Lock
+from collections import OrderedDict
+from collections.abc import Callable
+
+from pymongo import monitoring
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.logger import logger
+
+# Fields of each command that define the shape of the query, the other commands are not tracked
+SHAPE_FIELDS = {
+    "find": ("filter", "sort", "projection"),
+    "aggregate": ("pipeline",),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+    "findAndModify": ("query", "sort", "update"),
+    "update": ("updates",),
+    "delete": ("deletes",),
+}
+
+# Keys added by the driver that must not be sent back inside an ``explain``
+DRIVER_COMMAND_KEYS = ("lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern")
+
+
+def normalize_query_shape(value: object) -> object:
+    """normalize_query_shape Replace every literal of a query with ``?`` while keeping its structure.
+
+    :param value: Query, pipeline or any part of them
+    :type value: object
+    :return: Same structure with ``?`` in place of the values
+    :rtype: object
+    """
+    if isinstance(value, dict):
+        return {key: normalize_query_shape(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        if all(not isinstance(item, dict | list | tuple) for item in value):
+            return ["?"]
+        return [normalize_query_shape(item) for item in value]
+    return "?"
+
+
+def _find_key(document: object, key: str) -> object:
+    if isinstance(document, dict):
+        if key in document:
+            return document[key]
+        values = document.values()
+    elif isinstance(document, list):
+        values = document
+    else:
+        return None
+
+    for value in values:
+        found = _find_key(value, key)
+        if found is not None:
+            return found
+    return None
+
+
+def _plan_stages(plan: object) -> list[str]:
+    if isinstance(plan, dict):
+        stages = [plan["stage"]] if "stage" in plan else []
+        for key in ("inputStage", "queryPlan"):
+            stages += _plan_stages(plan.get(key))
+        for input_stage in plan.get("inputStages", []):
+            stages += _plan_stages(input_stage)
+        return stages
+    return []
+
+
+def summarize_explain(explain_result: dict) -> dict:
+    """summarize_explain Relevant figures of an ``explain`` output, for ``find`` and ``aggregate`` alike.
+
+    :param explain_result: Output of the ``explain`` command with the ``executionStats`` verbosity
+    :type explain_result: dict
+    :return: Winning plan stages, whether a collection scan happened and documents examined vs returned
+    :rtype: dict
+    """
+    stages = _plan_stages(_find_key(explain_result, "winningPlan"))
+    execution_stats = _find_key(explain_result, "executionStats") or {}
+    return {
+        "stages": stages,
+        "collection_scan": "COLLSCAN" in stages,
+        "docs_examined": execution_stats.get("totalDocsExamined"),
+        "keys_examined": execution_stats.get("totalKeysExamined"),
+        "docs_returned": execution_stats.get("nReturned"),
+    }
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    """SlowQueryListener
+
+    Records the duration of every query command sent through the shared client, aggregated by command,
+    collection and normalized query shape. Commands slower than ``threshold_ms`` are logged and, when the
+    logger runs in DEBUG, explained so their plan summary is logged and kept along with the shape.
+    """
+
+    def __init__(self, threshold_ms: float, max_shapes: int = 500, *, explain: bool = True) -> None:
+        """__init__ _summary_
+
+        :param threshold_ms: Duration from which a command is considered slow
+        :type threshold_ms: float
+        :param max_shapes: Maximum number of shapes kept, the least recently seen ones are dropped first
+        :type max_shapes: int
+        :param explain: Whether slow commands are explained when the logger runs in DEBUG
+        :type explain: bool
+        """
+        self.threshold_ms = threshold_ms
+        self.max_shapes = max_shapes
+        self.explain = explain
+        self._lock = Lock()
+        self._pending: dict[tuple, tuple[str, str, str, dict]] = {}
+        self._shapes: OrderedDict[tuple[str, str, str], dict] = OrderedDict()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._database_getter: Callable[[], AsyncIOMotorDatabase | None] | None = None
+
+    def attach(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        database_getter: Callable[[], AsyncIOMotorDatabase | None],
+    ) -> None:
+        """Event loop and database used to run the ``explain`` of slow commands.
+
+        :param loop: Loop the application runs on
+        :type loop: asyncio.AbstractEventLoop
+        :param database_getter: Returns the database the explains are sent to
+        :type database_getter: Callable[[], AsyncIOMotorDatabase | None]
+        """
+        self._loop = loop
+        self._database_getter = database_getter
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:  # noqa: D102
+        shape_fields = SHAPE_FIELDS.get(event.command_name)
+        if shape_fields is None:
+            return
+
+        shape = {field: normalize_query_shape(event.command[field]) for field in shape_fields if field in event.command}
+        command = {
+            key: value
+            for key, value in event.command.items()
+            if key not in DRIVER_COMMAND_KEYS and not key.startswith("$")
+        }
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (
+                event.command_name,
+                str(event.command.get(event.command_name)),
+                json.dumps(shape, default=str),
+                command,
+            )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:  # noqa: D102
+        self._record(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:  # noqa: D102
+        self._record(event)
+
+    def _record(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent) -> None:
+        with self._lock:
+            pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+
+        command_name, collection, shape, command = pending
+        duration_ms = event.duration_micros / 1000
+        is_slow = duration_ms >= self.threshold_ms
+        key = (command_name, collection, shape)
+
+        with self._lock:
+            stats = self._shapes.pop(key, None) or {
+                "command": command_name,
+                "collection": collection,
+                "shape": shape,
+                "count": 0,
+                "slow_count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "plan": None,
+            }
+            stats["count"] += 1
+            stats["slow_count"] += int(is_slow)
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            self._shapes[key] = stats
+            while len(self._shapes) > self.max_shapes:
+                self._shapes.popitem(last=False)
+
+        if is_slow:
+            msg = f"Slow MongoDB {command_name} on '{collection}' took {duration_ms:.1f}ms, shape: {shape}"
+            logger.warning(msg)
+            self._schedule_explain(key, command)
+
+    def _schedule_explain(self, key: tuple[str, str, str], command: dict) -> None:
+        if not self.explain or not logger.isEnabledFor(logging.DEBUG):
+            return
+        if self._loop is None or self._loop.is_closed() or self._database_getter is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._explain(key, command), self._loop)
+
+    async def _explain(self, key: tuple[str, str, str], command: dict) -> None:
+        database = self._database_getter()
+        if database is None:
+            return
+
+        try:
+            explain_result = await database.command({"explain": command, "verbosity": "executionStats"})
+        except Exception as error:  # noqa: BLE001
+            msg = f"Failed to explain slow {key[0]} on '{key[1]}': {error}"
+            logger.debug(msg)
+            return
+
+        plan = summarize_explain(explain_result)
+        with self._lock:
+            if key in self._shapes:
+                self._shapes[key]["plan"] = plan
+        msg = f"Plan of slow {key[0]} on '{key[1]}' with shape {key[2]}: {plan}"
+        logger.debug(msg)
+
+    def top_slow_shapes(self, limit: int = 10) -> list[dict]:
+        """top_slow_shapes Shapes with the most slow executions, the slowest first on ties.
+
+        :param limit: Maximum number of shapes returned
+        :type limit: int
+        :return: Aggregated stats of each shape, with its last explained plan if any
+        :rtype: list[dict]
+        """
+        with self._lock:
+            shapes = [
+                {**stats, "avg_ms": round(stats["total_ms"] / stats["count"], 3)}
+                for stats in self._shapes.values()
+                if stats["slow_count"]
+            ]
+        shapes.sort(key=lambda stats: (stats["slow_count"], stats["max_ms"]), reverse=True)
+        return shapes[:limit]
+
+    def reset(self) -> None:
+        """Forget every recorded shape."""
+        with self._lock:
+            self._shapes.clear()
@@ -1,4 +1,9 @@
+import asyncio
+from time import perf_counter
+from typing import TypeVar
 from datetime import UTC, datetime, timedelta
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -7,6 +12,120 @@ from app.core import get_settings
 
 password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(RuntimeError):
+    """PasswordHashingBusyError
+
+    Raised when the password hashing queue is full, the request should be answered with a 503 right away.
+    """
+
+
+class PasswordHashingExecutor:
+    """PasswordHashingExecutor
+
+    Runs bcrypt hashing and verification on a dedicated thread pool (bcrypt releases the GIL while hashing),
+    so the event loop keeps serving other requests. The amount of in-flight work is bounded by
+    ``PASSWORD_HASHING_WORKERS + PASSWORD_HASHING_MAX_QUEUE``, extra submissions are rejected.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_queue: int | None = None) -> None:
+        """__init__ _summary_
+
+        :param max_workers: Threads of the pool, defaults to ``PASSWORD_HASHING_WORKERS``
+        :type max_workers: int | None
+        :param max_queue: Jobs allowed to wait for a thread, defaults to ``PASSWORD_HASHING_MAX_QUEUE``
+        :type max_queue: int | None
+        """
+        self.max_workers = max_workers or get_settings().PASSWORD_HASHING_WORKERS
+        self.max_queue = max_queue if max_queue is not None else get_settings().PASSWORD_HASHING_MAX_QUEUE
+        self._executor: ThreadPoolExecutor | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_completed = 0
+        self.total_rejected = 0
+        self.total_queue_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hashing")
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """queue_depth Jobs currently waiting for a free thread."""
+        return max(self.in_flight - self.max_workers, 0)
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        """Execute ``func(*args)`` on the hashing pool.
+
+        :param func: Blocking hashing function
+        :type func: Callable[..., T]
+        :raises PasswordHashingBusyError: When the queue is already full
+        :return: Result of ``func``
+        :rtype: T
+        """
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.total_rejected += 1
+            raise PasswordHashingBusyError("Password hashing queue is full, try again later")
+
+        def timed_call() -> tuple[T, float, float]:
+            started_at = perf_counter()
+            result = func(*args)
+            return result, started_at, perf_counter()
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        submitted_at = perf_counter()
+        try:
+            result, started_at, finished_at = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                timed_call,
+            )
+        finally:
+            self.in_flight -= 1
+
+        queue_wait = started_at - submitted_at
+        self.total_completed += 1
+        self.total_queue_wait_seconds += queue_wait
+        self.total_run_seconds += finished_at - started_at
+        self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+        return result
+
+    def stats(self) -> dict[str, int | float]:
+        """Queue depth and latency figures of the hashing pool.
+
+        :return: Hashing pool metrics, latencies in milliseconds
+        :rtype: dict[str, int | float]
+        """
+        completed = self.total_completed or 1
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_in_flight": self.max_in_flight,
+            "total_completed": self.total_completed,
+            "total_rejected": self.total_rejected,
+            "avg_queue_wait_ms": round(self.total_queue_wait_seconds / completed * 1000, 3),
+            "max_queue_wait_ms": round(self.max_queue_wait_seconds * 1000, 3),
+            "avg_run_ms": round(self.total_run_seconds / completed * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the thread pool, a later submission creates a new one."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hashing_executor = PasswordHashingExecutor()
+
 
 def create_access_token(subject: str, expires_delta: int | None = None) -> str:
     if expires_delta is not None:
@@ -50,3 +169,11 @@ def get_password(password: str) -> str:
 
 def verify_password(password: str, hashed_pass: str) -> bool:
     return password_context.verify(password, hashed_pass)
+
+
+async def get_password_async(password: str) -> str:
+    return await password_hashing_executor.run(get_password, password)
+
+
+async def verify_password_async(password: str, hashed_pass: str) -> bool:
+    return await password_hashing_executor.run(verify_password, password, hashed_pass)
@@ -1,9 +1,7 @@
 from typing import Literal
 
-from psutil import disk_usage, cpu_percent, virtual_memory
 from pydantic import Field, AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app import __version__
 
@@ -40,12 +38,73 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # MongoDB Client and Connection Pool Configuration
+    MONGO_DATABASE_NAME: str = Field("quick_td_db")
+    MONGO_MAX_POOL_SIZE: int = Field(100)
+    MONGO_MIN_POOL_SIZE: int = Field(0)
+    MONGO_MAX_IDLE_TIME_MS: int | None = Field(None)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int | None = Field(None)
+    MONGO_COMPRESSORS: str = Field("")  # Comma separated, e.g. "zstd,snappy,zlib"
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(30000)
+    MONGO_CONNECT_TIMEOUT_MS: int = Field(20000)
+
+    # Slow query monitoring, slow commands are explained only when LOGGER_LEVEL is DEBUG
+    MONGO_SLOW_QUERY_THRESHOLD_MS: float = Field(100)
+    MONGO_SLOW_QUERY_EXPLAIN: bool = Field(True)  # noqa: FBT003
+    MONGO_QUERY_SHAPES_MAX: int = Field(500)
+
+    # Operational routes under /admin, any authenticated user can read them once enabled
+    ADMIN_ENDPOINTS_ENABLED: bool = Field(False)  # noqa: FBT003
+
+    # Password hashing pool, extra requests beyond workers + queue are rejected with a 503
+    PASSWORD_HASHING_WORKERS: int = Field(4)
+    PASSWORD_HASHING_MAX_QUEUE: int = Field(64)
+
+    # Shared cache backend, "memory" keeps the entries in each worker while "redis" shares them through CACHE_REDIS_URL
+    # and requires the redis package. It holds the task list pages, the task totals and the import reports
+    CACHE_BACKEND: Literal["memory", "redis"] = Field("memory")
+    CACHE_REDIS_URL: str = Field("redis://localhost:6379/0")
+    CACHE_NAMESPACE: str = Field("quick_td")
+    CACHE_MAX_SIZE: int = Field(10000)
+    CACHE_LOCK_TTL_SECONDS: float = Field(10)
+
+    # Authenticated users cache, USER_CACHE_MAX_SIZE=0 disables it
+    USER_CACHE_MAX_SIZE: int = Field(10000)
+    USER_CACHE_TTL_SECONDS: float = Field(60)
+
+    # Compiled filter templates, one per combination of filtered fields, operators and logical operator
+    FILTER_TEMPLATE_CACHE_MAX_SIZE: int = Field(256)
+
+    # Task list totals kept in the cache backend by filter, outdated for every worker by each task write
+    TASK_COUNT_CACHE_ENABLED: bool = Field(True)  # noqa: FBT003
+    TASK_COUNT_CACHE_TTL_SECONDS: float = Field(5)
+
+    # Serialized task list pages kept in the cache backend, outdated for every worker by each task write. A positive
+    # TASK_LIST_CACHE_STALE_TIMEOUT_SECONDS serves outdated pages when rendering a fresh one takes longer than that
+    TASK_LIST_CACHE_ENABLED: bool = Field(True)  # noqa: FBT003
+    TASK_LIST_CACHE_TTL_SECONDS: float = Field(30)
+    TASK_LIST_CACHE_STALE_TTL_SECONDS: float = Field(300)
+    TASK_LIST_CACHE_STALE_TIMEOUT_SECONDS: float = Field(0)
+
+    # Maximum number of tasks accepted by the bulk endpoints in a single request
+    TASK_BULK_MAX_ITEMS: int = Field(1000)
+
+    # Tasks read per round trip by the exports
+    TASK_EXPORT_BATCH_SIZE: int = Field(1000)
+
+    # Task imports, rows are written by batches and only the first errors are kept in the report
+    TASK_IMPORT_BATCH_SIZE: int = Field(1000)
+    TASK_IMPORT_MAX_REPORTED_ERRORS: int = Field(10000)
+    TASK_IMPORT_REPORT_TTL_SECONDS: float = Field(3600)
+
     MAINTAINERS_EMAILS: str = Field("luisangelmarcia@gmail.com")
 
     # Timeouts and intervals of delays
     DEFAULT_TIMEOUT: int = Field(300)
     SHORT_INTERVAL: int = Field(36)
     LONG_INTERVAL: int = Field(72)
+    HEALTH_SAMPLER_INTERVAL_SECONDS: float = Field(15)
+    HEALTH_DB_PING_CACHE_SECONDS: float = Field(5)
 
     # Logger Settings
     LOGGER_LEVEL: str = Field("INFO")
@@ -79,66 +138,12 @@ class Settings(BaseSettings):
 
         return env_variables_str
 
-    @property
-    def get_db_client(self) -> AsyncIOMotorClient | None:
-        """get_db_client _summary_
-
-        _extended_summary_
-
-        :return: _description_
-        :rtype: _type_
-        """
-        db_client = None
-        if self.DB_TYPE == "mongodb":
-            db_client = AsyncIOMotorClient(self.DATABASE_URL, uuidRepresentation="standard")
-
-        elif self.DB_TYPE == "sqlite":
-            # SQLite initialization logic can be added here if needed | TODO: <CosmicTiger>: Pending implementation
-            db_client = None
-        return db_client
-
-    @property
-    def get_database(self) -> AsyncIOMotorDatabase | None:
-        """get_database _summary_
-
-        _extended_summary_
-
-        :return: _description_
-        :rtype: _type_
-        """
-        db_client = self.get_db_client
-        if db_client and self.DB_TYPE == "mongodb":
-            return db_client.get_default_database()
-        return None
-
-    @property
-    async def get_ping_pong_db(self) -> bool:
-        """get_ping_pong_db _summary_
-
-        _extended_summary_
-
-        :return: _description_
-        :rtype: bool
-        """
-        database = self.get_database
-        if database is not None and self.DB_TYPE == "mongodb":
-            try:
-                pong = await database.command("ping")
-
-                if pong["ok"] == 1:
-                    return "Up"
-
-                return "Down"
-            except Exception as error:  # noqa: BLE001
-                print(f"Error pinging database: {error}")
-                return "Not reachable"
-        return "Not Connected"
-
     @property
     def get_health_status(self) -> dict[str, dict[str, str | None] | str | float]:
         """get_health_status _summary_
 
-        _extended_summary_
+        Static service information, the CPU/memory/disk/database figures are sampled in the background by
+        ``app.core.health.SystemMetricsSampler``.
 
         :return: _description_
         :rtype: dict[str, dict[str, str | None] | str | float]
@@ -147,13 +152,21 @@ class Settings(BaseSettings):
             "version": self.API_VERSION,
             "service": "up",
             "environment": self.ENV,
-            "cache": "NOT IMPLEMENTED",
-            "cpu_usage": cpu_percent(interval=1),
-            "memory_usage": virtual_memory().percent,
-            "disk_usage": disk_usage("/").percent,
+            "cache": self.CACHE_BACKEND,
             "database": self.DB_TYPE,
         }
 
+    @property
+    def mongo_compressors_list(self) -> list[str]:
+        """mongo_compressors_list _summary_
+
+        Wire compressors to negotiate with the MongoDB server, in order of preference.
+
+        :return: Parsed list of compressors, empty when compression is disabled
+        :rtype: list[str]
+        """
+        return [compressor.strip() for compressor in self.MONGO_COMPRESSORS.split(",") if compressor.strip()]
+
     @property
     def emails_maintainers_list(self) -> list[str]:
         """emails_maintainers_list _summary_
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
+from datetime import datetime
+from collections.abc import AsyncIterator
 
 from app.domain.entities.task import Task
 from app.domain.entities.user import User
@@ -29,6 +31,29 @@ class ITaskRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def create_tasks(
+        self,
+        current_user: User,
+        tasks_data: list[TaskCreate],
+        known_user_ids: set[UUID] | None = None,
+    ) -> dict:
+        """create_tasks _summary_
+
+        Create many tasks at once, reporting the outcome of each one.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param tasks_data: _description_
+        :type tasks_data: list[TaskCreate]
+        :param known_user_ids: IDs of users known to exist, completed with the ones found
+        :type known_user_ids: set[UUID] | None
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: dict
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_task_by_id(self, task_id: UUID) -> Task:
         """get_task_by_id _summary_
@@ -58,14 +83,91 @@ class ITaskRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_tasks(self, task_filters: dict, task_sorts: dict, page: int, offset: int) -> list[Task]:
+    def get_tasks_by_ids(self, task_ids: list[UUID]) -> tuple[list[Task], list[UUID]]:
+        """get_tasks_by_ids _summary_
+
+        Read many tasks at once, keeping the order of the IDs.
+
+        :param task_ids: _description_
+        :type task_ids: list[UUID]
+        :raises NotImplementedError: _description_
+        :return: Found tasks and the IDs that do not exist
+        :rtype: tuple[list[Task], list[UUID]]
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_tasks(
+        self,
+        task_filters: dict,
+        task_sorts: dict,
+        page: int,
+        offset: int,
+        cursor: str | None = None,
+    ) -> tuple[list[Task], str | None]:
         """list_tasks _summary_
 
-        _extended_summary_
+        Page of tasks along with the opaque cursor pointing after its last task, ``None`` when there is no next page.
+
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: tuple[list[Task], str | None]
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iterate_tasks(self, task_filters: dict | None) -> AsyncIterator[dict]:
+        """iterate_tasks _summary_
+
+        Every task matching the filters, without loading them all in memory.
+
+        :param task_filters: _description_
+        :type task_filters: dict | None
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: AsyncIterator[dict]
+        """
+        raise NotImplementedError
 
+    @abstractmethod
+    def count_tasks(self, task_filters: dict | None) -> int:
+        """count_tasks _summary_
+
+        Total number of tasks matching the filters, regardless of the page.
+
+        :param task_filters: _description_
+        :type task_filters: dict | None
         :raises NotImplementedError: _description_
         :return: _description_
-        :rtype: list[Task]
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_task_version(self, task_id: str) -> datetime | None:
+        """get_task_version _summary_
+
+        Last modification date of a task, without reading the task itself.
+
+        :param task_id: _description_
+        :type task_id: str
+        :raises NotImplementedError: _description_
+        :return: ``None`` when the task does not exist
+        :rtype: datetime | None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_tasks_last_modified(self, task_filters: dict | None) -> datetime | None:
+        """get_tasks_last_modified _summary_
+
+        Latest modification date among the tasks matching the filters, without reading the tasks themselves.
+
+        :param task_filters: _description_
+        :type task_filters: dict | None
+        :raises NotImplementedError: _description_
+        :return: ``None`` when no task matches
+        :rtype: datetime | None
         """
         raise NotImplementedError
 
@@ -87,6 +189,40 @@ class ITaskRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def update_tasks(self, current_user: User, task_filters: dict, task_data_to_update: dict) -> dict:
+        """update_tasks _summary_
+
+        Apply the same update to every task matching the filters.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param task_filters: _description_
+        :type task_filters: dict
+        :param task_data_to_update: _description_
+        :type task_data_to_update: dict
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def archive_task(self, current_user: User, task_id: UUID) -> Task:
+        """archive_task _summary_
+
+        Toggle the archived status of the task.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param task_id: _description_
+        :type task_id: UUID
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: Task
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete_task(self, user_id: UUID, task_id: UUID) -> Task:
         """delete_task _summary_
@@ -102,3 +238,17 @@ class ITaskRepository(ABC):
         :rtype: Task
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def delete_tasks(self, task_filters: dict) -> dict:
+        """delete_tasks _summary_
+
+        Delete every task matching the filters.
+
+        :param task_filters: _description_
+        :type task_filters: dict
+        :raises NotImplementedError: _description_
+        :return: _description_
+        :rtype: dict
+        """
+        raise NotImplementedError
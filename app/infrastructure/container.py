@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from collections.abc import Callable
+
+from app.core import get_settings
+from app.core.logger import logger
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+from app.domain.datasource.task_datasource import ITaskDatasource
+from app.domain.datasource.user_datasource import IUserDatasource
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource
+from app.infrastructure.datasource.beanie_user_datasource import BeanieUserDatasource
+from app.infrastructure.repositories.task_repository_impl import TaskRepositoryImpl
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+@dataclass(frozen=True)
+class DatasourceFactories:
+    """DatasourceFactories
+
+    Builders of the datasources backing the repositories for a given ``DB_TYPE``.
+    """
+
+    task_datasource: Callable[[], ITaskDatasource]
+    user_datasource: Callable[[], IUserDatasource]
+
+
+DEFAULT_DB_TYPE = "mongodb"
+
+DATASOURCE_FACTORIES: dict[str, DatasourceFactories] = {
+    "mongodb": DatasourceFactories(task_datasource=BeanieTaskDatasource, user_datasource=BeanieUserDatasource),
+}
+
+
+def register_datasources(db_type: str, factories: DatasourceFactories) -> None:
+    """register_datasources Plug the datasource implementations used when ``DB_TYPE`` is ``db_type``.
+
+    :param db_type: Value of the ``DB_TYPE`` setting
+    :type db_type: str
+    :param factories: Builders of the task and user datasources
+    :type factories: DatasourceFactories
+    """
+    DATASOURCE_FACTORIES[db_type] = factories
+
+
+class AppContainer:
+    """AppContainer
+
+    Application-scoped owner of one instance of every datasource, repository and service. Route dependencies
+    hand out these instances instead of building the whole chain again on each request. The default repository
+    of a service is only used when the service is instantiated on its own.
+    """
+
+    def __init__(self, db_type: str | None = None) -> None:
+        """__init__ _summary_
+
+        :param db_type: Database flavour to wire, defaults to the ``DB_TYPE`` setting
+        :type db_type: str | None
+        """
+        self.db_type = db_type or get_settings().DB_TYPE
+        factories = DATASOURCE_FACTORIES.get(self.db_type)
+        if factories is None:
+            msg = f"No datasources registered for DB_TYPE={self.db_type}, falling back to {DEFAULT_DB_TYPE}"
+            logger.warning(msg)
+            factories = DATASOURCE_FACTORIES[DEFAULT_DB_TYPE]
+
+        self.task_datasource = factories.task_datasource()
+        self.user_datasource = factories.user_datasource()
+
+        self.task_repository = TaskRepositoryImpl(self.task_datasource)
+        self.user_repository = UserRepositoryImpl(self.user_datasource)
+
+        self.task_service = TaskService(self.task_repository)
+        self.user_service = UserService(self.user_repository)
+
+
+_container: AppContainer | None = None
+
+
+def init_container(db_type: str | None = None) -> AppContainer:
+    """init_container Build the application container, replacing any previous one.
+
+    :param db_type: Database flavour to wire, defaults to the ``DB_TYPE`` setting
+    :type db_type: str | None
+    :return: The new container
+    :rtype: AppContainer
+    """
+    global _container  # noqa: PLW0603
+    _container = AppContainer(db_type)
+    return _container
+
+
+def get_container() -> AppContainer:
+    """get_container Current application container, built on first use when the lifespan did not run.
+
+    :return: The application container
+    :rtype: AppContainer
+    """
+    if _container is None:
+        return init_container()
+    return _container
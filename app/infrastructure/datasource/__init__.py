@@ -2,27 +2,36 @@ from beanie import init_beanie
 
 from app.core import get_settings
 from app.core.logger import logger
+from app.core.mongo_client import mongo_client_manager
+from app.infrastructure.datasource.index_report import report_index_drift
 from app.infrastructure.models.odm.beanie_task_model import BeanieTask
 from app.infrastructure.models.odm.beanie_user_model import BeanieUser
 
 
 async def init_mongo_db_instance() -> None:
     """Initialize MongoDB connection."""
-    db_client = get_settings().get_db_client
+    database = mongo_client_manager.get_database()
 
-    if not db_client:
+    if database is None:
         raise RuntimeError("MongoDB client not initialized.")
 
+    document_models = [BeanieUser, BeanieTask]
     try:
         await init_beanie(
-            database=db_client.quick_td_db,
-            document_models=[BeanieUser, BeanieTask],
+            database=database,
+            document_models=document_models,
         )
     except Exception as e:
         msg = f"Failed to initialize Beanie ODM: {e}"
         logger.error(msg)
         raise RuntimeError(msg) from e
 
+    try:
+        await report_index_drift(document_models)
+    except Exception as e:  # noqa: BLE001
+        msg = f"Failed to compare the declared indexes with the database: {e}"
+        logger.warning(msg)
+
 
 async def init_db() -> None:
     """Initialize the database connection."""
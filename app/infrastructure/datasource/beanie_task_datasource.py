@@ -1,15 +1,50 @@
-import pymongo
-from pymongo.errors import OperationFailure, DuplicateKeyError
-from beanie.operators import Set
+import asyncio
+from uuid import UUID
+from datetime import UTC, datetime
+from collections.abc import AsyncIterator
 
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError, OperationFailure, DuplicateKeyError
+from beanie.odm.utils.encoder import Encoder
+
+from app.core import get_settings
+from app.core.cache import get_cache_backend
 from app.core.logger import logger
 from app.domain.entities.user import User
-from app.services.task_service import TaskUpdate
-from app.schemas.pydantic.task_schemas import TaskRead, TaskCreate
+from app.utils.versioned_cache import VersionedCache, canonical_key
+from app.schemas.pydantic.task_schemas import TaskRead, TaskCreate, TaskUpdate
 from app.domain.datasource.task_datasource import ITaskDatasource
-from app.infrastructure.mappers.task_mapper import to_beanie_task_from_schema_task_create
-from app.infrastructure.models.odm.beanie_task_model import BeanieTask
-from app.infrastructure.datasource.build_filters_datasource import LOGICAL_OPERATOR_MAPPING
+from app.infrastructure.mappers.task_mapper import (
+    to_beanie_task_from_schema_task_create,
+    to_beanie_tasks_from_schema_task_create_many,
+)
+from app.infrastructure.models.odm.beanie_task_model import BeanieTask, BeanieSubTask, SubTaskNotFoundError
+from app.infrastructure.models.odm.beanie_user_model import BeanieUser
+from app.infrastructure.datasource.build_pagination_datasource import (
+    TIE_BREAKER_FIELD,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    with_tie_breaker,
+    build_cursor_query,
+)
+from app.infrastructure.datasource.build_aggregations_datasource import (
+    TASK_READ_PROJECTION,
+    USER_READ_PROJECTION,
+    TASK_USER_LINK_FIELDS,
+    user_reference,
+    build_sort_stage,
+    hydrate_task_users,
+    user_read_document,
+    build_task_list_pipeline,
+)
+
+# Totals of the task listing, keyed by the filter query and outdated by every task write
+task_count_cache = VersionedCache(
+    get_cache_backend().namespaced("task_counts"),
+    ttl_seconds=get_settings().TASK_COUNT_CACHE_TTL_SECONDS,
+    enabled=get_settings().TASK_COUNT_CACHE_ENABLED,
+)
 
 
 class BeanieTaskDatasource(ITaskDatasource):
@@ -28,30 +63,86 @@ class BeanieTaskDatasource(ITaskDatasource):
 
         :param task_data: _description_
         :type task_data: TaskRead
+        :raises SubTaskNotFoundError: When some sub tasks point to a task that does not exist
         :raises OperationFailure: _description_
         :return: _description_
         :rtype: Task
         """
         try:
-            task = await to_beanie_task_from_schema_task_create(task_data, current_user)
+            task, sub_task_summaries = await to_beanie_task_from_schema_task_create(task_data, current_user)
             await task.insert()
-            task.sub_tasks = await task.retrieve_sub_tasks()
-            return task
+            # The created task links its users, they are shaped like ``TaskRead`` from the already loaded ones
+            known_users = [user_read_document(current_user)]
+            if isinstance(task.assigned_to, BeanieUser):
+                known_users.append(user_read_document(task.assigned_to))
+            task_document = {
+                "_id": task.id,
+                **task.model_dump(include=set(TASK_READ_PROJECTION) - {"_id", "sub_tasks", *TASK_USER_LINK_FIELDS}),
+                "created_by": user_reference(current_user.id),
+                "assigned_to": user_reference(task_data.assigned_to),
+                "updated_by": None,
+            }
+            return await self._hydrate_task_document(task_document, known_users, sub_task_summaries)
         except DuplicateKeyError:
             raise ValueError("Task already exists") from DuplicateKeyError
+        except SubTaskNotFoundError:
+            raise
         except Exception as e:
             msg = f"Failed to create task: {e}"
             logger.error(msg)
             raise OperationFailure(msg) from e
 
+    async def create_tasks(
+        self,
+        current_user: User,
+        tasks_data: list[TaskCreate],
+        known_user_ids: set[UUID] | None = None,
+    ) -> dict:
+        """create_tasks _summary_
+
+        Create many tasks with a single unordered ``insert_many``, after resolving the assignees and the sub tasks
+        of the whole batch at once. A failing item does not prevent the others from being created.
+
+        :param current_user: User creating the tasks
+        :type current_user: User
+        :param tasks_data: Tasks to create
+        :type tasks_data: list[TaskCreate]
+        :param known_user_ids: IDs of users known to exist, shared between successive calls to skip their lookup
+        :type known_user_ids: set[UUID] | None
+        :return: Number of created and failed tasks, along with the outcome of each item
+        :rtype: dict
+        """
+        converted_tasks = await to_beanie_tasks_from_schema_task_create_many(tasks_data, current_user, known_user_ids)
+        results = [{"index": index, "id": None, "error": error} for index, (_, error) in enumerate(converted_tasks)]
+        tasks_to_insert = [(index, task) for index, (task, _) in enumerate(converted_tasks) if task is not None]
+
+        write_errors = {}
+        if tasks_to_insert:
+            try:
+                await BeanieTask.insert_many([task for _, task in tasks_to_insert], ordered=False)
+            except BulkWriteError as error:
+                write_errors = {
+                    write_error["index"]: write_error.get("errmsg", "Insertion failed")
+                    for write_error in error.details.get("writeErrors", [])
+                }
+
+        for position, (index, task) in enumerate(tasks_to_insert):
+            if position in write_errors:
+                results[index]["error"] = write_errors[position]
+            else:
+                results[index]["id"] = task.id
+
+        created = sum(result["error"] is None for result in results)
+        return {"created": created, "failed": len(results) - created, "results": results}
+
     async def get_task_by_id(self, task_id) -> TaskRead:
         try:
-            task = await BeanieTask.get(task_id, fetch_links=True)
-            if not task:
+            # Read through the projections of ``get_tasks_by_ids`` rather than fetching the full linked users
+            tasks, _ = await self.get_tasks_by_ids([UUID(str(task_id))])
+            if not tasks:
                 raise ValueError("Task not found")  # noqa: TRY301
 
-            task.sub_tasks = await task.retrieve_sub_tasks()
-            return task
+            return tasks[0]
         except ValueError as e:
             msg = f"Failed to get task by ID: {e}"
             logger.error(msg)
@@ -61,6 +152,44 @@ class BeanieTaskDatasource(ITaskDatasource):
             logger.error(msg)
             raise OperationFailure(msg) from e
 
+    async def get_tasks_by_ids(self, task_ids: list[UUID]) -> tuple[list[TaskRead], list[UUID]]:
+        """get_tasks_by_ids _summary_
+
+        Many tasks read with the listing aggregation restricted to ``task_ids``, so the users they reference are
+        looked up along with them. The sub tasks of every task are then resolved with a single query.
+
+        :param task_ids: IDs of the tasks to read, duplicates are ignored
+        :type task_ids: list[UUID]
+        :return: Found tasks in the order of ``task_ids``, and the IDs that do not exist
+        :rtype: tuple[list[TaskRead], list[UUID]]
+        """
+        unique_ids = list(dict.fromkeys(task_ids))
+        if not unique_ids:
+            return [], []
+
+        pipeline = build_task_list_pipeline(
+            {"_id": {"$in": unique_ids}},
+            {TIE_BREAKER_FIELD: ASCENDING},
+            0,
+            len(unique_ids),
+        )
+        tasks = await BeanieTask.get_motor_collection().aggregate(pipeline).to_list(length=None)
+        sub_task_summaries = await BeanieTask.fetch_sub_task_summaries(
+            [sub_task["id"] for task in tasks for sub_task in task.get("sub_tasks") or []],
+        )
+        tasks_by_id = {}
+        for task in hydrate_task_users(tasks):
+            task["sub_tasks"] = BeanieTask.merge_sub_task_summaries(
+                [BeanieSubTask.model_construct(**sub_task) for sub_task in task.get("sub_tasks") or []],
+                sub_task_summaries,
+            )
+            tasks_by_id[task["id"]] = task
+
+        return (
+            [tasks_by_id[task_id] for task_id in unique_ids if task_id in tasks_by_id],
+            [task_id for task_id in unique_ids if task_id not in tasks_by_id],
+        )
+
     async def find_task_by_name(self, name: str) -> TaskRead:
         task = await BeanieTask.find_one(BeanieTask.name == name)
 
@@ -75,10 +204,14 @@ class BeanieTaskDatasource(ITaskDatasource):
         task_sorts: list[str] | None,
         page: int,
         offset: int,
-    ) -> list[TaskRead]:
+        cursor: str | None = None,
+    ) -> tuple[list[TaskRead], str | None]:
         """list_tasks _summary_
 
-        _extended_summary_
+        Page of tasks projected to the ``TaskRead`` fields, read with a single aggregation looking up the users
+        they reference with only the ``UserRead`` fields. When a ``cursor`` is given the page starts right after
+        it and ``page`` is ignored, so deep pages do not have to skip every previous task. The next cursor is
+        encoded from the stored values of the last task, before its users are looked up.
 
         :param task_filters: _description_
         :type task_filters: dict
@@ -88,99 +221,344 @@ class BeanieTaskDatasource(ITaskDatasource):
         :type page: int
         :param offset: _description_
         :type offset: int
+        :param cursor: Token returned as ``next_cursor`` by the previous page
+        :type cursor: str | None
+        :raises InvalidCursorError: When the cursor is malformed or was issued for another sort
         :raises OperationFailure: _description_
+        :return: Page of tasks and the cursor of the next page, ``None`` when the page was the last one
+        :rtype: tuple[list[TaskRead], str | None]
+        """
+        try:
+            task_filters_to_apply = task_filters or {}
+            sort_stage = with_tie_breaker(build_sort_stage(task_sorts))
+
+            if cursor:
+                cursor_query = build_cursor_query(sort_stage, decode_cursor(sort_stage, cursor))
+                task_filters_to_apply = (
+                    {"$and": [task_filters_to_apply, cursor_query]} if task_filters_to_apply else cursor_query
+                )
+                page = 0
+
+            pipeline = build_task_list_pipeline(task_filters_to_apply, sort_stage, page, offset)
+            tasks = await BeanieTask.get_motor_collection().aggregate(pipeline).to_list(length=None)
+            next_cursor = encode_cursor(sort_stage, tasks[-1]) if tasks and len(tasks) >= offset else None
+            return hydrate_task_users(tasks), next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            msg = f"Failed to list tasks: {e}"
+            logger.error(msg)
+            raise OperationFailure(msg) from e
+
+    async def iterate_tasks(self, task_filters: dict | None) -> AsyncIterator[dict]:
+        """iterate_tasks Every task matching the filters, read through a cursor.
+
+        The cursor reads batches of ``TASK_EXPORT_BATCH_SIZE`` tasks and only one batch is held in memory at a
+        time, the documents are the raw projections of the ``TaskRead`` fields with the users left as references.
+
+        :param task_filters: _description_
+        :type task_filters: dict | None
+        :return: Raw task documents
+        :rtype: AsyncIterator[dict]
+        """
+        cursor = BeanieTask.get_motor_collection().find(
+            task_filters or {},
+            TASK_READ_PROJECTION,
+            batch_size=get_settings().TASK_EXPORT_BATCH_SIZE,
+        )
+        try:
+            async for task_document in cursor:
+                yield task_document
+        finally:
+            await cursor.close()
+
+    async def count_tasks(self, task_filters: dict | None) -> int:
+        """count_tasks _summary_
+
+        Total number of tasks matching the filters. Without filters the collection metadata is used through
+        ``estimated_document_count``, otherwise ``count_documents`` runs. Totals are cached by query until the next
+        task write or for ``TASK_COUNT_CACHE_TTL_SECONDS`` at most.
+
+        :param task_filters: _description_
+        :type task_filters: dict | None
         :raises OperationFailure: _description_
         :return: _description_
-        :rtype: list[TaskRead]
+        :rtype: int
         """
         try:
-            # Apply sorting
-            sorting_to_apply = (
-                [
-                    (BeanieTask.created_at, pymongo.DESCENDING),
-                ]
-                if not task_sorts or len(task_sorts) == 0
-                else task_sorts
-            )
+            task_filters_to_apply = task_filters or {}
 
-            # Filters to apply
-            task_filters_to_apply = (
-                LOGICAL_OPERATOR_MAPPING[task_filters["logical_operator"]](
-                    *task_filters["expression"],
+            async def count() -> bytes:
+                collection = BeanieTask.get_motor_collection()
+                total = (
+                    await collection.count_documents(task_filters_to_apply)
+                    if task_filters_to_apply
+                    else await collection.estimated_document_count()
                 )
-                if task_filters
-                else None
-            )
+                return str(total).encode()
 
-            tasks = (
-                await BeanieTask.find_all(sort=sorting_to_apply, skip=page, limit=offset, fetch_links=True).to_list()
-                if task_filters is None
-                else await BeanieTask.find(
-                    task_filters_to_apply,
-                    sort=sorting_to_apply,
-                    skip=page,
-                    limit=offset,
-                    fetch_links=True,
-                ).to_list()
+            return int(await task_count_cache.get_or_compute(canonical_key(task_filters_to_apply), count))
+        except Exception as e:
+            msg = f"Failed to count tasks: {e}"
+            logger.error(msg)
+            raise OperationFailure(msg) from e
+
+    async def get_task_version(self, task_id: str) -> datetime | None:
+        """get_task_version _summary_
+
+        Last modification date of a task, read through a projection of its timestamps only so conditional reads
+        are answered without resolving its users and sub tasks.
+
+        :param task_id: _description_
+        :type task_id: str
+        :raises OperationFailure: _description_
+        :return: ``updated_at`` of the task, ``created_at`` when it was never updated, ``None`` when it does not exist
+        :rtype: datetime | None
+        """
+        try:
+            task_document = await BeanieTask.get_motor_collection().find_one(
+                {"_id": UUID(str(task_id))},
+                {"_id": 0, "updated_at": 1, "created_at": 1},
             )
-            return tasks
-        except OperationFailure as e:
-            msg = f"Failed to list tasks: {e}"
+        except Exception as e:
+            msg = f"Failed to get task version: {e}"
             logger.error(msg)
             raise OperationFailure(msg) from e
+
+        if task_document is None:
+            return None
+        return task_document.get("updated_at") or task_document.get("created_at")
+
+    async def get_tasks_last_modified(self, task_filters: dict | None) -> datetime | None:
+        """get_tasks_last_modified _summary_
+
+        Latest ``updated_at`` among the tasks matching the filters, read through a projection of that field only
+        and limited to the first task of a descending sort, which the ``updated_at`` index serves.
+
+        :param task_filters: _description_
+        :type task_filters: dict | None
+        :raises OperationFailure: _description_
+        :return: ``None`` when no task matches
+        :rtype: datetime | None
+        """
+        try:
+            task_documents = (
+                await BeanieTask.get_motor_collection()
+                .find(task_filters or {}, {"_id": 0, "updated_at": 1})
+                .sort("updated_at", DESCENDING)
+                .limit(1)
+                .to_list(length=1)
+            )
         except Exception as e:
-            msg = f"Failed to list tasks: {e}"
+            msg = f"Failed to get tasks last modification: {e}"
             logger.error(msg)
             raise OperationFailure(msg) from e
 
+        return task_documents[0].get("updated_at") if task_documents else None
+
+    async def _fetch_users(self, user_ids: list[UUID]) -> list[dict]:
+        unique_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id is not None))
+        if not unique_ids:
+            return []
+
+        cursor = BeanieUser.get_motor_collection().find({"_id": {"$in": unique_ids}}, USER_READ_PROJECTION)
+        return await cursor.to_list(length=None)
+
+    async def _resolve_sub_tasks(self, sub_tasks: list[dict]) -> list[dict]:
+        if not sub_tasks:
+            return []
+
+        summaries = await BeanieTask.fetch_sub_task_summaries([sub_task["id"] for sub_task in sub_tasks])
+        return BeanieTask.merge_sub_task_summaries(
+            [BeanieSubTask.model_construct(**sub_task) for sub_task in sub_tasks],
+            summaries,
+        )
+
+    async def _hydrate_task_document(
+        self,
+        task_document: dict,
+        known_users: list[dict] | None = None,
+        sub_task_summaries: list[dict] | None = None,
+    ) -> dict:
+        """_hydrate_task_document Shape a raw task document like ``TaskRead``.
+
+        Only the users not given in ``known_users`` are read, and the sub tasks are only resolved when their
+        summaries are not given, both lookups running concurrently.
+
+        :param task_document: Raw task document projected to the ``TaskRead`` fields
+        :type task_document: dict
+        :param known_users: Users already loaded, shaped by ``user_read_document``
+        :type known_users: list[dict] | None
+        :param sub_task_summaries: Sub tasks already resolved, as returned by ``validate_sub_tasks``
+        :type sub_task_summaries: list[dict] | None
+        :return: Task shaped like ``TaskRead``
+        :rtype: dict
+        """
+        known_users = known_users or []
+        known_user_ids = {user["_id"] for user in known_users}
+        missing_user_ids = [
+            reference.id
+            for reference in (task_document.get(field) for field in TASK_USER_LINK_FIELDS)
+            if reference is not None and reference.id not in known_user_ids
+        ]
+
+        fetched_users, resolved_sub_tasks = await asyncio.gather(
+            self._fetch_users(missing_user_ids),
+            self._resolve_sub_tasks(task_document.get("sub_tasks") or [])
+            if sub_task_summaries is None
+            else asyncio.sleep(0, result=sub_task_summaries),
+        )
+        task_document["sub_tasks"] = resolved_sub_tasks
+        return hydrate_task_users([task_document], [*known_users, *fetched_users])[0]
+
+    async def _build_set_document(
+        self,
+        current_user: User,
+        task_data: dict | TaskUpdate,
+    ) -> tuple[dict, list[dict] | None]:
+        """_build_set_document Encoded ``$set`` document of an update, stamped with ``updated_by`` and ``updated_at``.
+
+        :param current_user: User applying the update
+        :type current_user: User
+        :param task_data: Fields to update, only the ones set are written
+        :type task_data: dict | TaskUpdate
+        :return: The ``$set`` document and the validated sub tasks when they are part of the update
+        :rtype: tuple[dict, list[dict] | None]
+        """
+        task_data_to_update = (
+            task_data.model_dump(exclude_unset=True) if isinstance(task_data, TaskUpdate) else dict(task_data)
+        )
+
+        sub_task_summaries = None
+        if "sub_tasks" in task_data_to_update:
+            sub_task_summaries = await BeanieTask.validate_sub_tasks(task_data_to_update["sub_tasks"] or [])
+            task_data_to_update["sub_tasks"] = [
+                {"id": sub_task["id"], "relation_type": sub_task["relation_type"]} for sub_task in sub_task_summaries
+            ]
+
+        if "assigned_to" in task_data_to_update:
+            task_data_to_update["assigned_to"] = user_reference(task_data_to_update["assigned_to"])
+
+        set_document = {
+            **Encoder().encode(task_data_to_update),
+            "updated_by": user_reference(current_user.id),
+            "updated_at": datetime.now(tz=UTC),
+        }
+        return set_document, sub_task_summaries
+
     async def update_task(self, current_user: User, task_id: str, task_data: dict | TaskUpdate) -> TaskRead:
         """update_task _summary_
 
-        _extended_summary_
+        Apply the update with a single ``find_one_and_update`` stamping ``updated_by`` and ``updated_at``, the
+        post-image is projected to the ``TaskRead`` fields. The sub tasks are validated with one query when they
+        are part of the update, otherwise they are resolved only if the task has some.
 
         :param task_id: _description_
         :type task_id: str
         :param task_data: _description_
         :type task_data: dict
-        :raises OperationFailure: _description_
+        :raises ValueError: When the task does not exist
+        :raises SubTaskNotFoundError: When some sub tasks point to a task that does not exist
         :return: _description_
         :rtype: _type_
         """
-        task = await self.get_task_by_id(task_id)
-        if not task:
-            raise OperationFailure("Task not found")
-
-        task_data_to_update = (
-            task_data.model_dump(exclude_unset=True) if isinstance(task_data, TaskUpdate) else task_data
+        set_document, sub_task_summaries = await self._build_set_document(current_user, task_data)
+        updated_task = await BeanieTask.get_motor_collection().find_one_and_update(
+            {"_id": UUID(str(task_id))},
+            {"$set": set_document},
+            projection=TASK_READ_PROJECTION,
+            return_document=ReturnDocument.AFTER,
         )
+        if updated_task is None:
+            raise ValueError("Task not found")
 
-        # The only case this happens is if task is being archived
-        if isinstance(task_data, dict) and task_data.get("is_archived_process"):
-            task_data_to_update["is_archived"] = task.is_archived
+        return await self._hydrate_task_document(updated_task, [user_read_document(current_user)], sub_task_summaries)
 
-        task_data_to_update = {
-            **task_data_to_update,
-            "updated_by": current_user,
-        }
+    async def update_tasks(self, current_user: User, task_filters: dict, task_data: dict | TaskUpdate) -> dict:
+        """update_tasks _summary_
 
-        await task.update(Set(task_data_to_update))
-        await task.save()
-        return task
+        Apply the same update to every task matching ``task_filters`` with a single ``update_many``.
+
+        :param current_user: User applying the update
+        :type current_user: User
+        :param task_filters: Query selecting the tasks
+        :type task_filters: dict
+        :param task_data: Fields to update, only the ones set are written
+        :type task_data: dict | TaskUpdate
+        :return: Number of matched and modified tasks
+        :rtype: dict
+        """
+        set_document, _ = await self._build_set_document(current_user, task_data)
+        result = await BeanieTask.get_motor_collection().update_many(task_filters, {"$set": set_document})
+        return {"matched": result.matched_count, "modified": result.modified_count}
+
+    async def archive_task(self, current_user: User, task_id: str) -> TaskRead:
+        """archive_task _summary_
+
+        Toggle ``is_archived`` with a single pipeline update, so the current value is flipped by the server
+        without reading the task first. ``TaskRead`` embeds the users and the sub task summaries, so the write is
+        followed by at most two concurrent reads: the creator and the assignee unless they are the current user,
+        and the sub tasks when the task has some.
+
+        :param current_user: User archiving the task
+        :type current_user: User
+        :param task_id: _description_
+        :type task_id: str
+        :raises ValueError: When the task does not exist
+        :return: The task after the toggle
+        :rtype: TaskRead
+        """
+        archived_task = await BeanieTask.get_motor_collection().find_one_and_update(
+            {"_id": UUID(str(task_id))},
+            [
+                {
+                    "$set": {
+                        "is_archived": {"$not": [{"$ifNull": ["$is_archived", False]}]},
+                        # Inside a pipeline a DBRef would be read as an expression because of its ``$`` keys
+                        "updated_by": {"$literal": user_reference(current_user.id)},
+                        "updated_at": datetime.now(tz=UTC),
+                    },
+                },
+            ],
+            projection=TASK_READ_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+        )
+        if archived_task is None:
+            raise ValueError("Task not found")
+
+        return await self._hydrate_task_document(archived_task, [user_read_document(current_user)])
 
     async def delete_task(self, task_id: str) -> TaskRead:
         """delete_task _summary_
 
-        _extended_summary_
+        Delete the task with a single ``find_one_and_delete`` returning its last state projected to the
+        ``TaskRead`` fields. Its users and sub task summaries are then read concurrently, with one query each and
+        only when the task references some, to shape the returned task like ``TaskRead``.
 
         :param task_id: _description_
         :type task_id: str
-        :raises OperationFailure: _description_
-        :return: _description_
-        :rtype: _type_
+        :raises ValueError: When the task does not exist
+        :return: The deleted task
+        :rtype: TaskRead
         """
-        task = await self.get_task_by_id(task_id)
-        if not task:
-            raise OperationFailure("Task not found")
+        deleted_task = await BeanieTask.get_motor_collection().find_one_and_delete(
+            {"_id": UUID(str(task_id))},
+            projection=TASK_READ_PROJECTION,
+        )
+        if deleted_task is None:
+            raise ValueError("Task not found")
 
-        await task.delete()
-        return task
+        return await self._hydrate_task_document(deleted_task)
+
+    async def delete_tasks(self, task_filters: dict) -> dict:
+        """delete_tasks _summary_
+
+        Delete every task matching ``task_filters`` with a single ``delete_many``.
+
+        :param task_filters: Query selecting the tasks
+        :type task_filters: dict
+        :return: Number of deleted tasks
+        :rtype: dict
+        """
+        result = await BeanieTask.get_motor_collection().delete_many(task_filters)
+        return {"deleted": result.deleted_count}
@@ -1,6 +1,10 @@
+from uuid import UUID
+
+from pymongo import ReturnDocument
 from pymongo.errors import OperationFailure, DuplicateKeyError
 
 from app.core.logger import logger
+from app.core.security import PasswordHashingBusyError
 from app.domain.entities.user import User
 from app.schemas.pydantic.user_schemas import UserCreate
 from app.domain.datasource.user_datasource import IUserDatasource
@@ -32,12 +36,14 @@ class BeanieUserDatasource(IUserDatasource):
         :rtype: User
         """
         try:
-            data_to_user = to_entity_user_from_schema_create_user(data)
+            data_to_user = await to_entity_user_from_schema_create_user(data)
             user = to_beanie_user_from_entity_user(data_to_user)
             await user.save()
             return user
         except DuplicateKeyError:
             raise ValueError("Username already exists") from DuplicateKeyError
+        except PasswordHashingBusyError:
+            raise
         except Exception as e:
             msg = f"Failed to create user: {e}"
             logger.error(msg)
@@ -67,9 +73,23 @@ class BeanieUserDatasource(IUserDatasource):
         return user
 
     async def delete_user(self, user_id: str) -> bool:
-        user = await self.get_user_by_id(user_id)
-        if not user:
+        """delete_user _summary_
+
+        Toggle ``is_active`` with a single pipeline update, the current value is flipped by the server.
+
+        :param user_id: _description_
+        :type user_id: str
+        :raises OperationFailure: When the user does not exist
+        :return: Whether the user is active after the toggle
+        :rtype: bool
+        """
+        user = await BeanieUser.get_motor_collection().find_one_and_update(
+            {"_id": UUID(str(user_id))},
+            [{"$set": {"is_active": {"$not": [{"$ifNull": ["$is_active", True]}]}}}],
+            projection={"_id": 0, "is_active": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if user is None:
             raise OperationFailure("User not found")
 
-        await user.update({"$set": {"is_active": not user.is_active}})
-        return user.is_active
+        return user["is_active"]
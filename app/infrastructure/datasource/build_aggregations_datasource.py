@@ -0,0 +1,154 @@
+from uuid import UUID
+
+import pymongo
+from bson import DBRef
+
+USERS_COLLECTION = "users"
+
+TASK_USER_LINK_FIELDS = ("created_by", "assigned_to", "updated_by")
+
+# Task fields exposed by ``TaskRead``
+TASK_READ_PROJECTION = {
+    "_id": 1,
+    "title": 1,
+    "description": 1,
+    "status": 1,
+    "priority": 1,
+    "is_archived": 1,
+    "sub_tasks": 1,
+    "due_date": 1,
+    "assigned_to": 1,
+    "created_by": 1,
+    "created_at": 1,
+    "updated_by": 1,
+    "updated_at": 1,
+}
+
+# Only the fields exposed by ``UserRead``, password hashes never leave the database
+USER_READ_PROJECTION = {
+    "_id": 1,
+    "username": 1,
+    "email": 1,
+    "first_name": 1,
+    "last_name": 1,
+}
+
+DEFAULT_TASK_SORT = {"created_at": pymongo.DESCENDING}
+
+SORT_DIRECTION_MAPPING = {
+    "+": pymongo.ASCENDING,
+    "-": pymongo.DESCENDING,
+}
+
+
+def user_reference(user_id: UUID | None) -> DBRef | None:
+    """user_reference Value stored in a link field pointing to the user ``user_id``.
+
+    :param user_id: ID of the referenced user
+    :type user_id: UUID | None
+    :return: DBRef to the user, ``None`` when there is no user
+    :rtype: DBRef | None
+    """
+    return DBRef(USERS_COLLECTION, user_id) if user_id is not None else None
+
+
+def user_read_document(user: object) -> dict:
+    """user_read_document Already loaded user shaped like a looked up user, to avoid reading it again.
+
+    :param user: User entity or document
+    :type user: object
+    :return: ``_id`` and the ``UserRead`` fields
+    :rtype: dict
+    """
+    return {field: getattr(user, "id" if field == "_id" else field) for field in USER_READ_PROJECTION}
+
+
+def build_sort_stage(task_sorts: list[str] | None) -> dict:
+    """build_sort_stage Translate the ``+field`` / ``-field`` sort options into a ``$sort`` specification.
+
+    :param task_sorts: Sort options as returned by ``PaginationOptions.build_sorts_options``
+    :type task_sorts: list[str] | None
+    :return: Ordered ``$sort`` specification, ``created_at`` descending when no sort is given
+    :rtype: dict
+    """
+    sort_stage = {}
+    for task_sort in task_sorts or []:
+        if not task_sort:
+            continue
+
+        direction = SORT_DIRECTION_MAPPING.get(task_sort[0])
+        field = task_sort[1:] if direction is not None else task_sort
+        sort_stage[field] = direction if direction is not None else pymongo.ASCENDING
+
+    return sort_stage or dict(DEFAULT_TASK_SORT)
+
+
+def build_task_list_pipeline(match_query: dict, sort_stage: dict, skip: int, limit: int) -> list[dict]:
+    """build_task_list_pipeline Aggregation returning a page of tasks along with the users they reference.
+
+    Each task stays its own document, a page is never folded into a single one that could outgrow the BSON
+    size limit. The referenced user IDs are matched against the ``_id`` index of the users by a single
+    ``$lookup``, projected to the ``UserRead`` fields, which requires MongoDB 5.0.
+
+    :param match_query: Already encoded filter query
+    :type match_query: dict
+    :param sort_stage: ``$sort`` specification
+    :type sort_stage: dict
+    :param skip: Number of tasks to skip
+    :type skip: int
+    :param limit: Maximum number of tasks in the page
+    :type limit: int
+    :return: Pipeline producing the raw task documents of the page, their users under ``users``
+    :rtype: list[dict]
+    """
+    return [
+        {"$match": match_query},
+        {"$sort": sort_stage},
+        {"$skip": skip},
+        {"$limit": limit},
+        {
+            "$project": {
+                **TASK_READ_PROJECTION,
+                # ``$id`` cannot be used in a field path, the DBRef is read as a document instead
+                "user_ids": [
+                    {"$getField": {"field": {"$literal": "$id"}, "input": f"${field}"}}
+                    for field in TASK_USER_LINK_FIELDS
+                ],
+            },
+        },
+        {
+            "$lookup": {
+                "from": USERS_COLLECTION,
+                "localField": "user_ids",
+                "foreignField": "_id",
+                "pipeline": [{"$project": USER_READ_PROJECTION}],
+                "as": "users",
+            },
+        },
+        {"$unset": "user_ids"},
+    ]
+
+
+def hydrate_task_users(tasks: list[dict], users: list[dict] | None = None) -> list[dict]:
+    """hydrate_task_users Replace the user references of each task with the looked up users.
+
+    :param tasks: Raw task documents, along with the users looked up by ``build_task_list_pipeline``
+    :type tasks: list[dict]
+    :param users: Users projected to the ``UserRead`` fields, shared by every task
+    :type users: list[dict] | None
+    :return: Tasks shaped like ``TaskRead``
+    :rtype: list[dict]
+    """
+    shared_users_by_id = {user["_id"]: user for user in users or []}
+
+    hydrated_tasks = []
+    for task in tasks:
+        users_by_id = {**shared_users_by_id, **{user["_id"]: user for user in task.pop("users", [])}}
+        task["id"] = task.pop("_id")
+        task.pop("revision_id", None)
+        for field in TASK_USER_LINK_FIELDS:
+            reference = task.get(field)
+            user = users_by_id.get(reference.id) if reference is not None else None
+            task[field] = {key: value for key, value in user.items() if key != "_id"} if user is not None else None
+        hydrated_tasks.append(task)
+    return hydrated_tasks
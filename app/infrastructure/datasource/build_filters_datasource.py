@@ -1,6 +1,9 @@
-from beanie.operators import NE, GTE, LTE, Eq, In, Or, And, Nor, Not, NotIn
+from beanie.operators import NE, GTE, LTE, Eq, In, Or, And, Nor, NotIn
+from beanie.odm.operators import BaseOperator
+from beanie.odm.utils.encoder import Encoder
 
-from app.schemas.pydantic.task_schemas import ValueDescriptionToFilter
+from app.core import get_settings
+from app.utils.lru_ttl_cache import LRUTTLCache
 from app.schemas.pydantic.common_schemas import FilterCapabilities
 
 OPERATOR_MAPPING = {
@@ -12,20 +15,145 @@ OPERATOR_MAPPING = {
     "not_in": lambda f, v: NotIn(f, v),
 }
 
+# Link fields are stored as DBRef, so filtering by the referenced ID has to target ``$id``
+FIELD_PATH_MAPPING = {
+    "assigned_to": "assigned_to.$id",
+    "created_by": "created_by.$id",
+    "updated_by": "updated_by.$id",
+}
+
 LOGICAL_OPERATOR_MAPPING = {
     "and": lambda *args: And(*args),
     "or": lambda *args: Or(*args),
-    "not": lambda *args: Not(*args),
+    # ``$not`` only applies to a single field, negating the whole expression is done with ``$nor``
+    "not": lambda *args: Nor(And(*args)),
     "nor": lambda *args: Nor(*args),
     "no_op": lambda *args: And(*args),
     "": lambda *args: And(*args),
 }
 
+FilterShape = tuple[tuple[tuple[str, str], ...], str]
+
+
+class _Placeholder:
+    """_Placeholder
+
+    Stands for the value of the n-th filter inside a compiled query template.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class CompiledFilter:
+    """CompiledFilter
+
+    Query template of a filter shape (fields, operators and logical operator), built once with the Beanie
+    operators and rendered for each request by placing the values into it. ``hits`` counts the renders that
+    reused the template after its compilation.
+    """
+
+    def __init__(self, shape: FilterShape) -> None:
+        """__init__ Build the query template of ``shape``.
+
+        :param shape: Fields with their operator, and the logical operator joining them
+        :type shape: FilterShape
+        :raises ValueError: When an operator is not supported
+        """
+        fields_operators, logical_operator = shape
+        expressions = []
+        for index, (field, operator) in enumerate(fields_operators):
+            if operator not in OPERATOR_MAPPING:
+                msg = f"Unsupported operator: {operator}"
+                raise ValueError(msg)
+            expressions.append(OPERATOR_MAPPING[operator](FIELD_PATH_MAPPING.get(field, field), _Placeholder(index)))
+
+        self.shape = shape
+        self.template = self._to_plain(LOGICAL_OPERATOR_MAPPING[logical_operator](*expressions))
+        self.hits = 0
+
+    def render(self, values: list) -> dict:
+        """Encoded query of the template with ``values`` in place of the placeholders.
+
+        :param values: Filter values, in the order of the shape fields
+        :type values: list
+        :return: Query ready to be sent to MongoDB
+        :rtype: dict
+        """
+        encoded_values = [Encoder().encode(value) for value in values]
+        return self._render(self.template, encoded_values)
+
+    def _to_plain(self, node: object) -> object:
+        # Beanie operators nest other operators, the template keeps only plain dicts and lists
+        if isinstance(node, BaseOperator):
+            return self._to_plain(node.query)
+        if isinstance(node, dict):
+            return {key: self._to_plain(item) for key, item in node.items()}
+        if isinstance(node, list | tuple):
+            return [self._to_plain(item) for item in node]
+        return node
 
-def build_beanie_filter(filters: FilterCapabilities) -> any:
+    def _render(self, node: object, values: list) -> object:
+        if isinstance(node, _Placeholder):
+            return values[node.index]
+        if isinstance(node, dict):
+            return {key: self._render(item, values) for key, item in node.items()}
+        if isinstance(node, list):
+            return [self._render(item, values) for item in node]
+        return node
+
+
+_compiled_filters: LRUTTLCache[FilterShape, CompiledFilter] = LRUTTLCache(
+    max_size=get_settings().FILTER_TEMPLATE_CACHE_MAX_SIZE,
+)
+
+
+def get_compiled_filter(shape: FilterShape) -> CompiledFilter:
+    """get_compiled_filter Compiled template of ``shape``, compiled on first use and kept in a bounded LRU.
+
+    :param shape: Fields with their operator, and the logical operator joining them
+    :type shape: FilterShape
+    :return: The compiled template
+    :rtype: CompiledFilter
+    """
+    compiled_filter = _compiled_filters.get(shape)
+    if compiled_filter is None:
+        compiled_filter = CompiledFilter(shape)
+        _compiled_filters.set(shape, compiled_filter)
+    else:
+        compiled_filter.hits += 1
+    return compiled_filter
+
+
+def compiled_filters_stats() -> dict:
+    """compiled_filters_stats Usage of the compiled filters cache, overall and per shape.
+
+    :return: Cache counters and the hits of every cached shape
+    :rtype: dict
+    """
+    shapes = [
+        {
+            "fields": [f"{field}:{operator}" for field, operator in compiled_filter.shape[0]],
+            "logical_operator": compiled_filter.shape[1],
+            "hits": compiled_filter.hits,
+            "hit_ratio": round(compiled_filter.hits / (compiled_filter.hits + 1), 4),
+        }
+        for compiled_filter in _compiled_filters.values()
+    ]
+    return {**_compiled_filters.stats(), "shapes": sorted(shapes, key=lambda shape: shape["hits"], reverse=True)}
+
+
+def _enum_value(value: object) -> object:
+    return getattr(value, "value", value)
+
+
+def build_beanie_filter(filters: FilterCapabilities) -> dict:
     """build_beanie_filter _summary_
 
-    _extended_summary_
+    Query matching ``filters``. The filters are already validated by their schema, so only their shape is read
+    from them to pick the compiled template, which is then rendered with their values.
 
     :param filters: _description_
     :type filters: FilterCapabilities
@@ -33,35 +161,35 @@ def build_beanie_filter(filters: FilterCapabilities) -> any:
     :raises ValueError: _description_
     :raises ValueError: _description_
     :raises ValueError: _description_
-    :return: _description_
-    :rtype: _type_
+    :return: Query ready to be sent to MongoDB
+    :rtype: dict
     """
-    expressions = []
-
     if not filters.fields:
         raise ValueError("No filters provided to build the query.")
 
-    fields_to_filter_dumped = filters.fields.model_dump(exclude_unset=True)
-
-    for field, _filter in fields_to_filter_dumped.items():
-        parsed_filter = ValueDescriptionToFilter(**_filter)
+    fields_operators = []
+    values = []
+    for field in filters.fields.model_fields_set:
+        parsed_filter = getattr(filters.fields, field)
+        if parsed_filter is None:
+            continue
 
-        if parsed_filter.operator == "no_op":
+        operator = _enum_value(parsed_filter.operator)
+        if operator in ("", "no_op"):
             msg = f"Operator is required for field {field}, field will be ignored"
             raise ValueError(msg)
 
-        if parsed_filter.value is None and parsed_filter.operator != "no_op":
+        if parsed_filter.value is None:
             msg = f"Value is required for field {field}, field will be ignored"
             raise ValueError(msg)
 
-        if parsed_filter.operator not in OPERATOR_MAPPING:
-            msg = f"Unsupported operator: {parsed_filter.operator}"
-            raise ValueError(msg)
+        fields_operators.append((field, operator))
+        values.append(parsed_filter.value)
 
-        expression = OPERATOR_MAPPING[parsed_filter.operator](field, parsed_filter.value)
-        expressions.append(expression)
+    if not fields_operators:
+        raise ValueError("No filters provided to build the query.")
 
-    return {
-        "expression": expressions,
-        "logical_operator": filters.logical_operator.value,
-    }
+    # Fields are sorted so the same filters sent in another order share the template
+    ordered = sorted(zip(fields_operators, values, strict=True), key=lambda item: item[0])
+    shape = (tuple(item[0] for item in ordered), _enum_value(filters.logical_operator))
+    return get_compiled_filter(shape).render([item[1] for item in ordered])
@@ -0,0 +1,122 @@
+import base64
+import binascii
+from datetime import UTC
+
+import pymongo
+from bson import json_util
+from bson.binary import UuidRepresentation
+
+TIE_BREAKER_FIELD = "_id"
+
+CURSOR_JSON_OPTIONS = json_util.JSONOptions(
+    json_mode=json_util.JSONMode.CANONICAL,
+    uuid_representation=UuidRepresentation.STANDARD,
+    tz_aware=True,
+    tzinfo=UTC,
+)
+
+
+class InvalidCursorError(ValueError):
+    """InvalidCursorError
+
+    Raised when a pagination cursor can not be decoded or was issued for a different sort.
+    """
+
+
+def with_tie_breaker(sort_stage: dict) -> dict:
+    """with_tie_breaker Append ``_id`` to the sort so that every position in the result set is unique.
+
+    :param sort_stage: ``$sort`` specification
+    :type sort_stage: dict
+    :return: Same specification ending with ``_id``, in the direction of the last sort key
+    :rtype: dict
+    """
+    if TIE_BREAKER_FIELD in sort_stage:
+        return sort_stage
+
+    last_direction = next(reversed(sort_stage.values()), pymongo.ASCENDING)
+    return {**sort_stage, TIE_BREAKER_FIELD: last_direction}
+
+
+def encode_cursor(sort_stage: dict, document: dict) -> str:
+    """encode_cursor Opaque token pointing right after ``document`` for the given sort.
+
+    :param sort_stage: ``$sort`` specification including the tie breaker
+    :type sort_stage: dict
+    :param document: Last document of the page as stored, so link fields hold their reference rather than the
+        looked up document, the tie breaker may be exposed as ``id``
+    :type document: dict
+    :return: URL safe token
+    :rtype: str
+    """
+    values = [
+        document.get(field, document.get("id")) if field == TIE_BREAKER_FIELD else document.get(field)
+        for field in sort_stage
+    ]
+    payload = json_util.dumps(
+        {"sort": list(sort_stage.items()), "values": values},
+        json_options=CURSOR_JSON_OPTIONS,
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(sort_stage: dict, cursor: str) -> list:
+    """decode_cursor Values of the sort keys stored in ``cursor``.
+
+    :param sort_stage: ``$sort`` specification including the tie breaker
+    :type sort_stage: dict
+    :param cursor: Token returned by ``encode_cursor``
+    :type cursor: str
+    :raises InvalidCursorError: When the token is malformed or was issued for another sort
+    :return: One value per sort key
+    :rtype: list
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        decoded_cursor = json_util.loads(payload, json_options=CURSOR_JSON_OPTIONS)
+        cursor_sort = [tuple(sort) for sort in decoded_cursor["sort"]]
+        values = decoded_cursor["values"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as error:
+        raise InvalidCursorError("Invalid cursor") from error
+
+    if cursor_sort != list(sort_stage.items()) or len(values) != len(sort_stage):
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    return values
+
+
+def _after_condition(field: str, direction: int, value: object) -> dict | None:
+    # Null values sort before any other value, so they have to be handled explicitly
+    if value is None:
+        return {field: {"$ne": None}} if direction == pymongo.ASCENDING else None
+
+    if direction == pymongo.ASCENDING:
+        return {field: {"$gt": value}}
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def build_cursor_query(sort_stage: dict, values: list) -> dict:
+    """build_cursor_query Filter matching the documents placed after the cursor position.
+
+    For a sort on ``(a, b, _id)`` it matches ``a > va`` or ``a == va and b > vb`` or
+    ``a == va and b == vb and _id > vid``, with the comparisons flipped for descending keys.
+
+    :param sort_stage: ``$sort`` specification including the tie breaker
+    :type sort_stage: dict
+    :param values: Values decoded from the cursor
+    :type values: list
+    :return: Query to combine with the filters of the listing
+    :rtype: dict
+    """
+    sort_keys = list(sort_stage.items())
+    branches = []
+    for index, (field, direction) in enumerate(sort_keys):
+        after_condition = _after_condition(field, direction, values[index])
+        if after_condition is None:
+            continue
+
+        equalities = [
+            {previous_field: values[position]} for position, (previous_field, _) in enumerate(sort_keys[:index])
+        ]
+        branches.append({"$and": [*equalities, after_condition]} if equalities else after_condition)
+
+    return {"$or": branches} if branches else {TIE_BREAKER_FIELD: {"$exists": False}}
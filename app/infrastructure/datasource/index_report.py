@@ -0,0 +1,79 @@
+from beanie import Document
+from beanie.odm.utils.typing import get_index_attributes
+
+from app.core.logger import logger
+
+IndexKeys = tuple[tuple[str, int | str], ...]
+
+
+def _normalize_keys(keys: list) -> IndexKeys:
+    return tuple(
+        (field, int(direction) if isinstance(direction, int | float) else direction) for field, direction in keys
+    )
+
+
+def declared_indexes(document_model: type[Document]) -> dict[IndexKeys, str]:
+    """declared_indexes Indexes declared by a document, through ``Indexed`` fields and ``Settings.indexes``.
+
+    :param document_model: Initialized Beanie document
+    :type document_model: type[Document]
+    :return: Index names by their ordered keys
+    :rtype: dict[IndexKeys, str]
+    """
+    indexes = {}
+    for field_name, field in document_model.model_fields.items():
+        index_attributes = get_index_attributes(field)
+        if index_attributes is not None:
+            key = (field.alias or field_name, index_attributes[0])
+            indexes[_normalize_keys([key])] = f"{key[0]}_{key[1]}"
+
+    for index in document_model.get_settings().indexes or []:
+        index_model = getattr(index, "index", index)
+        indexes[_normalize_keys(list(index_model.document["key"].items()))] = index_model.document["name"]
+    return indexes
+
+
+async def build_index_report(document_model: type[Document]) -> dict:
+    """build_index_report Compare the declared indexes of a document with the ones existing in its collection.
+
+    :param document_model: Initialized Beanie document
+    :type document_model: type[Document]
+    :return: Collection name, indexes existing but not declared and indexes declared but missing
+    :rtype: dict
+    """
+    collection = document_model.get_motor_collection()
+    index_information = await collection.index_information()
+    existing_indexes = {
+        _normalize_keys(details["key"]): name for name, details in index_information.items() if name != "_id_"
+    }
+    expected_indexes = declared_indexes(document_model)
+
+    return {
+        "collection": collection.name,
+        "undeclared": sorted(name for keys, name in existing_indexes.items() if keys not in expected_indexes),
+        "missing": sorted(name for keys, name in expected_indexes.items() if keys not in existing_indexes),
+    }
+
+
+async def report_index_drift(document_models: list[type[Document]]) -> list[dict]:
+    """report_index_drift Log the differences between declared and existing indexes of every document.
+
+    Beanie creates the declared indexes but never drops the other ones, so indexes left behind by older versions
+    keep slowing down the writes until they are removed by hand.
+
+    :param document_models: Initialized Beanie documents
+    :type document_models: list[type[Document]]
+    :return: One report per document
+    :rtype: list[dict]
+    """
+    reports = []
+    for document_model in document_models:
+        report = await build_index_report(document_model)
+        if report["undeclared"]:
+            msg = f"Indexes of '{report['collection']}' not declared by the models: {report['undeclared']}"
+            logger.warning(msg)
+        if report["missing"]:
+            msg = f"Indexes declared for '{report['collection']}' but missing in the database: {report['missing']}"
+            logger.warning(msg)
+        reports.append(report)
+    return reports
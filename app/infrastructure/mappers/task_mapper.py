@@ -1,67 +1,140 @@
-from app.core.logger import logger
-from app.schemas.pydantic.task_schemas import TaskCreate, TaskCreateWithMetadata
-from app.infrastructure.mappers.user_mapper import to_beanie_user_from_entity_user
-from app.infrastructure.models.odm.beanie_task_model import BeanieTask
+import asyncio
+from uuid import UUID
+
+from app.domain.entities.user import User
+from app.schemas.pydantic.task_schemas import TaskCreate
+from app.infrastructure.models.odm.beanie_task_model import BeanieTask, BeanieSubTask, SubTaskNotFoundError
 from app.infrastructure.models.odm.beanie_user_model import BeanieUser
+from app.infrastructure.datasource.build_aggregations_datasource import user_reference
+
+
+async def _validate_sub_tasks_for_creation(sub_tasks: list[dict]) -> list[dict]:
+    if not sub_tasks:
+        return []
+
+    return await BeanieTask.validate_sub_tasks(sub_tasks)
 
 
-async def to_beanie_task_from_schema_task_create(create_schema: TaskCreate, created_by: BeanieUser) -> BeanieTask:
+async def _find_assigned_user(assigned_to: UUID | None) -> BeanieUser | None:
+    if assigned_to is None:
+        return None
+
+    assigned_user = await BeanieUser.get(assigned_to)
+    if not assigned_user:
+        raise ValueError("Assigned user not found")
+    return assigned_user
+
+
+async def to_beanie_task_from_schema_task_create(
+    create_schema: TaskCreate,
+    created_by: User,
+) -> tuple[BeanieTask, list[dict]]:
     """Convert TaskCreate schema to BeanieTask model.
 
+    The sub tasks validation and the assignee lookup run concurrently, each one in a single query. The payload
+    was already validated by ``TaskCreate``, so it is not validated again through an intermediate schema.
+
     Args:
         create_schema (TaskCreate): The TaskCreate schema.
-        created_by (BeanieUser): The user who created the task.
+        created_by (User): The user who created the task.
 
     Returns:
-        BeanieTask: The BeanieTask model.
+        tuple[BeanieTask, list[dict]]: The BeanieTask model and its validated sub tasks with their summary,
+        ready to be returned to the client.
+
+    Raises:
+        SubTaskNotFoundError: When some sub tasks point to a task that does not exist.
     """
     try:
         data_payload_processed = create_schema.model_dump(exclude_unset=True)
-        data_payload_processed["created_by"] = created_by
-
-        validated_subtasks = None
-        if "sub_tasks" in data_payload_processed:
-            try:
-                validated_subtasks = await BeanieTask.validate_sub_tasks(data_payload_processed["sub_tasks"])
-            except Exception as error:  # noqa: BLE001
-                msg = (
-                    "Subtasks validation failed: "
-                    + str(error)
-                    + " sub_tasks won't be created for the task by name "
-                    + str(
-                        data_payload_processed["title"],
-                    )
-                )
-                logger.warning(msg)
-
-        if "assigned_to" in data_payload_processed and data_payload_processed["assigned_to"] is not None:
-            assigned_user = await BeanieUser.get(
-                data_payload_processed["assigned_to"],
-            )
-            if not assigned_user:
-                raise ValueError("Assigned user not found")  # noqa: TRY301
-            data_payload_processed["assigned_to"] = assigned_user
 
-        task_to_create = TaskCreateWithMetadata(
-            **{
-                **data_payload_processed,
-                "sub_tasks": validated_subtasks,
-                "created_by": to_beanie_user_from_entity_user(created_by),
-            },
+        validated_subtasks, assigned_user = await asyncio.gather(
+            _validate_sub_tasks_for_creation(data_payload_processed.pop("sub_tasks", [])),
+            _find_assigned_user(data_payload_processed.pop("assigned_to", None)),
         )
 
-        return BeanieTask(
-            title=task_to_create.title,
-            description=task_to_create.description,
-            status=task_to_create.status,
-            priority=task_to_create.priority,
-            is_archived=task_to_create.is_archived,
-            sub_tasks=task_to_create.sub_tasks,
-            due_date=task_to_create.due_date,
-            assigned_to=task_to_create.assigned_to,
-            created_by=task_to_create.created_by,
-            updated_by=task_to_create.updated_by,
+        task = BeanieTask(
+            **data_payload_processed,
+            sub_tasks=validated_subtasks,
+            assigned_to=assigned_user,
+            created_by=user_reference(created_by.id),
         )
+        return task, validated_subtasks
+    except SubTaskNotFoundError:
+        raise
     except Exception as e:
         msg = "Failed to convert TaskCreate to BeanieTask: " + str(e)
         raise ValueError(msg) from e
+
+
+async def _find_existing_user_ids(user_ids: list[UUID], known_user_ids: set[UUID] | None = None) -> set[UUID]:
+    known_user_ids = known_user_ids if known_user_ids is not None else set()
+    unknown_ids = list(
+        dict.fromkeys(user_id for user_id in user_ids if user_id is not None and user_id not in known_user_ids),
+    )
+    if unknown_ids:
+        users = (
+            await BeanieUser.get_motor_collection().find({"_id": {"$in": unknown_ids}}, {"_id": 1}).to_list(length=None)
+        )
+        known_user_ids.update(user["_id"] for user in users)
+    return known_user_ids
+
+
+async def to_beanie_tasks_from_schema_task_create_many(
+    create_schemas: list[TaskCreate],
+    created_by: User,
+    known_user_ids: set[UUID] | None = None,
+) -> list[tuple[BeanieTask | None, str | None]]:
+    """Convert many TaskCreate schemas to BeanieTask models.
+
+    Every assignee and every sub task of the batch are resolved together, with one ``$in`` query each, instead of
+    once per task. As for a single creation, a task whose sub tasks point to a task that does not exist is rejected.
+
+    Args:
+        create_schemas (list[TaskCreate]): The TaskCreate schemas.
+        created_by (User): The user who created the tasks.
+        known_user_ids (set[UUID] | None): IDs of users already known to exist, they are not looked up again and
+            the ones found are added to it, so it can be shared by the successive batches of an import.
+
+    Returns:
+        list[tuple[BeanieTask | None, str | None]]: For each schema in the same order, either the BeanieTask model
+        or the reason why it can not be created.
+    """
+    existing_user_ids, sub_task_summaries = await asyncio.gather(
+        _find_existing_user_ids([create_schema.assigned_to for create_schema in create_schemas], known_user_ids),
+        BeanieTask.fetch_sub_task_summaries(
+            [sub_task.id for create_schema in create_schemas for sub_task in create_schema.sub_tasks],
+        ),
+    )
+
+    creator_reference = user_reference(created_by.id)
+    converted_tasks = []
+    for create_schema in create_schemas:
+        data_payload_processed = create_schema.model_dump(exclude_unset=True)
+        assigned_to = data_payload_processed.pop("assigned_to", None)
+        if assigned_to is not None and assigned_to not in existing_user_ids:
+            converted_tasks.append((None, "Assigned user not found"))
+            continue
+
+        sub_tasks = [
+            BeanieSubTask.model_construct(**sub_task) for sub_task in data_payload_processed.pop("sub_tasks", [])
+        ]
+        missing_sub_task_ids = list(
+            dict.fromkeys(sub_task.id for sub_task in sub_tasks if sub_task.id not in sub_task_summaries),
+        )
+        if missing_sub_task_ids:
+            converted_tasks.append((None, str(SubTaskNotFoundError(missing_sub_task_ids))))
+            continue
+
+        try:
+            task = BeanieTask(
+                **data_payload_processed,
+                sub_tasks=BeanieTask.merge_sub_task_summaries(sub_tasks, sub_task_summaries),
+                assigned_to=user_reference(assigned_to),
+                created_by=creator_reference,
+            )
+        except ValueError as error:
+            converted_tasks.append((None, str(error)))
+            continue
+        converted_tasks.append((task, None))
+    return converted_tasks
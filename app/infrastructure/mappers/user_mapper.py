@@ -1,4 +1,4 @@
-from app.core.security import get_password
+from app.core.security import get_password_async
 from app.domain.entities.user import User
 from app.schemas.pydantic.user_schemas import UserCreate
 from app.infrastructure.models.odm.beanie_user_model import BeanieUser
@@ -32,11 +32,11 @@ def to_beanie_user_from_entity_user(entity: User) -> BeanieUser:
         raise ValueError(msg) from e
 
 
-def to_entity_user_from_schema_create_user(create_schema: UserCreate) -> User:
+async def to_entity_user_from_schema_create_user(create_schema: UserCreate) -> User:
     return User(
         email=create_schema.email,
         username=create_schema.username,
         first_name=create_schema.first_name,
         last_name=create_schema.last_name,
-        hashed_password=get_password(create_schema.password),
+        hashed_password=await get_password_async(create_schema.password),
     )
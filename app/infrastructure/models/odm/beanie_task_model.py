@@ -2,7 +2,9 @@ from uuid import UUID, uuid4
 from datetime import UTC, datetime
 
 from beanie import Link, Insert, Indexed, Replace, Document, before_event
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pydantic import Field, BaseModel
+from beanie.operators import In
 
 from app.core.logger import logger
 from app.domain.entities.task import SubTask
@@ -10,6 +12,22 @@ from app.domain.entities.task_enum import Priority, TaskStatus, SubTaskRelationT
 from app.infrastructure.models.odm.beanie_user_model import BeanieUser
 
 
+class SubTaskNotFoundError(ValueError):
+    """SubTaskNotFoundError
+
+    Raised when sub tasks point to tasks that do not exist, ``sub_task_ids`` lists them.
+    """
+
+    def __init__(self, sub_task_ids: list[UUID]) -> None:
+        """__init__ _summary_
+
+        :param sub_task_ids: IDs that could not be resolved
+        :type sub_task_ids: list[UUID]
+        """
+        self.sub_task_ids = sub_task_ids
+        super().__init__(f"Sub tasks not found: {', '.join(str(sub_task_id) for sub_task_id in sub_task_ids)}")
+
+
 class BeanieSubTask(BaseModel):
     """BeanieSubTask _summary_
 
@@ -23,6 +41,21 @@ class BeanieSubTask(BaseModel):
     relation_type: SubTaskRelationType = Field(default=SubTaskRelationType.RELATES_TO)
 
 
+class BeanieSubTaskSummary(BaseModel):
+    """BeanieSubTaskSummary
+
+    Projection of the only task fields exposed for a sub task, used to resolve sub tasks in a single query.
+
+    :param BaseModel: _description_
+    :type BaseModel: _type_
+    """
+
+    id: UUID = Field(alias="_id")
+    title: str
+    description: str
+    due_date: datetime | None = None
+
+
 class BeanieTask(Document):
     """BeanieTask _summary_
 
@@ -57,69 +90,110 @@ class BeanieTask(Document):
         self.updated_at = datetime.now(tz=UTC)
 
     @classmethod
-    async def validate_sub_tasks(cls, sub_tasks: list[SubTask]) -> list[BeanieSubTask]:
+    async def validate_sub_tasks(cls, sub_tasks: list[SubTask]) -> list[dict]:
         """validate_sub_tasks _summary_
 
-        _extended_summary_
+        Check that every sub task points to an existing task with a single ``$in`` query. The returned entries
+        carry the sub task summary as well, so they can be stored as ``BeanieSubTask`` and returned to the client
+        without reading the sub tasks again.
 
         :param sub_tasks: _description_
         :type sub_tasks: list[SubTask]
+        :raises SubTaskNotFoundError: When some sub tasks point to a task that does not exist
         :return: _description_
-        :rtype: list[SubTask]
+        :rtype: list[dict]
         """
+        sub_task_ids = [sub_task.get("id", None) for sub_task in sub_tasks]
         try:
-            validated_sub_tasks = []
-            for sub_task in sub_tasks:
-                sub_task_id = sub_task.get("id", None)
-                sub_task_validation = await cls.get(sub_task_id) if sub_task_id else None
-                if not sub_task_validation:
-                    msg = f"Subtask with ID {sub_task_id} not found"
-                    logger.warning(msg)
-                validated_sub_tasks.append(
-                    {
-                        "id": sub_task_validation.id,
-                        "relation_type": sub_task.get("relation_type", SubTaskRelationType.RELATES_TO),
-                    },
-                )
-            return validated_sub_tasks
+            summaries = await cls.fetch_sub_task_summaries(sub_task_ids)
         except Exception as error:
             msg = f"[BeanieTask] - Subtask validation failed, error: {error}"
             logger.error(msg)
             raise
 
+        missing_ids = [sub_task_id for sub_task_id in dict.fromkeys(sub_task_ids) if sub_task_id not in summaries]
+        if missing_ids:
+            raise SubTaskNotFoundError(missing_ids)
+
+        return cls.merge_sub_task_summaries(
+            [
+                BeanieSubTask.model_construct(
+                    id=sub_task.get("id", None),
+                    relation_type=sub_task.get("relation_type", SubTaskRelationType.RELATES_TO),
+                )
+                for sub_task in sub_tasks
+            ],
+            summaries,
+        )
+
+    @classmethod
+    async def fetch_sub_task_summaries(cls, sub_task_ids: list[UUID]) -> dict[UUID, BeanieSubTaskSummary]:
+        """fetch_sub_task_summaries _summary_
+
+        Resolve many sub tasks with a single ``$in`` query, projecting only ``title``, ``description`` and
+        ``due_date``.
+
+        :param sub_task_ids: IDs of the tasks referenced as sub tasks, duplicates and ``None`` are ignored
+        :type sub_task_ids: list[UUID]
+        :return: Found summaries by ID, dangling IDs are simply absent
+        :rtype: dict[UUID, BeanieSubTaskSummary]
+        """
+        unique_ids = list(dict.fromkeys(sub_task_id for sub_task_id in sub_task_ids if sub_task_id))
+        if not unique_ids:
+            return {}
+
+        summaries = await cls.find(In(cls.id, unique_ids)).project(BeanieSubTaskSummary).to_list()
+        return {summary.id: summary for summary in summaries}
+
     async def retrieve_sub_tasks(self) -> list[BeanieSubTask]:
-        """validate_sub_tasks _summary_
+        """retrieve_sub_tasks _summary_
 
-        _extended_summary_
+        Sub tasks of this task with their summary, in their original order. Sub tasks pointing to a task that
+        does not exist anymore are skipped.
 
-        :param sub_tasks: _description_
-        :type sub_tasks: list[SubTask]
         :return: _description_
         :rtype: list[SubTask]
         """
         try:
-            retrieved_sub_tasks = []
-            for sub_task in self.sub_tasks:
-                sub_task_id = sub_task.id
-                sub_task_found = await self.get(sub_task_id) if sub_task_id else None
-                if not sub_task_found:
-                    msg = f"Subtask with ID {sub_task_id} not found"
-                    logger.warning(msg)
-                retrieved_sub_tasks.append(
-                    {
-                        "id": sub_task_found.id,
-                        "title": sub_task_found.title,
-                        "description": sub_task_found.description,
-                        "due_date": sub_task_found.due_date,
-                        "relation_type": sub_task.relation_type,
-                    },
-                )
-            return retrieved_sub_tasks
+            summaries = await self.fetch_sub_task_summaries([sub_task.id for sub_task in self.sub_tasks])
+            return self.merge_sub_task_summaries(self.sub_tasks, summaries)
         except Exception as error:
             msg = f"[BeanieTask] - Subtask validation failed, error: {error}"
             logger.error(msg)
             raise
 
+    @staticmethod
+    def merge_sub_task_summaries(
+        sub_tasks: list[BeanieSubTask],
+        summaries: dict[UUID, BeanieSubTaskSummary],
+    ) -> list[dict]:
+        """merge_sub_task_summaries Pair each sub task with its summary, keeping the original order.
+
+        :param sub_tasks: Stored sub tasks
+        :type sub_tasks: list[BeanieSubTask]
+        :param summaries: Summaries by ID as returned by ``fetch_sub_task_summaries``
+        :type summaries: dict[UUID, BeanieSubTaskSummary]
+        :return: Sub tasks with their summary, the ones without a summary are skipped
+        :rtype: list[dict]
+        """
+        merged_sub_tasks = []
+        for sub_task in sub_tasks:
+            sub_task_found = summaries.get(sub_task.id)
+            if not sub_task_found:
+                msg = f"Subtask with ID {sub_task.id} not found, it will be skipped"
+                logger.warning(msg)
+                continue
+            merged_sub_tasks.append(
+                {
+                    "id": sub_task_found.id,
+                    "title": sub_task_found.title,
+                    "description": sub_task_found.description,
+                    "due_date": sub_task_found.due_date,
+                    "relation_type": sub_task.relation_type,
+                },
+            )
+        return merged_sub_tasks
+
     class Settings:
         """_summary_
 
@@ -127,6 +201,35 @@ class BeanieTask(Document):
         """
 
         name = "tasks"
+        # Equality fields first, then the default ``created_at`` sort with the ``_id`` tie breaker used by the
+        # cursor pagination, so filtered listings are served by the index without in-memory sorts
+        indexes = [  # noqa: RUF012
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+            IndexModel(
+                [("is_archived", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="is_archived_created_at_id",
+            ),
+            IndexModel(
+                [("is_archived", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="is_archived_status_created_at_id",
+            ),
+            IndexModel(
+                [("is_archived", ASCENDING), ("priority", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="is_archived_priority_created_at_id",
+            ),
+            IndexModel(
+                [
+                    ("assigned_to.$id", ASCENDING),
+                    ("is_archived", ASCENDING),
+                    ("status", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="assigned_to_is_archived_status_created_at_id",
+            ),
+            # Latest modification, read to validate the cached listing pages
+            IndexModel([("updated_at", DESCENDING)], name="updated_at"),
+        ]
 
     def __repr__(self) -> str:
         return f"<BeanieTask(title={self.title}, status={self.status})>"
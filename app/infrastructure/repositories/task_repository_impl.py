@@ -21,9 +21,15 @@ class TaskRepositoryImpl(ITaskRepository):
     async def create_task(self, current_user, task_data):
         return await self.datasource.create_task(current_user, task_data)
 
+    async def create_tasks(self, current_user, tasks_data, known_user_ids: set | None = None):
+        return await self.datasource.create_tasks(current_user, tasks_data, known_user_ids)
+
     async def get_task_by_id(self, task_id: str):
         return await self.datasource.get_task_by_id(task_id)
 
+    async def get_tasks_by_ids(self, task_ids: list):
+        return await self.datasource.get_tasks_by_ids(task_ids)
+
     async def find_task_by_name(self, name: str):
         return await self.datasource.find_task_by_name(name)
 
@@ -33,8 +39,27 @@ class TaskRepositoryImpl(ITaskRepository):
     async def list_my_assigned_tasks(self, current_user):
         return await self.datasource.list_my_assigned_tasks(current_user)
 
-    async def list_tasks(self, task_filters: dict | None, task_sorts: list[str] | None, page: int, offset: int):
-        return await self.datasource.list_tasks(task_filters, task_sorts, page, offset)
+    async def list_tasks(
+        self,
+        task_filters: dict | None,
+        task_sorts: list[str] | None,
+        page: int,
+        offset: int,
+        cursor: str | None = None,
+    ):
+        return await self.datasource.list_tasks(task_filters, task_sorts, page, offset, cursor)
+
+    def iterate_tasks(self, task_filters: dict | None):
+        return self.datasource.iterate_tasks(task_filters)
+
+    async def count_tasks(self, task_filters: dict | None):
+        return await self.datasource.count_tasks(task_filters)
+
+    async def get_task_version(self, task_id: str):
+        return await self.datasource.get_task_version(task_id)
+
+    async def get_tasks_last_modified(self, task_filters: dict | None):
+        return await self.datasource.get_tasks_last_modified(task_filters)
 
     async def list_tasks_by_filter(self, task_filter):
         return await self.datasource.list_tasks_by_filter(task_filter)
@@ -42,5 +67,14 @@ class TaskRepositoryImpl(ITaskRepository):
     async def update_task(self, current_user, task_id: str, task_data: dict):
         return await self.datasource.update_task(current_user, task_id, task_data)
 
+    async def update_tasks(self, current_user, task_filters: dict, task_data: dict):
+        return await self.datasource.update_tasks(current_user, task_filters, task_data)
+
+    async def archive_task(self, current_user, task_id: str):
+        return await self.datasource.archive_task(current_user, task_id)
+
     async def delete_task(self, task_id: str):
         return await self.datasource.delete_task(task_id)
+
+    async def delete_tasks(self, task_filters: dict):
+        return await self.datasource.delete_tasks(task_filters)
@@ -6,20 +6,29 @@ import uvicorn
 from mangum import Mangum
 from fastapi import Depends, FastAPI, Request
 from scalar_fastapi import get_scalar_api_reference
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from slowapi.middleware import SlowAPIMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from scalar_fastapi.scalar_fastapi import Layout
 
 from app.core import settings, get_settings
+from app.core.cache import get_cache_backend
+from app.core.health import system_metrics_sampler
 from app.core.logger import f, logger
+from app.core.security import password_hashing_executor
 from app.core.path_conf import STATIC_DIR
+from app.core.mongo_client import mongo_client_manager
 from app.api.routers.routes import router
 from app.core.docs_metadata import tags_metadata
 from app.core.docs_settings import load_theme_css
 from app.core.rate_limiting import limiter
+from app.services.task_service import task_list_cache
+from app.services.user_service import authenticated_user_cache
+from app.infrastructure.container import init_container
 from app.infrastructure.datasource import init_db
+from app.infrastructure.datasource.beanie_task_datasource import task_count_cache
+from app.infrastructure.datasource.build_filters_datasource import compiled_filters_stats
 
 
 @asynccontextmanager
@@ -31,10 +40,20 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[any, any, any]:
             logger.info(get_settings().check_env_variables)
 
         logger.info("Initializing database connection")
+        mongo_client_manager.connect()
         await init_db()
 
+        logger.info("Wiring application services")
+        init_container()
+
+        logger.info("Starting system metrics sampler")
+        system_metrics_sampler.start()
+
         yield
 
+        await system_metrics_sampler.stop()
+        password_hashing_executor.shutdown()
+
         logger.info(f.renderText("Shutting down " + get_settings().PROJECT_NAME))
         if not get_settings().DEBUG:
             logger.info(
@@ -42,7 +61,8 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[any, any, any]:
             )  # TODO(<CosmicTiger>): Pending implementation to send logs to AWS Cloud  # noqa: TD003, FIX002
 
         logger.info("Closing database connection")
-        get_settings().get_db_client.close()
+        mongo_client_manager.close()
+        await get_cache_backend().close()
     except Exception as e:  # noqa: BLE001
         logger.error("Error during lifespan: " + str(e))
         if not get_settings().DEBUG:
@@ -90,11 +110,33 @@ async def root() -> HTMLResponse:
     )
 
 
+def collect_health_status(settings: settings.Settings) -> dict:
+    """collect_health_status _summary_
+
+    Merge the static service information with the last background sample, without any blocking call.
+
+    :param settings: Application settings
+    :type settings: settings.Settings
+    :return: Health status figures
+    :rtype: dict
+    """
+    return {
+        **settings.get_health_status,
+        **system_metrics_sampler.snapshot,
+        "database_pool": mongo_client_manager.pool_stats(),
+        "authenticated_user_cache": authenticated_user_cache.stats(),
+        "task_count_cache": task_count_cache.stats(),
+        "cache_backend": get_cache_backend().stats(),
+        "task_list_cache": task_list_cache.stats(),
+        "compiled_filters": compiled_filters_stats(),
+        "password_hashing": password_hashing_executor.stats(),
+    }
+
+
 @app.get("/healthcheck", tags=["System"], response_class=HTMLResponse)
 async def healthcheck(settings: Annotated[settings.Settings, Depends(get_settings)]) -> HTMLResponse:
     try:
-        status = settings.get_health_status
-        status["database_connection"] = await settings.get_ping_pong_db
+        status = collect_health_status(settings)
         status_text = ""
 
         for key, value in status.items():
@@ -132,9 +174,45 @@ async def healthcheck(settings: Annotated[settings.Settings, Depends(get_setting
             </body>
             </html>
         """,
+            status_code=503,
         )
 
 
+@app.get("/healthcheck/json", tags=["System"])
+async def healthcheck_json(settings: Annotated[settings.Settings, Depends(get_settings)]) -> JSONResponse:
+    status = collect_health_status(settings)
+    status["status"] = "healthy"
+    return JSONResponse(content=status, status_code=200)
+
+
+@app.get("/livez", tags=["System"])
+async def livez() -> JSONResponse:
+    """Liveness probe, answers as long as the event loop is serving requests, touches nothing else."""
+    return JSONResponse(content={"status": "alive"}, status_code=200)
+
+
+@app.get("/readyz", tags=["System"])
+async def readyz(settings: Annotated[settings.Settings, Depends(get_settings)]) -> JSONResponse:
+    """Readiness probe
+
+    Reports the database ping cached for ``HEALTH_DB_PING_CACHE_SECONDS`` and flips to 503 when the database is
+    unreachable or every pooled connection is checked out, so the orchestrator stops routing traffic here.
+    """
+    database_connection = await mongo_client_manager.cached_ping(settings.HEALTH_DB_PING_CACHE_SECONDS)
+    pool_exhausted = mongo_client_manager.is_pool_exhausted()
+    database_ready = database_connection == "Up" or settings.DB_TYPE != "mongodb"
+    ready = database_ready and not pool_exhausted
+
+    return JSONResponse(
+        content={
+            "status": "ready" if ready else "not ready",
+            "database_connection": database_connection,
+            "database_pool_exhausted": pool_exhausted,
+        },
+        status_code=200 if ready else 503,
+    )
+
+
 @app.get("/docs", include_in_schema=False)
 def overridden_swagger(req: Request) -> HTMLResponse:
     return get_scalar_api_reference(
@@ -0,0 +1,66 @@
+from typing import Any
+from functools import lru_cache
+from collections.abc import Mapping
+
+from pydantic import TypeAdapter
+from fastapi.responses import Response
+from starlette.background import BackgroundTask
+
+
+@lru_cache(maxsize=128)
+def get_type_adapter(response_model: Any) -> TypeAdapter:  # noqa: ANN401
+    """get_type_adapter Type adapter of ``response_model``, its validator and serializer are built only once.
+
+    :param response_model: Schema of the response, e.g. ``CommonResponse[TaskRead]``
+    :type response_model: Any
+    :return: Cached adapter of the schema
+    :rtype: TypeAdapter
+    """
+    return TypeAdapter(response_model)
+
+
+class PydanticJSONResponse(Response):
+    """PydanticJSONResponse
+
+    JSON response validated once against ``response_model`` and serialized straight to bytes by pydantic-core.
+    Routes returning it skip the ``response_model`` validation and encoding done by FastAPI, the model declared
+    in the route decorator is only used for the documentation.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,  # noqa: ANN401
+        response_model: Any,  # noqa: ANN401
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        """__init__ _summary_
+
+        :param content: Payload shaped like ``response_model``, plain dicts coming from the database projections
+            are validated once into the schema
+        :type content: Any
+        :param response_model: Schema of the response
+        :type response_model: Any
+        :param status_code: _description_
+        :type status_code: int
+        :param headers: _description_
+        :type headers: Mapping[str, str] | None
+        :param background: _description_
+        :type background: BackgroundTask | None
+        """
+        self.response_model = response_model
+        super().__init__(content, status_code, headers, self.media_type, background)
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Validate ``content`` into the response schema and dump it to JSON bytes.
+
+        :param content: _description_
+        :type content: Any
+        :return: _description_
+        :rtype: bytes
+        """
+        type_adapter = get_type_adapter(self.response_model)
+        return type_adapter.dump_json(type_adapter.validate_python(content), by_alias=True)
@@ -1,8 +1,9 @@
 from enum import Enum
+from uuid import UUID
 from typing import Generic, TypeVar
 from datetime import datetime
 
-from pydantic import Field, BaseModel, ConfigDict, AliasGenerator, ValidationError
+from pydantic import Field, BaseModel, ConfigDict, AliasGenerator, ValidationError, model_validator
 from pydantic.alias_generators import to_camel
 
 from app.core.logger import logger
@@ -65,6 +66,7 @@ class CommonListResponse(BaseModel, Generic[M]):
 
     total: int | None
     data: list[M]
+    next_cursor: str | None = None
 
 
 class CommonDeleteResponse(BaseModel, Generic[M]):
@@ -161,9 +163,9 @@ class SortCapabilities(BaseModel):
         :return: _description_
         :rtype: list[str]
         """
-        if self.sorts and (
-            configure_to_datasource
-            in (DatasourceFilterTransformerEnum.mongo_db, DatasourceFilterTransformerEnum.default)
+        if configure_to_datasource in (
+            DatasourceFilterTransformerEnum.mongo_db,
+            DatasourceFilterTransformerEnum.default,
         ):
             return f"{self.order.value}{self.field}"
         return None
@@ -265,3 +267,99 @@ class PaginationOptions(BaseModel, Generic[FilterSchema]):
         ):
             return [sort.build_sort_format(configure_to_datasource) for sort in self.sorts]
         return []
+
+
+class PageParams(BaseModel):
+    """PageParams _summary_
+
+    Position and size of a requested page, read from the query parameters of the listing.
+
+    :param BaseModel: _description_
+    :type BaseModel: _type_
+    """
+
+    page: int = Field(
+        default=0,
+        ge=0,
+        le=10_000,
+        title="Page",
+        description="Current page retrieved, use the cursor to go deeper",
+    )
+    offset: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        title="Offset",
+        description="Number of items per page",
+    )
+    cursor: str | None = Field(
+        default=None,
+        title="Cursor",
+        description="Cursor returned as next_cursor by the previous page, page is ignored when given",
+    )
+
+
+class ListQueryParams(PageParams):
+    """ListQueryParams _summary_
+
+    Query parameters of a listing, the requested page and whether the total has to be computed.
+
+    :param PageParams: _description_
+    :type PageParams: _type_
+    """
+
+    include_total: bool = Field(
+        default=True,
+        title="Include total",
+        description="Whether the total of items matching the filters is computed, null otherwise",
+    )
+
+
+class BulkSelection(BaseModel, Generic[FilterSchema]):
+    """BulkSelection _summary_
+
+    Entities targeted by a bulk operation, either an explicit list of IDs or the ones matching the filters.
+
+    :param BaseModel: _description_
+    :type BaseModel: _type_
+    :param Generic: _description_
+    :type Generic: _type_
+    """
+
+    ids: list[UUID] | None = Field(
+        default=None,
+        min_length=1,
+        title="IDs",
+        description="IDs of the entities to target",
+    )
+    filters: FilterSchema | None = Field(
+        default=None,
+        title="Filters",
+        description="Filters selecting the entities to target",
+    )
+
+    @model_validator(mode="after")
+    def check_single_selection(self) -> "BulkSelection":
+        """check_single_selection Exactly one of ``ids`` and ``filters`` has to be given.
+
+        :raises ValueError: When both or none of them are given
+        :return: _description_
+        :rtype: BulkSelection
+        """
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Either ids or filters must be provided, not both")
+        return self
+
+
+class BulkWriteResult(BaseModel):
+    """BulkWriteResult _summary_
+
+    Counters of a bulk write, the ones that do not apply to the operation are left to zero.
+
+    :param BaseModel: _description_
+    :type BaseModel: _type_
+    """
+
+    matched: int = Field(default=0, title="Matched", description="Number of entities matching the selection")
+    modified: int = Field(default=0, title="Modified", description="Number of entities actually modified")
+    deleted: int = Field(default=0, title="Deleted", description="Number of entities deleted")
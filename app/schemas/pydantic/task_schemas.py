@@ -240,6 +240,80 @@ class TaskRead(BaseModel):
     )
 
 
+class TaskReadMany(BaseModel):
+    """TaskReadMany schema
+
+    Schema that handles the tasks read by their IDs at once.
+
+    :param BaseModel: based on the pydantic BaseModel
+    """
+
+    tasks: list[TaskRead] = Field(
+        default_factory=list,
+        title="Tasks",
+        description="Found tasks, in the order of the requested IDs",
+    )
+    missing: list[UUID] = Field(
+        default_factory=list,
+        title="Missing",
+        description="Requested IDs that do not match any task",
+    )
+
+
+class TaskBulkItemResult(BaseModel):
+    """TaskBulkItemResult schema
+
+    Outcome of one item of a bulk operation, identified by its position in the request.
+
+    :param BaseModel: based on the pydantic BaseModel
+    """
+
+    index: int = Field(..., title="Index", description="Position of the item in the request")
+    id: UUID | None = Field(default=None, title="ID", description="ID of the task when the item succeeded")
+    error: str | None = Field(default=None, title="Error", description="Reason of the failure, if any")
+
+
+class TaskBulkCreateResult(BaseModel):
+    """TaskBulkCreateResult schema
+
+    Schema that handles the result of a bulk creation of tasks.
+
+    :param BaseModel: based on the pydantic BaseModel
+    """
+
+    created: int = Field(..., title="Created", description="Number of tasks created")
+    failed: int = Field(..., title="Failed", description="Number of tasks that could not be created")
+    results: list[TaskBulkItemResult] = Field(
+        default_factory=list,
+        title="Results",
+        description="Outcome of each item, in the order of the request",
+    )
+
+
+class TaskImportResult(BaseModel):
+    """TaskImportResult schema
+
+    Schema that handles the summary of an import of tasks.
+
+    :param BaseModel: based on the pydantic BaseModel
+    """
+
+    import_id: str = Field(..., title="Import ID", description="ID of the import, used to download its error report")
+    processed: int = Field(..., title="Processed", description="Number of rows read")
+    created: int = Field(..., title="Created", description="Number of tasks created")
+    failed: int = Field(..., title="Failed", description="Number of rows rejected")
+    error_report: str | None = Field(
+        default=None,
+        title="Error Report",
+        description="Path of the error report, when some rows were rejected",
+    )
+    errors_truncated: bool = Field(
+        default=False,
+        title="Errors Truncated",
+        description="Whether the error report only holds the first errors",
+    )
+
+
 class TaskFilters(BaseModel):
     """TaskFilters schema
 
@@ -1,11 +1,35 @@
+import json
+import asyncio
+from uuid import UUID, uuid4
+from datetime import datetime
+from collections.abc import Callable, Awaitable, AsyncIterator
+
+from app.core import get_settings
+from app.core.cache import get_cache_backend
 from app.core.logger import logger
+from app.utils.task_export import stream_task_export
+from app.utils.task_import import ImportRecord, iter_lines, iter_batches, gunzip_chunks, iter_import_records
 from app.domain.entities.user import User
+from app.utils.versioned_cache import VersionedCache
 from app.schemas.pydantic.task_schemas import TaskRead, TaskCreate, TaskUpdate
-from app.schemas.pydantic.common_schemas import FilterCapabilities
-from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource
+from app.utils.enums.export_format_enum import ExportFormat
+from app.schemas.pydantic.common_schemas import PageParams, BulkSelection, FilterCapabilities
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource, task_count_cache
 from app.infrastructure.repositories.task_repository_impl import TaskRepositoryImpl
 from app.infrastructure.datasource.build_filters_datasource import build_beanie_filter
 
+# Serialized pages of the task listing, outdated by every task write
+task_list_cache = VersionedCache(
+    get_cache_backend().namespaced("task_lists"),
+    ttl_seconds=get_settings().TASK_LIST_CACHE_TTL_SECONDS,
+    stale_ttl_seconds=get_settings().TASK_LIST_CACHE_STALE_TTL_SECONDS,
+    stale_timeout_seconds=get_settings().TASK_LIST_CACHE_STALE_TIMEOUT_SECONDS,
+    enabled=get_settings().TASK_LIST_CACHE_ENABLED,
+)
+
+# Rejected rows of the recent imports with the user who ran them, keyed by import ID
+task_import_reports = get_cache_backend().namespaced("task_imports")
+
 
 class TaskService:
     """_summary_
@@ -15,12 +39,33 @@ class TaskService:
 
     task_repository = TaskRepositoryImpl
 
-    def __init__(self) -> None:
+    def __init__(self, task_repository: TaskRepositoryImpl | None = None) -> None:
         """__init__ _summary_
 
-        _extended_summary_
+        :param task_repository: Repository to use, defaults to a Beanie backed one
+        :type task_repository: TaskRepositoryImpl | None
+        """
+        self.task_repository = task_repository or TaskRepositoryImpl(BeanieTaskDatasource())
+
+    @staticmethod
+    async def _invalidate_task_lists() -> None:
+        # Also run when a write fails, as a bulk write may have been partially applied
+        await asyncio.gather(task_list_cache.bump(), task_count_cache.bump())
+
+    async def get_task_list_response(self, cache_key: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        """get_task_list_response _summary_
+
+        Rendered page of the task listing, cached until the next task write in any worker or for
+        ``TASK_LIST_CACHE_TTL_SECONDS`` at most. Concurrent misses on a page render it once.
+
+        :param cache_key: Canonical key of the listing request
+        :type cache_key: str
+        :param render: Coroutine function reading and serializing the page
+        :type render: Callable[[], Awaitable[bytes]]
+        :return: Cached or freshly rendered page
+        :rtype: bytes
         """
-        self.task_repository = TaskRepositoryImpl(BeanieTaskDatasource())
+        return await task_list_cache.get_or_compute(cache_key, render)
 
     async def create_task(self, current_user: User, task_data: TaskCreate) -> TaskRead:
         """create_task _summary_
@@ -39,6 +84,142 @@ class TaskService:
             msg = f"[TaskService] - Task creation failed, error: {e}"
             logger.error(msg)
             raise
+        finally:
+            await self._invalidate_task_lists()
+
+    async def create_tasks(self, current_user: User, tasks_data: list[TaskCreate]) -> dict:
+        """create_tasks _summary_
+
+        Create many tasks in a single write, the items failing do not prevent the others from being created.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param tasks_data: _description_
+        :type tasks_data: list[TaskCreate]
+        :return: Number of created and failed tasks, along with the outcome of each item
+        :rtype: dict
+        """
+        try:
+            return await self.task_repository.create_tasks(current_user, tasks_data)
+        except Exception as e:
+            msg = f"[TaskService] - Bulk task creation failed, error: {e}"
+            logger.error(msg)
+            raise
+        finally:
+            await self._invalidate_task_lists()
+
+    async def _write_import_batch(
+        self,
+        current_user: User,
+        batch: list[ImportRecord],
+        known_user_ids: set[UUID],
+    ) -> list[tuple[int, str]]:
+        valid_records = [(line_number, task) for line_number, task, _ in batch if task is not None]
+        if not valid_records:
+            return []
+
+        try:
+            result = await self.task_repository.create_tasks(
+                current_user,
+                [task for _, task in valid_records],
+                known_user_ids,
+            )
+        finally:
+            await self._invalidate_task_lists()
+        return [(valid_records[item["index"]][0], item["error"]) for item in result["results"] if item["error"]]
+
+    async def import_tasks(
+        self,
+        current_user: User,
+        chunks: AsyncIterator[bytes],
+        import_format: ExportFormat,
+        *,
+        compressed: bool = False,
+    ) -> dict:
+        """import_tasks _summary_
+
+        Create the tasks of an upload while it is being received. Rows are validated as they are read and written
+        by batches of ``TASK_IMPORT_BATCH_SIZE``, the next batch being read while the previous one is written.
+        The assignees found are remembered for the whole import, so each one is looked up once at most.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param chunks: Raw chunks of the upload
+        :type chunks: AsyncIterator[bytes]
+        :param import_format: Format of the upload
+        :type import_format: ExportFormat
+        :param compressed: Whether the upload is gzipped
+        :type compressed: bool
+        :return: Summary of the import, the rejected rows are kept in ``task_import_reports`` for
+            ``TASK_IMPORT_REPORT_TTL_SECONDS``
+        :rtype: dict
+        """
+        settings = get_settings()
+        import_id = uuid4().hex
+        known_user_ids: set[UUID] = set()
+        errors: list[dict] = []
+        processed = failed = 0
+
+        def record_errors(line_errors: list[tuple[int, str]]) -> None:
+            nonlocal failed
+            failed += len(line_errors)
+            room = max(settings.TASK_IMPORT_MAX_REPORTED_ERRORS - len(errors), 0)
+            errors.extend({"line": line_number, "error": error} for line_number, error in line_errors[:room])
+
+        records = iter_import_records(
+            iter_lines(gunzip_chunks(chunks) if compressed else chunks),
+            import_format,
+        )
+        pending_write = None
+        try:
+            async for batch in iter_batches(records, settings.TASK_IMPORT_BATCH_SIZE):
+                processed += len(batch)
+                record_errors([(line_number, error) for line_number, task, error in batch if task is None])
+                if pending_write is not None:
+                    record_errors(await pending_write)
+                pending_write = asyncio.create_task(self._write_import_batch(current_user, batch, known_user_ids))
+
+            if pending_write is not None:
+                record_errors(await pending_write)
+        except Exception as e:
+            if pending_write is not None:
+                pending_write.cancel()
+            msg = f"[TaskService] - Task import failed after {processed} rows, error: {e}"
+            logger.error(msg)
+            raise
+
+        if errors:
+            report = {"owner_id": str(current_user.id), "errors": sorted(errors, key=lambda error: error["line"])}
+            await task_import_reports.set(
+                import_id,
+                json.dumps(report).encode(),
+                settings.TASK_IMPORT_REPORT_TTL_SECONDS,
+            )
+        return {
+            "import_id": import_id,
+            "processed": processed,
+            "created": processed - failed,
+            "failed": failed,
+            "errors_truncated": failed > len(errors),
+        }
+
+    async def get_import_report(self, current_user: User, import_id: str) -> list[dict] | None:
+        """get_import_report Rejected rows of a recent import run by ``current_user``.
+
+        :param current_user: User requesting the report
+        :type current_user: User
+        :param import_id: ID returned in the summary of the import
+        :type import_id: str
+        :return: Line number and reason of each rejected row, ``None`` when the report expired, never existed or
+            belongs to another user
+        :rtype: list[dict] | None
+        """
+        encoded_report = await task_import_reports.get(import_id)
+        if encoded_report is None:
+            return None
+
+        report = json.loads(encoded_report)
+        return report["errors"] if report["owner_id"] == str(current_user.id) else None
 
     async def list_my_assigned_tasks(self, current_user: User) -> list[TaskRead]:
         """list_my_assigned_tasks _summary_
@@ -51,33 +232,83 @@ class TaskService:
         :rtype: list[TaskRead]
         """
 
-    async def list_tasks(
+    async def list_tasks_page(
         self,
         task_filters: FilterCapabilities | None,
         task_sorts: list[str] | None,
-        page: int,
-        offset: int,
-    ) -> list[TaskRead]:
-        """list_tasks _summary_
+        page_params: PageParams,
+        *,
+        include_total: bool = True,
+    ) -> tuple[list[TaskRead], int | None, str | None]:
+        """list_tasks_page _summary_
 
-        _extended_summary_
+        Page of tasks along with the total number of tasks matching the filters, both queried concurrently, and
+        the cursor of the next page.
 
-        :return: _description_
-        :rtype: list[TaskRead]
+        :param page_params: Page, page size and cursor, ``page`` is ignored when a cursor is given
+        :type page_params: PageParams
+        :param include_total: Whether the total has to be computed, ``None`` is returned in its place otherwise
+        :type include_total: bool
+        :return: Tasks, total and next cursor
+        :rtype: tuple[list[TaskRead], int | None, str | None]
         """
         try:
-            tasks = await self.task_repository.list_tasks(
-                build_beanie_filter(task_filters) if task_filters else None,
+            beanie_filters = build_beanie_filter(task_filters) if task_filters else None
+            tasks_page = self.task_repository.list_tasks(
+                beanie_filters,
                 task_sorts,
-                page,
-                offset,
+                page_params.page,
+                page_params.offset,
+                page_params.cursor,
             )
-            return tasks
+            if include_total:
+                (tasks, next_cursor), total = await asyncio.gather(
+                    tasks_page,
+                    self.task_repository.count_tasks(beanie_filters),
+                )
+            else:
+                tasks, next_cursor = await tasks_page
+                total = None
+
+            return tasks, total, next_cursor
         except Exception as e:
             msg = f"[TaskService] - Task listing failed, error: {e}"
             logger.error(msg)
             raise
 
+    def export_tasks(
+        self,
+        task_filters: FilterCapabilities | None,
+        export_format: ExportFormat,
+        *,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """export_tasks _summary_
+
+        Stream every task matching the filters, encoded while it is read from the database. The filters are
+        built before the stream starts, so invalid ones are reported before any byte is sent.
+
+        :param task_filters: _description_
+        :type task_filters: FilterCapabilities | None
+        :param export_format: Format of the rows
+        :type export_format: ExportFormat
+        :param compress: Whether the export is gzipped
+        :type compress: bool
+        :return: Chunks of the export
+        :rtype: AsyncIterator[bytes]
+        """
+        try:
+            beanie_filters = build_beanie_filter(task_filters) if task_filters else None
+            return stream_task_export(
+                self.task_repository.iterate_tasks(beanie_filters),
+                export_format,
+                compress=compress,
+            )
+        except Exception as e:
+            msg = f"[TaskService] - Task export failed, error: {e}"
+            logger.error(msg)
+            raise
+
     async def get_task_by_id(self, task_id: str) -> TaskRead:
         """get_task_by_id _summary_
 
@@ -97,6 +328,64 @@ class TaskService:
             logger.error(msg)
             raise
 
+    async def get_tasks_by_ids(self, task_ids: list[UUID]) -> tuple[list[TaskRead], list[UUID]]:
+        """get_tasks_by_ids _summary_
+
+        Read many tasks in a single request, the users and sub tasks being resolved once for the whole batch.
+
+        :param task_ids: _description_
+        :type task_ids: list[UUID]
+        :return: Found tasks in the requested order, and the IDs that do not exist
+        :rtype: tuple[list[TaskRead], list[UUID]]
+        """
+        try:
+            return await self.task_repository.get_tasks_by_ids(task_ids)
+        except Exception as e:
+            msg = f"[TaskService] - Tasks retrieval failed, error: {e}"
+            logger.error(msg)
+            raise
+
+    async def get_task_version(self, task_id: str) -> datetime | None:
+        """get_task_version _summary_
+
+        Last modification date of a task, cheap enough to answer conditional reads before reading the task.
+
+        :param task_id: _description_
+        :type task_id: str
+        :return: ``None`` when the task does not exist
+        :rtype: datetime | None
+        """
+        try:
+            return await self.task_repository.get_task_version(task_id)
+        except Exception as e:
+            msg = f"[TaskService] - Task version retrieval failed, error: {e}"
+            logger.error(msg)
+            raise
+
+    async def get_task_list_version(self, task_filters: FilterCapabilities | None) -> tuple[datetime | None, int]:
+        """get_task_list_version _summary_
+
+        Latest modification date and number of the tasks matching the filters, queried concurrently. Any creation,
+        update or deletion among them changes one or the other, so conditional listings are answered before the
+        page is read.
+
+        :param task_filters: _description_
+        :type task_filters: FilterCapabilities | None
+        :return: Latest ``updated_at``, ``None`` when no task matches, and number of tasks
+        :rtype: tuple[datetime | None, int]
+        """
+        try:
+            beanie_filters = build_beanie_filter(task_filters) if task_filters else None
+            last_modified, count = await asyncio.gather(
+                self.task_repository.get_tasks_last_modified(beanie_filters),
+                self.task_repository.count_tasks(beanie_filters),
+            )
+            return last_modified, count
+        except Exception as e:
+            msg = f"[TaskService] - Task list version retrieval failed, error: {e}"
+            logger.error(msg)
+            raise
+
     async def find_task_by_name(self, name: str) -> TaskRead:
         """find_task_by_name _summary_
 
@@ -135,6 +424,8 @@ class TaskService:
             msg = f"[TaskService] - Task update failed, error: {e}"
             logger.error(msg)
             raise
+        finally:
+            await self._invalidate_task_lists()
 
     async def archive_task(self, task_id: str, current_user: User) -> TaskRead:
         """archive_task _summary_
@@ -147,12 +438,14 @@ class TaskService:
         :rtype: TaskRead
         """
         try:
-            task = await self.task_repository.update_task(current_user, task_id)
+            task = await self.task_repository.archive_task(current_user, task_id)
             return task
         except Exception as e:
             msg = f"[TaskService] - Task archiving failed, error: {e}"
             logger.error(msg)
             raise
+        finally:
+            await self._invalidate_task_lists()
 
     async def delete_task(self, task_id: str) -> TaskRead:
         """delete_task _summary_
@@ -171,3 +464,84 @@ class TaskService:
             msg = f"[TaskService] - Task deletion failed, error: {e}"
             logger.error(msg)
             raise
+        finally:
+            await self._invalidate_task_lists()
+
+    @staticmethod
+    def _build_selection_query(selection: BulkSelection) -> dict:
+        if selection.ids is not None:
+            return {"_id": {"$in": selection.ids}}
+        return build_beanie_filter(selection.filters)
+
+    async def update_tasks(self, current_user: User, selection: BulkSelection, task_data: TaskUpdate) -> dict:
+        """update_tasks _summary_
+
+        Apply the same update to every selected task in a single write.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param selection: IDs or filters selecting the tasks
+        :type selection: BulkSelection
+        :param task_data: _description_
+        :type task_data: TaskUpdate
+        :return: Number of matched and modified tasks
+        :rtype: dict
+        """
+        try:
+            return await self.task_repository.update_tasks(
+                current_user,
+                self._build_selection_query(selection),
+                task_data,
+            )
+        except Exception as e:
+            msg = f"[TaskService] - Bulk task update failed, error: {e}"
+            logger.error(msg)
+            raise
+        finally:
+            await self._invalidate_task_lists()
+
+    async def archive_tasks(self, current_user: User, selection: BulkSelection, *, is_archived: bool = True) -> dict:
+        """archive_tasks _summary_
+
+        Archive or restore every selected task in a single write.
+
+        :param current_user: _description_
+        :type current_user: User
+        :param selection: IDs or filters selecting the tasks
+        :type selection: BulkSelection
+        :param is_archived: Archived status to set
+        :type is_archived: bool
+        :return: Number of matched and modified tasks
+        :rtype: dict
+        """
+        try:
+            return await self.task_repository.update_tasks(
+                current_user,
+                self._build_selection_query(selection),
+                {"is_archived": is_archived},
+            )
+        except Exception as e:
+            msg = f"[TaskService] - Bulk task archiving failed, error: {e}"
+            logger.error(msg)
+            raise
+        finally:
+            await self._invalidate_task_lists()
+
+    async def delete_tasks(self, selection: BulkSelection) -> dict:
+        """delete_tasks _summary_
+
+        Delete every selected task in a single write.
+
+        :param selection: IDs or filters selecting the tasks
+        :type selection: BulkSelection
+        :return: Number of deleted tasks
+        :rtype: dict
+        """
+        try:
+            return await self.task_repository.delete_tasks(self._build_selection_query(selection))
+        except Exception as e:
+            msg = f"[TaskService] - Bulk task deletion failed, error: {e}"
+            logger.error(msg)
+            raise
+        finally:
+            await self._invalidate_task_lists()
@@ -1,11 +1,19 @@
+from app.core import get_settings
 from app.core.logger import logger
-from app.core.security import get_password, verify_password
+from app.core.security import get_password_async, verify_password_async
+from app.utils.lru_ttl_cache import LRUTTLCache
 from app.domain.entities.user import User
 from app.schemas.pydantic.user_schemas import UserRead, UserCreate, UserUpdate, UserUpdatePassword
 from app.infrastructure.mappers.user_mapper import to_entity_user_from_beanie_user
 from app.infrastructure.datasource.beanie_user_datasource import BeanieUserDatasource
 from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 
+# User entities resolved from access tokens, keyed by the token subject (the user id as string)
+authenticated_user_cache: LRUTTLCache[str, User] = LRUTTLCache(
+    max_size=get_settings().USER_CACHE_MAX_SIZE,
+    ttl_seconds=get_settings().USER_CACHE_TTL_SECONDS,
+)
+
 
 class UserService:
     """_summary_
@@ -20,12 +28,13 @@ class UserService:
 
     user_repository: UserRepositoryImpl
 
-    def __init__(self) -> None:
+    def __init__(self, user_repository: UserRepositoryImpl | None = None) -> None:
         """__init__ _summary_
 
-        _extended_summary_
+        :param user_repository: Repository to use, defaults to a Beanie backed one
+        :type user_repository: UserRepositoryImpl | None
         """
-        self.user_repository = UserRepositoryImpl(BeanieUserDatasource())
+        self.user_repository = user_repository or UserRepositoryImpl(BeanieUserDatasource())
 
     # async def validate_user_data(self, user_data: UserCreate) -> None:
     #     if not user_data.email or not user_data.password:
@@ -92,7 +101,7 @@ class UserService:
         try:
             user = await self.user_repository.find_user_by_email(email)
 
-            if not user or not verify_password(password, user.hashed_password):
+            if not user or not await verify_password_async(password, user.hashed_password):
                 logger.warning(f"[UserService] - Failed authentication attempt for: {email}")
                 raise ValueError("Invalid credentials")  # noqa: TRY301
 
@@ -141,16 +150,18 @@ class UserService:
             if not user:
                 raise ValueError("User not found")  # noqa: TRY301
 
-            if not verify_password(new_password_payload.current_password, user.hashed_password):
+            if not await verify_password_async(new_password_payload.current_password, user.hashed_password):
                 logger.warning(f"[UserService] - Failed password update attempt for: {user.email}")
                 raise ValueError("Invalid old password")  # noqa: TRY301
             if new_password_payload.new_password != new_password_payload.new_password_confirm:
                 logger.warning(f"[UserService] - Passwords do not match for: {user.email}")
                 raise ValueError("Passwords do not match")  # noqa: TRY301
 
-            user.hashed_password = get_password(new_password_payload.new_password)
+            user.hashed_password = await get_password_async(new_password_payload.new_password)
 
-            return await self.user_repository.update_user(user_id, to_entity_user_from_beanie_user(user))
+            updated_user = await self.user_repository.update_user(user_id, to_entity_user_from_beanie_user(user))
+            authenticated_user_cache.invalidate(str(user_id))
+            return updated_user
         except Exception as e:
             msg = f"[UserService] - User password update failed, error: {e}"
             logger.error(msg)
@@ -159,6 +170,7 @@ class UserService:
     async def update_user(self, user_id: str, user_data: UserUpdate) -> UserRead:
         try:
             updated_user = await self.user_repository.update_user(user_id, user_data)
+            authenticated_user_cache.invalidate(str(user_id))
             return updated_user
         except Exception as e:
             msg = f"[UserService] - User update failed, error: {e}"
@@ -176,7 +188,9 @@ class UserService:
         :rtype: bool
         """
         try:
-            return await self.user_repository.delete_user(user_id)
+            is_active = await self.user_repository.delete_user(user_id)
+            authenticated_user_cache.invalidate(str(user_id))
+            return is_active
         except Exception as e:
             msg = f"[UserService] - User deletion/restore failed, error: {e}"
             logger.error(msg)
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """ExportFormat _summary_
+
+    Formats the tasks can be exported to.
+
+    :param str: _description_
+    :type str: _type_
+    :param Enum: _description_
+    :type Enum: _type_
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
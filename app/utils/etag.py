@@ -0,0 +1,33 @@
+import json
+import hashlib
+
+
+def build_etag(*parts: object) -> str:
+    """build_etag Strong entity tag of a representation, derived from the values it depends on.
+
+    :param parts: Values identifying the representation, e.g. its last modification date
+    :type parts: object
+    :return: Quoted entity tag, ready to be sent in the ``ETag`` header
+    :rtype: str
+    """
+    encoded_parts = json.dumps(parts, default=str, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(encoded_parts.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """etag_matches Whether the ``If-None-Match`` header of a request lists ``etag``.
+
+    The comparison is the weak one required for ``If-None-Match``, so ``W/`` prefixes are ignored.
+
+    :param if_none_match: Value of the ``If-None-Match`` header
+    :type if_none_match: str | None
+    :param etag: Current entity tag of the representation
+    :type etag: str
+    :return: ``True`` when the client already holds the current representation
+    :rtype: bool
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
@@ -0,0 +1,128 @@
+from time import monotonic
+from typing import Generic, TypeVar
+from collections import OrderedDict
+from collections.abc import Hashable
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUTTLCache(Generic[K, V]):
+    """LRUTTLCache
+
+    Bounded in-process cache: entries expire ``ttl_seconds`` after being stored and, once ``max_size`` is
+    reached, the least recently used entry is evicted. Meant to be used from the event loop thread only.
+
+    :param Generic: Key and value types
+    :type Generic: _type_
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float | None = None) -> None:
+        """__init__ _summary_
+
+        :param max_size: Maximum number of entries, ``0`` disables the cache
+        :type max_size: int
+        :param ttl_seconds: Lifetime of an entry, ``None`` keeps entries until they are evicted
+        :type ttl_seconds: float | None
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """__len__ Number of stored entries, expired ones included until they are looked up."""
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        """__contains__ Whether ``key`` holds a live entry, without touching the counters."""
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_expired(entry)
+
+    def _is_expired(self, entry: tuple[V, float | None]) -> bool:
+        expires_at = entry[1]
+        return expires_at is not None and expires_at <= monotonic()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the live value stored for ``key`` and mark it as recently used.
+
+        :param key: Cache key
+        :type key: K
+        :param default: Value returned on a miss
+        :type default: V | None
+        :return: Cached value or ``default``
+        :rtype: V | None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        if self._is_expired(entry):
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries if needed.
+
+        :param key: Cache key
+        :type key: K
+        :param value: Value to store
+        :type value: V
+        :param ttl_seconds: Overrides the cache lifetime for this entry
+        :type ttl_seconds: float | None
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        self._entries[key] = (value, monotonic() + ttl if ttl is not None else None)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        """Drop the entry stored for ``key``.
+
+        :param key: Cache key
+        :type key: K
+        :return: Whether an entry was dropped
+        :rtype: bool
+        """
+        return self._entries.pop(key, None) is not None
+
+    def values(self) -> list[V]:
+        """Live values, from the least to the most recently used, without touching the counters."""
+        return [entry[0] for entry in self._entries.values() if not self._is_expired(entry)]
+
+    def clear(self) -> None:
+        """Drop every entry, the counters are kept."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float | None]:
+        """Usage counters of the cache.
+
+        :return: Hits, misses, evictions, expirations, size and hit ratio
+        :rtype: dict[str, int | float | None]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
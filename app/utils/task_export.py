@@ -0,0 +1,138 @@
+import io
+import csv
+import json
+import zlib
+from datetime import datetime
+from collections.abc import AsyncIterator
+
+from app.utils.enums.export_format_enum import ExportFormat
+
+# Columns of the export, in order
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "is_archived",
+    "due_date",
+    "assigned_to",
+    "sub_tasks",
+    "created_by",
+    "created_at",
+    "updated_by",
+    "updated_at",
+)
+
+USER_REFERENCE_FIELDS = ("assigned_to", "created_by", "updated_by")
+
+# Rows are buffered up to this size before being sent, to avoid one network write per task
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _to_text(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
+
+
+def flatten_task_document(task_document: dict) -> dict:
+    """flatten_task_document Raw task document turned into an export row.
+
+    Users are exported by their ID, as resolving them would mean one lookup per batch for data the reports
+    rarely need.
+
+    :param task_document: Raw task document projected to the ``TaskRead`` fields
+    :type task_document: dict
+    :return: Row with the ``EXPORT_FIELDS`` as keys and JSON compatible values
+    :rtype: dict
+    """
+    row = {field: _to_text(task_document.get(field)) for field in EXPORT_FIELDS}
+    row["id"] = _to_text(task_document.get("_id"))
+    for field in USER_REFERENCE_FIELDS:
+        reference = task_document.get(field)
+        row[field] = _to_text(reference.id) if reference is not None else None
+    row["sub_tasks"] = [
+        {"id": _to_text(sub_task.get("id")), "relation_type": _to_text(sub_task.get("relation_type"))}
+        for sub_task in task_document.get("sub_tasks") or []
+    ]
+    return row
+
+
+async def _ndjson_rows(task_documents: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for task_document in task_documents:
+        yield json.dumps(flatten_task_document(task_document), ensure_ascii=False) + "\n"
+
+
+async def _csv_rows(task_documents: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def write_row(values: list) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield write_row(list(EXPORT_FIELDS))
+    async for task_document in task_documents:
+        row = flatten_task_document(task_document)
+        row["sub_tasks"] = ";".join(f"{sub_task['id']}:{sub_task['relation_type']}" for sub_task in row["sub_tasks"])
+        yield write_row([row[field] for field in EXPORT_FIELDS])
+
+
+async def _chunked(rows: AsyncIterator[str], chunk_size: int) -> AsyncIterator[bytes]:
+    chunk = []
+    size = 0
+    async for row in rows:
+        encoded_row = row.encode()
+        chunk.append(encoded_row)
+        size += len(encoded_row)
+        if size >= chunk_size:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def _gzipped(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # ``wbits=31`` writes the gzip header and trailer, so the output is a regular ``.gz`` file
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk)
+        if compressed_chunk:
+            yield compressed_chunk
+    yield compressor.flush()
+
+
+def stream_task_export(
+    task_documents: AsyncIterator[dict],
+    export_format: ExportFormat,
+    *,
+    compress: bool = False,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """stream_task_export Encode the tasks on the fly, keeping in memory one chunk at most whatever the export size.
+
+    :param task_documents: Raw task documents, as yielded by the database cursor
+    :type task_documents: AsyncIterator[dict]
+    :param export_format: Format of the rows
+    :type export_format: ExportFormat
+    :param compress: Whether the output is gzipped
+    :type compress: bool
+    :param chunk_size: Size from which the buffered rows are sent
+    :type chunk_size: int
+    :return: Chunks of the export
+    :rtype: AsyncIterator[bytes]
+    """
+    rows = _csv_rows(task_documents) if export_format == ExportFormat.CSV else _ndjson_rows(task_documents)
+    chunks = _chunked(rows, chunk_size)
+    return _gzipped(chunks) if compress else chunks
@@ -0,0 +1,149 @@
+import csv
+import zlib
+import codecs
+from collections.abc import AsyncIterator
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.pydantic.task_schemas import TaskCreate
+from app.utils.enums.export_format_enum import ExportFormat
+
+task_create_adapter = TypeAdapter(TaskCreate)
+
+# Outcome of one row: its line number, the validated task or the reason why it was rejected
+ImportRecord = tuple[int, TaskCreate | None, str | None]
+
+
+async def gunzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """gunzip_chunks Decompress a gzipped stream chunk by chunk.
+
+    :param chunks: Gzipped chunks
+    :type chunks: AsyncIterator[bytes]
+    :return: Decompressed chunks
+    :rtype: AsyncIterator[bytes]
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    async for chunk in chunks:
+        decompressed_chunk = decompressor.decompress(chunk)
+        if decompressed_chunk:
+            yield decompressed_chunk
+    remaining = decompressor.flush()
+    if remaining:
+        yield remaining
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """iter_lines Split a UTF-8 byte stream into lines, holding at most one partial line between chunks.
+
+    :param chunks: Raw chunks of the body
+    :type chunks: AsyncIterator[bytes]
+    :return: Lines without their line break
+    :rtype: AsyncIterator[str]
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(location) for location in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors(include_url=False)
+    )
+
+
+async def _ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[ImportRecord]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_number, task_create_adapter.validate_json(line), None
+        except ValidationError as error:
+            yield line_number, None, _validation_message(error)
+
+
+def _parse_sub_tasks(value: str) -> list[dict]:
+    # Same ``id:relation_type;...`` layout as the CSV export
+    sub_tasks = []
+    for sub_task in value.split(";"):
+        if sub_task:
+            sub_task_id, _, relation_type = sub_task.partition(":")
+            sub_tasks.append({"id": sub_task_id, **({"relation_type": relation_type} if relation_type else {})})
+    return sub_tasks
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[ImportRecord]:
+    header = None
+    line_number = 0
+    record_line_number = 0
+    pending_record = ""
+    async for line in lines:
+        line_number += 1
+        if not pending_record:
+            record_line_number = line_number
+        pending_record = f"{pending_record}\n{line}" if pending_record else line
+        # A quoted value spreading over several lines is complete once its quotes are balanced
+        if pending_record.count('"') % 2:
+            continue
+
+        record, pending_record = pending_record, ""
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = values
+            continue
+
+        row = {field: value for field, value in zip(header, values, strict=False) if value != ""}
+        if "sub_tasks" in row:
+            row["sub_tasks"] = _parse_sub_tasks(row["sub_tasks"])
+        try:
+            yield record_line_number, task_create_adapter.validate_python(row), None
+        except ValidationError as error:
+            yield record_line_number, None, _validation_message(error)
+
+    if pending_record:
+        yield record_line_number, None, "Unterminated quoted value"
+
+
+def iter_import_records(lines: AsyncIterator[str], import_format: ExportFormat) -> AsyncIterator[ImportRecord]:
+    """iter_import_records Validate every row of an upload against ``TaskCreate`` as it is read.
+
+    :param lines: Lines of the upload
+    :type lines: AsyncIterator[str]
+    :param import_format: Format of the upload, CSV files start with a header row
+    :type import_format: ExportFormat
+    :return: Line number of each row with either the validated task or the validation errors
+    :rtype: AsyncIterator[ImportRecord]
+    """
+    return _csv_records(lines) if import_format == ExportFormat.CSV else _ndjson_records(lines)
+
+
+async def iter_batches(records: AsyncIterator[ImportRecord], batch_size: int) -> AsyncIterator[list[ImportRecord]]:
+    """iter_batches Group the records in lists of ``batch_size``.
+
+    :param records: Records to group
+    :type records: AsyncIterator[ImportRecord]
+    :param batch_size: Maximum number of records per batch
+    :type batch_size: int
+    :return: Batches of records
+    :rtype: AsyncIterator[list[ImportRecord]]
+    """
+    batch = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,144 @@
+import json
+import asyncio
+import hashlib
+from collections.abc import Callable, Awaitable
+
+from app.core.cache import CacheBackend
+
+# Counter of the writes, every entry is stored under the value it had when its computation started
+VERSION_KEY = "version"
+
+
+def canonical_key(*parts: object) -> str:
+    """canonical_key Hash of ``parts`` that does not depend on the order of their keys.
+
+    :param parts: JSON compatible values identifying the cached entry
+    :type parts: object
+    :return: Hexadecimal digest
+    :rtype: str
+    """
+    encoded_parts = json.dumps(parts, default=str, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded_parts.encode()).hexdigest()
+
+
+class VersionedCache:
+    """VersionedCache
+
+    Cache of computed bytes tagged with the version that was current when their computation started. The version
+    is a counter of the shared ``CacheBackend`` read on every lookup, so ``bump`` outdates every entry at once for
+    every worker, without walking them. Concurrent misses on a key share a single computation. When
+    ``stale_timeout_seconds`` is set, the last value computed for a key is kept for ``stale_ttl_seconds`` and
+    served if the computation takes longer than that, the computation going on in the background to refresh it.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        stale_ttl_seconds: float = 0,
+        stale_timeout_seconds: float = 0,
+        *,
+        enabled: bool = True,
+    ) -> None:
+        """__init__ Cache over ``backend``.
+
+        :param backend: Store of the version and the entries, usually a namespaced view of ``get_cache_backend``
+        :type backend: CacheBackend
+        :param ttl_seconds: Lifetime of an up to date entry
+        :type ttl_seconds: float
+        :param stale_ttl_seconds: Age up to which an outdated entry may still be served
+        :type stale_ttl_seconds: float
+        :param stale_timeout_seconds: Time waited for the computation before serving an outdated entry, ``0``
+            never serves them
+        :type stale_timeout_seconds: float
+        :param enabled: Whether values are cached at all, they are computed on every lookup otherwise
+        :type enabled: bool
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds if stale_timeout_seconds > 0 else 0
+        self.stale_timeout_seconds = stale_timeout_seconds
+        self.enabled = enabled
+        self.version = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def current_version(self) -> int:
+        """current_version Version shared by every worker, ``0`` until the first write.
+
+        :return: Current version
+        :rtype: int
+        """
+        version = await self.backend.get(VERSION_KEY)
+        self.version = int(version) if version is not None else 0
+        return self.version
+
+    async def bump(self) -> int:
+        """bump Outdate every entry stored so far, in every worker.
+
+        :return: New version
+        :rtype: int
+        """
+        self.version = await self.backend.incr(VERSION_KEY)
+        return self.version
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> bytes:
+        value = await compute()
+        if self.stale_ttl_seconds:
+            await self.backend.set(f"stale:{key}", value, self.stale_ttl_seconds)
+        return value
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> bytes:
+        """get_or_compute Up to date value of ``key``, computed on a miss.
+
+        :param key: Cache key, e.g. built by ``canonical_key``
+        :type key: str
+        :param compute: Coroutine function computing the value
+        :type compute: Callable[[], Awaitable[bytes]]
+        :return: Cached or computed value
+        :rtype: bytes
+        """
+        if not self.enabled:
+            return await compute()
+
+        # Keyed by version, so a lookup following a write never reads nor joins a computation started before it
+        entry_key = f"{await self.current_version()}:{key}"
+        stale_key = f"stale:{key}"
+        entry, *stale_entries = await self.backend.mget(
+            [entry_key, stale_key] if self.stale_ttl_seconds else [entry_key],
+        )
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        computation = asyncio.ensure_future(
+            self.backend.get_or_set(entry_key, lambda: self._compute(key, compute), self.ttl_seconds),
+        )
+        stale_entry = stale_entries[0] if stale_entries else None
+        if stale_entry is None:
+            return await computation
+
+        # Retrieved here as nobody may await the computation anymore once an outdated entry was served
+        computation.add_done_callback(lambda done: done.cancelled() or done.exception())
+        try:
+            return await asyncio.wait_for(asyncio.shield(computation), self.stale_timeout_seconds)
+        except TimeoutError:
+            self.stale_hits += 1
+            return stale_entry
+
+    def stats(self) -> dict[str, int | float | None]:
+        """stats Usage counters of the cache in this worker.
+
+        :return: Hits, outdated entries served, misses, last version read and hit ratio
+        :rtype: dict[str, int | float | None]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "version": self.version,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
@@ -1,12 +1,19 @@
+import asyncio
 from uuid import uuid4
+from datetime import UTC, datetime
 
 import pytest
 from pytest_mock import MockFixture
 from fastapi.testclient import TestClient
 
+from app.main import app
 from app.domain.entities.task import Task
 from app.domain.entities.user import User
+from app.services.task_service import TaskService, task_list_cache
 from app.domain.entities.task_enum import Priority, TaskStatus
+from app.api.routers.dependencies.user_deps import get_current_user
+from app.api.routers.dependencies.service_deps import get_task_service
+from app.infrastructure.models.odm.beanie_task_model import SubTaskNotFoundError
 
 
 @pytest.fixture
@@ -42,3 +49,238 @@ def test_create_task_protected(
     )
     assert response.status_code == 200
     assert response.json()
+
+
+def test_create_task_with_unknown_sub_tasks_is_rejected(
+    test_client: TestClient,
+    mock_user: User,
+    mocker: MockFixture,
+) -> None:
+    unknown_id = uuid4()
+    service = mocker.Mock()
+    service.create_task = mocker.AsyncMock(side_effect=SubTaskNotFoundError([unknown_id]))
+    app.dependency_overrides[get_task_service] = lambda: service
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+
+    try:
+        response = test_client.post(
+            "/api/v1/task/create",
+            json={"title": "Parent", "description": "Dangling sub task", "sub_tasks": [{"id": str(unknown_id)}]},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
+    assert str(unknown_id) in response.json()["detail"]
+    assert response.headers["x-error"] == "Sub tasks not found"
+
+
+def test_read_many_returns_found_and_missing_tasks(
+    test_client: TestClient,
+    mock_user: User,
+    mocker: MockFixture,
+) -> None:
+    found_id, missing_id = uuid4(), uuid4()
+    service = mocker.Mock()
+    service.get_tasks_by_ids = mocker.AsyncMock(
+        return_value=(
+            [
+                {
+                    "id": found_id,
+                    "title": "Found",
+                    "description": "Found task",
+                    "created_by": mock_user.model_dump(),
+                },
+            ],
+            [missing_id],
+        ),
+    )
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides[get_task_service] = lambda: service
+
+    try:
+        response = test_client.post("/api/v1/task/read-many", json={"ids": [str(found_id), str(missing_id)]})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    service.get_tasks_by_ids.assert_awaited_once_with([found_id, missing_id])
+    result = response.json()["result"]
+    assert [task["id"] for task in result["tasks"]] == [str(found_id)]
+    assert result["missing"] == [str(missing_id)]
+
+
+def test_export_streams_the_tasks(test_client: TestClient, mock_user: User, mocker: MockFixture) -> None:
+    async def chunks():
+        yield b'{"id": "1"}\n'
+        yield b'{"id": "2"}\n'
+
+    service = mocker.Mock()
+    service.export_tasks = mocker.Mock(return_value=chunks())
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides[get_task_service] = lambda: service
+
+    try:
+        response = test_client.get(
+            "/api/v1/task/export",
+            params={"filters": '{"fields": {"priority": {"value": 1, "operator": "eq"}}, "logical_operator": "and"}'},
+        )
+        invalid_response = test_client.get("/api/v1/task/export", params={"filters": '{"fields": "nope"}'})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="tasks.ndjson"'
+    assert response.text.splitlines() == ['{"id": "1"}', '{"id": "2"}']
+    assert service.export_tasks.call_args.args[0].fields.priority.value == 1
+    assert invalid_response.status_code == 422
+
+
+def test_import_reports_the_rejected_rows(test_client: TestClient, mock_user: User, mocker: MockFixture) -> None:
+    received = []
+
+    async def import_tasks(current_user, chunks, import_format, *, compressed):  # noqa: ARG001
+        received.extend([chunk async for chunk in chunks])
+        return {"import_id": "abc", "processed": 2, "created": 1, "failed": 1, "errors_truncated": False}
+
+    service = mocker.Mock()
+    service.import_tasks = import_tasks
+    service.get_import_report = mocker.AsyncMock(side_effect=[[{"line": 2, "error": "title: Field required"}], None])
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides[get_task_service] = lambda: service
+
+    try:
+        response = test_client.post(
+            "/api/v1/task/import",
+            params={"format": "csv"},
+            content=b"title,description\r\nOne,First\r\n,Second\r\n",
+            headers={"Content-Type": "text/csv"},
+        )
+        report_response = test_client.get(response.json()["result"]["error_report"])
+        expired_response = test_client.get("/api/v1/task/import/abc/errors")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert b"".join(received) == b"title,description\r\nOne,First\r\n,Second\r\n"
+    assert response.json()["result"]["error_report"] == "/api/v1/task/import/abc/errors"
+    assert report_response.status_code == 200
+    assert report_response.text.splitlines() == ["line,error", "2,title: Field required"]
+    assert expired_response.status_code == 404
+    assert service.get_import_report.await_args.args == (mock_user, "abc")
+
+
+def test_read_answers_304_from_the_task_version(
+    test_client: TestClient,
+    mock_user: User,
+    mocker: MockFixture,
+) -> None:
+    task_id = str(uuid4())
+    updated_at = datetime(2025, 1, 2, tzinfo=UTC)
+    service = mocker.Mock()
+    service.get_task_version = mocker.AsyncMock(return_value=updated_at)
+    service.get_task_by_id = mocker.AsyncMock(
+        return_value={
+            "id": task_id,
+            "title": "Polled",
+            "description": "Polled task",
+            "created_by": {
+                "username": mock_user.username,
+                "email": mock_user.email,
+                "first_name": mock_user.first_name,
+                "last_name": mock_user.last_name,
+            },
+            "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+            "updated_at": updated_at,
+        },
+    )
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides[get_task_service] = lambda: service
+
+    try:
+        response = test_client.get(f"/api/v1/task/read/{task_id}")
+        etag = response.headers["etag"]
+        not_modified_response = test_client.get(f"/api/v1/task/read/{task_id}", headers={"If-None-Match": etag})
+        stale_response = test_client.get(f"/api/v1/task/read/{task_id}", headers={"If-None-Match": '"stale"'})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    service.get_task_version.assert_awaited_with(task_id)
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.headers["etag"] == etag
+    assert not_modified_response.content == b""
+    assert stale_response.status_code == 200
+    assert stale_response.headers["etag"] == etag
+    assert service.get_task_by_id.await_count == 2
+
+
+@pytest.mark.parametrize("params", [{"offset": 0}, {"offset": 101}, {"page": -1}])
+def test_list_rejects_out_of_range_pages(test_client: TestClient, mocker: MockFixture, params: dict) -> None:
+    service = mocker.Mock()
+    app.dependency_overrides[get_task_service] = lambda: service
+
+    try:
+        response = test_client.post("/api/v1/task/list", params=params)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
+    service.list_tasks_page.assert_not_called()
+
+
+def test_list_pages_are_cached_until_a_task_write(test_client: TestClient, mocker: MockFixture) -> None:
+    repository = mocker.Mock()
+    repository.count_tasks = mocker.AsyncMock(return_value=0)
+    repository.get_tasks_last_modified = mocker.AsyncMock(return_value=datetime(2025, 1, 1, tzinfo=UTC))
+    repository.list_tasks = mocker.AsyncMock(return_value=([], None))
+    repository.delete_task = mocker.AsyncMock()
+    service = TaskService(repository)
+    app.dependency_overrides[get_task_service] = lambda: service
+    body = {"filters": {"fields": {"priority": {"value": 1, "operator": "eq"}}, "logical_operator": "and"}}
+    asyncio.run(task_list_cache.bump())
+
+    try:
+        response = test_client.post("/api/v1/task/list", json=body)
+        etag = response.headers["etag"]
+        cached_response = test_client.post("/api/v1/task/list", json=body)
+        not_modified_response = test_client.post("/api/v1/task/list", json=body, headers={"If-None-Match": etag})
+        assert repository.list_tasks.await_count == 1
+
+        next_page_response = test_client.post(
+            "/api/v1/task/list",
+            json=body,
+            params={"page": 1},
+            headers={"If-None-Match": etag},
+        )
+        assert repository.list_tasks.await_count == 2
+
+        # The write outdates the cached page, but the tasks of the listing are unchanged
+        asyncio.run(service.delete_task(str(uuid4())))
+        unchanged_response = test_client.post("/api/v1/task/list", json=body, headers={"If-None-Match": etag})
+        assert repository.list_tasks.await_count == 2
+
+        repository.count_tasks.return_value = 1
+        asyncio.run(service.delete_task(str(uuid4())))
+        modified_response = test_client.post("/api/v1/task/list", json=body, headers={"If-None-Match": etag})
+
+        uncounted_response = test_client.post("/api/v1/task/list", json=body, params={"include_total": False})
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(task_list_cache.bump())
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 0, "data": [], "next_cursor": None}
+    assert repository.list_tasks.await_count == 4
+    assert cached_response.content == response.content
+    assert cached_response.headers["etag"] == etag
+    # Conditional requests are answered from the validator, before the page is read
+    assert not_modified_response.status_code == 304
+    assert unchanged_response.status_code == 304
+    assert next_page_response.status_code == 200
+    assert modified_response.status_code == 200
+    assert modified_response.json()["total"] == 1
+    assert modified_response.headers["etag"] != etag
+    assert uncounted_response.json()["total"] is None
+    assert repository.get_tasks_last_modified.await_count == 7
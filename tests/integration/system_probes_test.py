@@ -0,0 +1,90 @@
+from pytest_mock import MockFixture
+from fastapi.testclient import TestClient
+
+from app.core import get_settings
+from app.main import app
+from app.core.settings import Settings
+from app.core.mongo_client import mongo_client_manager
+from app.api.routers.dependencies.user_deps import get_current_user
+
+
+def test_livez_touches_nothing(test_client: TestClient, mocker: MockFixture) -> None:
+    ping = mocker.patch.object(mongo_client_manager, "cached_ping")
+
+    response = test_client.get("/livez")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+    ping.assert_not_called()
+
+
+def test_readyz_is_unavailable_when_database_is_unreachable(test_client: TestClient, mocker: MockFixture) -> None:
+    mocker.patch.object(mongo_client_manager, "cached_ping", return_value="Not reachable")
+    app.dependency_overrides[get_settings] = lambda: Settings(DB_TYPE="mongodb")
+
+    try:
+        response = test_client.get("/readyz")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 503
+    assert response.json()["database_connection"] == "Not reachable"
+
+
+def test_readyz_is_unavailable_when_pool_is_exhausted(test_client: TestClient, mocker: MockFixture) -> None:
+    mocker.patch.object(mongo_client_manager, "cached_ping", return_value="Up")
+    mocker.patch.object(mongo_client_manager, "is_pool_exhausted", return_value=True)
+
+    response = test_client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["database_pool_exhausted"] is True
+
+
+def test_readyz_is_ready(test_client: TestClient, mocker: MockFixture) -> None:
+    mocker.patch.object(mongo_client_manager, "cached_ping", return_value="Up")
+    mocker.patch.object(mongo_client_manager, "is_pool_exhausted", return_value=False)
+
+    response = test_client.get("/readyz")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_slow_queries_requires_authentication(test_client: TestClient) -> None:
+    response = test_client.get("/api/v1/admin/slow-queries")
+
+    assert response.status_code == 401
+
+
+def test_slow_queries_lists_top_shapes(test_client: TestClient, mocker: MockFixture) -> None:
+    top_slow_shapes = mocker.patch.object(
+        mongo_client_manager.query_listener,
+        "top_slow_shapes",
+        return_value=[{"command": "find", "collection": "tasks", "slow_count": 3}],
+    )
+    app.dependency_overrides[get_current_user] = lambda: mocker.Mock()
+    app.dependency_overrides[get_settings] = lambda: Settings(ADMIN_ENDPOINTS_ENABLED=True)
+
+    try:
+        response = test_client.get("/api/v1/admin/slow-queries", params={"limit": 5})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["shapes"][0]["slow_count"] == 3
+    top_slow_shapes.assert_called_once_with(5)
+
+
+def test_slow_queries_are_hidden_when_disabled(test_client: TestClient, mocker: MockFixture) -> None:
+    top_slow_shapes = mocker.patch.object(mongo_client_manager.query_listener, "top_slow_shapes")
+    app.dependency_overrides[get_current_user] = lambda: mocker.Mock()
+    app.dependency_overrides[get_settings] = lambda: Settings(ADMIN_ENDPOINTS_ENABLED=False)
+
+    try:
+        response = test_client.get("/api/v1/admin/slow-queries")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 404
+    top_slow_shapes.assert_not_called()
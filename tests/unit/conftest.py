@@ -0,0 +1,33 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from app.domain.entities.user import User
+from tests.__mocks__.test_users_mocks import DEFAULT_TEST_USER
+from app.infrastructure.models.odm.beanie_task_model import BeanieTask
+from app.infrastructure.models.odm.beanie_user_model import BeanieUser
+
+
+@pytest.fixture
+def current_user() -> User:
+    return User(
+        username=DEFAULT_TEST_USER["username"],
+        email=DEFAULT_TEST_USER["email"],
+        first_name=DEFAULT_TEST_USER["first_name"],
+        last_name=DEFAULT_TEST_USER["last_name"],
+        hashed_password="hashed_password",
+    )
+
+
+@pytest.fixture
+def task_collection(mocker: MockerFixture):
+    collection = mocker.Mock()
+    mocker.patch.object(BeanieTask, "get_motor_collection", return_value=collection)
+    return collection
+
+
+@pytest.fixture
+def user_collection(mocker: MockerFixture):
+    collection = mocker.Mock()
+    collection.find.return_value.to_list = mocker.AsyncMock(return_value=[])
+    mocker.patch.object(BeanieUser, "get_motor_collection", return_value=collection)
+    return collection
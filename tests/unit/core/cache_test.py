@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.core.cache import CacheBackend, RedisCacheBackend, MemoryCacheBackend, get_cache_backend
+from app.services.task_service import task_list_cache, task_import_reports
+from app.infrastructure.datasource.beanie_task_datasource import task_count_cache
+
+
+@pytest.fixture
+def backend() -> MemoryCacheBackend:
+    return MemoryCacheBackend(max_size=100, namespace="app")
+
+
+async def exercise_backend(backend: CacheBackend) -> None:
+    tasks = backend.namespaced("tasks")
+    users = backend.namespaced("users")
+
+    await tasks.set("page", b"\x00tasks")
+    await users.set("page", b"users", ttl_seconds=60)
+
+    assert await tasks.get("page") == b"\x00tasks"
+    assert await tasks.mget(["page", "missing"]) == [b"\x00tasks", None]
+    assert await users.get("page") == b"users"
+    assert await backend.get("page") is None
+
+    assert await tasks.incr("version") == 1
+    assert await tasks.incr("version", 4) == 5
+    assert await users.incr("version") == 1
+
+    assert await tasks.delete("page", "missing") == 1
+    assert await tasks.get("page") is None
+    assert await backend.ping() == "Up"
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_operations_and_namespaces(backend: MemoryCacheBackend) -> None:
+    await exercise_backend(backend)
+
+    stats = backend.stats()
+    assert stats["backend"] == "memory"
+    assert stats["status"] == "Up"
+    assert stats["hits"] == 3
+    assert stats["misses"] == 3
+    assert stats["hit_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_their_ttl(backend: MemoryCacheBackend) -> None:
+    await backend.set("short", b"value", ttl_seconds=0.01)
+    await asyncio.sleep(0.02)
+
+    assert await backend.get("short") is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_computes_a_missing_value_once(backend: MemoryCacheBackend) -> None:
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"computed"
+
+    views = [backend.namespaced("shared") for _ in range(5)]
+    results = await asyncio.gather(*(view.get_or_set("key", compute, ttl_seconds=60) for view in views))
+
+    assert results == [b"computed"] * 5
+    assert calls == 1
+    assert await backend.namespaced("shared").get("key") == b"computed"
+    assert await backend.namespaced("shared").get("key:lock") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_lock_taken_over_by_another_process_is_kept() -> None:
+    backend = MemoryCacheBackend(max_size=100, namespace="app", lock_ttl_seconds=0.01)
+
+    async def compute() -> bytes:
+        await asyncio.sleep(0.02)
+        # Meanwhile the lock expired and another process took it
+        assert await backend._set("app:key:lock", b"other", 60, only_if_missing=True)
+        return b"computed"
+
+    assert await backend.get_or_set("key", compute) == b"computed"
+    assert await backend.get("key:lock") == b"other"
+
+
+@pytest.mark.asyncio
+async def test_redis_lock_is_released_only_by_its_holder(mocker: MockerFixture) -> None:
+    client = mocker.Mock()
+    client.mget = mocker.AsyncMock(return_value=[None])
+    client.set = mocker.AsyncMock(return_value=True)
+    client.eval = mocker.AsyncMock(return_value=1)
+    client.delete = mocker.AsyncMock()
+    backend = RedisCacheBackend(namespace="app", client=client)
+
+    assert await backend.get_or_set("key", mocker.AsyncMock(return_value=b"computed")) == b"computed"
+
+    lock_call = client.set.await_args_list[0]
+    script, key_count, lock_key, lock_token = client.eval.await_args.args
+    assert 'redis.call("get", KEYS[1]) == ARGV[1]' in script
+    assert (key_count, lock_key, lock_token) == (1, "app:key:lock", lock_call.args[1])
+    assert lock_call.args[0] == "app:key:lock"
+    client.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_store_behaves_as_an_empty_cache(mocker: MockerFixture) -> None:
+    client = mocker.Mock()
+    client.mget = mocker.AsyncMock(side_effect=ConnectionError("refused"))
+    client.set = mocker.AsyncMock(side_effect=ConnectionError("refused"))
+    client.delete = mocker.AsyncMock(side_effect=ConnectionError("refused"))
+    client.incrby = mocker.AsyncMock(side_effect=ConnectionError("refused"))
+    client.ping = mocker.AsyncMock(side_effect=ConnectionError("refused"))
+    backend = RedisCacheBackend(namespace="app", client=client)
+
+    assert await backend.get("key") is None
+    assert await backend.incr("version", 2) == 2
+    await backend.set("key", b"value")
+    assert await backend.get_or_set("key", mocker.AsyncMock(return_value=b"computed")) == b"computed"
+    assert await backend.ping() == "Not reachable"
+    assert backend.stats()["errors"] > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_sends_namespaced_commands(mocker: MockerFixture) -> None:
+    client = mocker.Mock()
+    client.mget = mocker.AsyncMock(return_value=[b"value", None])
+    client.set = mocker.AsyncMock(return_value=True)
+    client.incrby = mocker.AsyncMock(return_value=3)
+    backend = RedisCacheBackend(namespace="app", client=client).namespaced("tasks")
+
+    assert await backend.mget(["a", "b"]) == [b"value", None]
+    await backend.set("a", b"value", ttl_seconds=1.5)
+    assert await backend.incr("version", 2) == 3
+
+    client.mget.assert_awaited_once_with(["app:tasks:a", "app:tasks:b"])
+    client.set.assert_awaited_once_with("app:tasks:a", b"value", px=1500, nx=False)
+    client.incrby.assert_awaited_once_with("app:tasks:version", 2)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_against_fakeredis() -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+
+    await exercise_backend(RedisCacheBackend(namespace="app", client=fakeredis.FakeAsyncRedis()))
+
+
+@pytest.mark.asyncio
+async def test_task_caches_are_views_of_the_shared_backend() -> None:
+    shared_backend = get_cache_backend()
+
+    await task_import_reports.set("report", b"rows", ttl_seconds=60)
+
+    assert await shared_backend.get("task_imports:report") == b"rows"
+    assert task_list_cache.backend.namespace == f"{shared_backend.namespace}:task_lists"
+    assert task_count_cache.backend.namespace == f"{shared_backend.namespace}:task_counts"
+    await task_import_reports.delete("report")
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.core.health import SystemMetricsSampler
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_empty_until_first_sample(mocker: MockerFixture) -> None:
+    client_manager = mocker.Mock()
+    client_manager.ping = mocker.AsyncMock(return_value="Up")
+    sampler = SystemMetricsSampler(interval_seconds=60, client_manager=client_manager)
+
+    assert sampler.snapshot["cpu_usage"] is None
+    assert sampler.snapshot["database_connection"] == "Not sampled yet"
+    client_manager.ping.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_background_task_refreshes_snapshot(mocker: MockerFixture) -> None:
+    client_manager = mocker.Mock()
+    client_manager.ping = mocker.AsyncMock(return_value="Up")
+    sampler = SystemMetricsSampler(interval_seconds=60, client_manager=client_manager)
+
+    sampler.start()
+    await asyncio.sleep(0.05)
+
+    snapshot = sampler.snapshot
+    assert sampler.is_running
+    assert snapshot["database_connection"] == "Up"
+    assert snapshot["cache_connection"] == "Up"
+    assert snapshot["memory_usage"] is not None
+    assert snapshot["sampled_at"] is not None
+
+    await sampler.stop()
+    assert not sampler.is_running
+    client_manager.ping.assert_awaited_once()
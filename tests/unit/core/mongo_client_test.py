@@ -0,0 +1,90 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from app.core.settings import Settings
+from app.core.mongo_client import MongoClientManager
+
+
+def build_manager(**overrides: object) -> MongoClientManager:
+    return MongoClientManager(
+        Settings(DB_TYPE="mongodb", DATABASE_URL="mongodb://localhost:27017", **overrides),
+    )
+
+
+def test_connect_reuses_the_same_client() -> None:
+    manager = build_manager()
+
+    first_client = manager.connect()
+    second_client = manager.connect()
+
+    assert first_client is not None
+    assert first_client is second_client
+    assert manager.get_database().client is first_client
+
+    manager.close()
+    assert manager.client is None
+
+
+def test_client_options_come_from_settings() -> None:
+    manager = build_manager(
+        MONGO_MAX_POOL_SIZE=25,
+        MONGO_MIN_POOL_SIZE=5,
+        MONGO_MAX_IDLE_TIME_MS=60000,
+        MONGO_COMPRESSORS="zlib, snappy",
+    )
+
+    options = manager.build_client_options()
+
+    assert options["maxPoolSize"] == 25
+    assert options["minPoolSize"] == 5
+    assert options["maxIdleTimeMS"] == 60000
+    assert options["compressors"] == ["zlib", "snappy"]
+    assert manager.pool_listener in options["event_listeners"]
+
+
+def test_no_client_for_non_mongo_databases() -> None:
+    manager = MongoClientManager(Settings(DB_TYPE="sqlite"))
+
+    assert manager.connect() is None
+    assert manager.get_database() is None
+    assert manager.pool_stats()["connected"] is False
+
+
+def test_pool_listener_tracks_checked_out_connections() -> None:
+    manager = build_manager()
+    listener = manager.pool_listener
+
+    listener.connection_created(None)
+    listener.connection_checked_out(None)
+    listener.connection_checked_out(None)
+    listener.connection_checked_in(None)
+
+    stats = manager.pool_stats()
+    assert stats["open_connections"] == 1
+    assert stats["checked_out_connections"] == 1
+    assert stats["total_checked_out"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_ping_reuses_recent_result(mocker: MockerFixture) -> None:
+    manager = build_manager()
+    database = mocker.Mock()
+    database.command = mocker.AsyncMock(return_value={"ok": 1})
+    mocker.patch.object(manager, "get_database", return_value=database)
+
+    assert await manager.cached_ping(max_age_seconds=60) == "Up"
+    assert await manager.cached_ping(max_age_seconds=60) == "Up"
+    database.command.assert_awaited_once_with("ping")
+
+    assert await manager.cached_ping(max_age_seconds=0) == "Up"
+    assert database.command.await_count == 2
+
+
+def test_pool_exhausted_when_every_connection_is_checked_out() -> None:
+    manager = build_manager(MONGO_MAX_POOL_SIZE=2)
+
+    manager.pool_listener.connection_checked_out(None)
+    assert not manager.is_pool_exhausted()
+
+    manager.pool_listener.connection_checked_out(None)
+    assert manager.is_pool_exhausted()
@@ -0,0 +1,35 @@
+import asyncio
+from threading import Event
+
+import pytest
+
+from app.core.security import PasswordHashingExecutor, PasswordHashingBusyError, get_password, verify_password
+
+
+@pytest.mark.asyncio
+async def test_hashing_runs_on_the_pool() -> None:
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=1)
+
+    hashed = await executor.run(get_password, "strongpassword123")
+
+    assert await executor.run(verify_password, "strongpassword123", hashed)
+    assert executor.stats()["total_completed"] == 2
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submissions_beyond_the_queue_are_rejected() -> None:
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=0)
+    release = Event()
+
+    blocked_job = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(PasswordHashingBusyError):
+        await executor.run(get_password, "strongpassword123")
+
+    release.set()
+    assert await blocked_job is True
+    assert executor.stats()["total_rejected"] == 1
+    executor.shutdown()
@@ -0,0 +1,68 @@
+from pytest_mock import MockerFixture
+
+from app.core.query_monitoring import SlowQueryListener, summarize_explain, normalize_query_shape
+
+
+def send_command(
+    listener: SlowQueryListener, mocker: MockerFixture, request_id: int, command: dict, duration_ms: float
+) -> None:
+    command_name = next(iter(command))
+    started = mocker.Mock(
+        command_name=command_name, command=command, connection_id=("localhost", 27017), request_id=request_id
+    )
+    succeeded = mocker.Mock(
+        command_name=command_name,
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+        duration_micros=int(duration_ms * 1000),
+    )
+    listener.started(started)
+    listener.succeeded(succeeded)
+
+
+def test_query_shape_drops_literal_values() -> None:
+    shape = normalize_query_shape({"$and": [{"status": {"$in": [1, 2]}}, {"assigned_to.$id": "abc"}]})
+
+    assert shape == {"$and": [{"status": {"$in": ["?"]}}, {"assigned_to.$id": "?"}]}
+
+
+def test_slow_shapes_are_aggregated_by_shape(mocker: MockerFixture) -> None:
+    listener = SlowQueryListener(threshold_ms=50, explain=False)
+
+    send_command(listener, mocker, 1, {"find": "tasks", "filter": {"status": 1}, "lsid": {"id": "x"}}, 120)
+    send_command(listener, mocker, 2, {"find": "tasks", "filter": {"status": 3}}, 80)
+    send_command(listener, mocker, 3, {"find": "tasks", "filter": {"status": 2}}, 10)
+    send_command(listener, mocker, 4, {"find": "tasks", "filter": {"title": "A"}}, 200)
+    send_command(listener, mocker, 5, {"ping": 1}, 500)
+
+    top_shapes = listener.top_slow_shapes()
+
+    assert [shape["shape"] for shape in top_shapes] == ['{"filter": {"status": "?"}}', '{"filter": {"title": "?"}}']
+    assert top_shapes[0]["count"] == 3
+    assert top_shapes[0]["slow_count"] == 2
+    assert top_shapes[0]["max_ms"] == 120
+    assert top_shapes[0]["collection"] == "tasks"
+
+
+def test_shapes_are_bounded(mocker: MockerFixture) -> None:
+    listener = SlowQueryListener(threshold_ms=0, max_shapes=2, explain=False)
+
+    for request_id, field in enumerate(["title", "status", "priority"]):
+        send_command(listener, mocker, request_id, {"find": "tasks", "filter": {field: 1}}, 1)
+
+    assert len(listener.top_slow_shapes()) == 2
+
+
+def test_explain_summary_reports_collection_scans() -> None:
+    explain_result = {
+        "queryPlanner": {"winningPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}},
+        "executionStats": {"nReturned": 10, "totalDocsExamined": 5000, "totalKeysExamined": 0},
+    }
+
+    assert summarize_explain(explain_result) == {
+        "stages": ["SORT", "COLLSCAN"],
+        "collection_scan": True,
+        "docs_examined": 5000,
+        "keys_examined": 0,
+        "docs_returned": 10,
+    }
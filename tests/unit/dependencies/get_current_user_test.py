@@ -7,7 +7,7 @@ from pytest_mock import MockerFixture
 
 from app.core import get_settings
 from app.domain.entities.user import User
-from app.services.user_service import UserService
+from app.services.user_service import UserService, authenticated_user_cache
 from app.api.routers.dependencies.user_deps import get_current_user
 
 
@@ -46,3 +46,33 @@ async def test_get_current_user_valid_token(mocker: MockerFixture) -> None:
     assert result.id == raw_mock_id
     assert result.username == "testuser"
     mock_service.get_user_by_id.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_served_from_cache(mocker: MockerFixture) -> None:
+    settings = get_settings()
+    user_id = str(uuid4())
+    exp = int((datetime.now(tz=UTC) + timedelta(minutes=30)).timestamp())
+    token = jwt.encode({"sub": user_id, "exp": exp}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+    mock_user = User(
+        id=user_id,
+        username="cacheduser",
+        email="cached@example.com",
+        first_name="Cached",
+        last_name="User",
+        hashed_password="hashed123",
+        is_active=True,
+    )
+    mock_service = mocker.Mock(spec=UserService)
+    mock_service.get_user_by_id.return_value = mock_user
+
+    first = await get_current_user(mock_service, token)
+    second = await get_current_user(mock_service, token)
+
+    assert first is second
+    mock_service.get_user_by_id.assert_called_once_with(user_id)
+
+    authenticated_user_cache.invalidate(user_id)
+    await get_current_user(mock_service, token)
+    assert mock_service.get_user_by_id.call_count == 2
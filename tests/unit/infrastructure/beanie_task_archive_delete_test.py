@@ -0,0 +1,85 @@
+from uuid import uuid4
+
+import pytest
+from bson import DBRef
+from pymongo import ReturnDocument
+from pytest_mock import MockerFixture
+from pymongo.errors import OperationFailure
+
+from app.domain.entities.user import User
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource
+from app.infrastructure.datasource.beanie_user_datasource import BeanieUserDatasource
+from app.infrastructure.datasource.build_aggregations_datasource import TASK_READ_PROJECTION
+
+
+@pytest.mark.asyncio
+async def test_archive_toggles_on_the_server(
+    mocker: MockerFixture,
+    current_user: User,
+    task_collection,
+    user_collection,
+) -> None:
+    task_id = uuid4()
+    task_collection.find_one_and_update = mocker.AsyncMock(
+        return_value={
+            "_id": task_id,
+            "is_archived": True,
+            "sub_tasks": [],
+            "created_by": DBRef("users", current_user.id),
+            "updated_by": DBRef("users", current_user.id),
+        },
+    )
+
+    task = await BeanieTaskDatasource().archive_task(current_user, str(task_id))
+
+    query, pipeline = task_collection.find_one_and_update.await_args.args
+    assert query == {"_id": task_id}
+    assert pipeline[0]["$set"]["is_archived"] == {"$not": [{"$ifNull": ["$is_archived", False]}]}
+    assert pipeline[0]["$set"]["updated_by"] == {"$literal": DBRef("users", current_user.id)}
+    assert task_collection.find_one_and_update.await_args.kwargs == {
+        "projection": TASK_READ_PROJECTION,
+        "return_document": ReturnDocument.AFTER,
+    }
+    user_collection.find.assert_not_called()
+    assert task["is_archived"] is True
+    assert task["created_by"]["username"] == current_user.username
+
+
+@pytest.mark.asyncio
+async def test_delete_returns_the_pre_image(mocker: MockerFixture, task_collection, user_collection) -> None:
+    task_id = uuid4()
+    creator_id = uuid4()
+    task_collection.find_one_and_delete = mocker.AsyncMock(
+        return_value={"_id": task_id, "title": "Gone", "sub_tasks": [], "created_by": DBRef("users", creator_id)},
+    )
+    user_collection.find.return_value.to_list = mocker.AsyncMock(return_value=[{"_id": creator_id, "username": "c"}])
+
+    task = await BeanieTaskDatasource().delete_task(str(task_id))
+
+    task_collection.find_one_and_delete.assert_awaited_once_with({"_id": task_id}, projection=TASK_READ_PROJECTION)
+    assert task["id"] == task_id
+    assert task["created_by"] == {"username": "c"}
+
+
+@pytest.mark.asyncio
+async def test_delete_of_missing_task_raises(mocker: MockerFixture, task_collection) -> None:
+    task_collection.find_one_and_delete = mocker.AsyncMock(return_value=None)
+
+    with pytest.raises(ValueError, match="Task not found"):
+        await BeanieTaskDatasource().delete_task(str(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_user_status_toggles_on_the_server(mocker: MockerFixture, user_collection) -> None:
+    user_id = uuid4()
+    user_collection.find_one_and_update = mocker.AsyncMock(return_value={"is_active": False})
+
+    assert await BeanieUserDatasource().delete_user(user_id) is False
+
+    query, pipeline = user_collection.find_one_and_update.await_args.args
+    assert query == {"_id": user_id}
+    assert pipeline == [{"$set": {"is_active": {"$not": [{"$ifNull": ["$is_active", True]}]}}}]
+
+    user_collection.find_one_and_update = mocker.AsyncMock(return_value=None)
+    with pytest.raises(OperationFailure):
+        await BeanieUserDatasource().delete_user(user_id)
@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+from pymongo.errors import BulkWriteError
+
+from app.domain.entities.user import User
+from app.schemas.pydantic.task_schemas import TaskCreate
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTask, BeanieTaskDatasource
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_each_item(mocker: MockerFixture, current_user: User) -> None:
+    tasks = [mocker.Mock(id=uuid4()) for _ in range(3)]
+    mocker.patch(
+        "app.infrastructure.datasource.beanie_task_datasource.to_beanie_tasks_from_schema_task_create_many",
+        mocker.AsyncMock(
+            return_value=[(tasks[0], None), (None, "Assigned user not found"), (tasks[1], None), (tasks[2], None)],
+        ),
+    )
+    insert_many = mocker.patch.object(
+        BeanieTask,
+        "insert_many",
+        mocker.AsyncMock(
+            side_effect=BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}]}),
+        ),
+    )
+
+    result = await BeanieTaskDatasource().create_tasks(
+        current_user,
+        [TaskCreate(title=f"Task {index}", description="Imported") for index in range(4)],
+    )
+
+    insert_many.assert_awaited_once_with(tasks, ordered=False)
+    assert result["created"] == 2
+    assert result["failed"] == 2
+    assert result["results"] == [
+        {"index": 0, "id": tasks[0].id, "error": None},
+        {"index": 1, "id": None, "error": "Assigned user not found"},
+        {"index": 2, "id": None, "error": "duplicate key"},
+        {"index": 3, "id": tasks[2].id, "error": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_skips_insert_when_nothing_is_valid(mocker: MockerFixture, current_user: User) -> None:
+    mocker.patch(
+        "app.infrastructure.datasource.beanie_task_datasource.to_beanie_tasks_from_schema_task_create_many",
+        mocker.AsyncMock(return_value=[(None, "Assigned user not found")]),
+    )
+    insert_many = mocker.patch.object(BeanieTask, "insert_many", mocker.AsyncMock())
+
+    result = await BeanieTaskDatasource().create_tasks(
+        current_user,
+        [TaskCreate(title="Orphan", description="Unknown assignee", assigned_to=uuid4())],
+    )
+
+    insert_many.assert_not_awaited()
+    assert result == {
+        "created": 0,
+        "failed": 1,
+        "results": [{"index": 0, "id": None, "error": "Assigned user not found"}],
+    }
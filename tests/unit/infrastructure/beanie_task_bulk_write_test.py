@@ -0,0 +1,69 @@
+from uuid import uuid4
+
+import pytest
+from bson import DBRef
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
+
+from app.domain.entities.user import User
+from app.services.task_service import TaskService
+from app.schemas.pydantic.task_schemas import TaskUpdate, TaskFilters
+from app.schemas.pydantic.common_schemas import BulkSelection, FilterCapabilities
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource
+
+TaskSelection = BulkSelection[FilterCapabilities[TaskFilters]]
+
+
+@pytest.fixture
+def task_collection(task_collection, mocker: MockerFixture):
+    task_collection.update_many = mocker.AsyncMock(return_value=mocker.Mock(matched_count=5, modified_count=4))
+    task_collection.delete_many = mocker.AsyncMock(return_value=mocker.Mock(deleted_count=3))
+    return task_collection
+
+
+def test_selection_requires_ids_or_filters() -> None:
+    with pytest.raises(ValidationError):
+        TaskSelection()
+
+    with pytest.raises(ValidationError):
+        TaskSelection(
+            ids=[uuid4()],
+            filters={"fields": {"priority": {"value": 1, "operator": "eq"}}, "logical_operator": "and"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_ids_is_a_single_update_many(current_user: User, task_collection) -> None:
+    task_ids = [uuid4(), uuid4()]
+    service = TaskService()
+
+    result = await service.update_tasks(current_user, TaskSelection(ids=task_ids), TaskUpdate(priority=2))
+
+    query, update = task_collection.update_many.await_args.args
+    assert query == {"_id": {"$in": task_ids}}
+    assert update["$set"]["priority"] == 2
+    assert update["$set"]["updated_by"] == DBRef("users", current_user.id)
+    assert "updated_at" in update["$set"]
+    assert "title" not in update["$set"]
+    assert result == {"matched": 5, "modified": 4}
+
+
+@pytest.mark.asyncio
+async def test_bulk_archive_by_filters_reuses_the_filter_builder(current_user: User, task_collection) -> None:
+    selection = TaskSelection(
+        filters={"fields": {"priority": {"value": 4, "operator": "eq"}}, "logical_operator": "and"},
+    )
+
+    await TaskService().archive_tasks(current_user, selection, is_archived=True)
+
+    query, update = task_collection.update_many.await_args.args
+    assert query == {"priority": 4}
+    assert update["$set"]["is_archived"] is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_returns_the_deleted_count(task_collection) -> None:
+    task_ids = [uuid4()]
+
+    assert await BeanieTaskDatasource().delete_tasks({"_id": {"$in": task_ids}}) == {"deleted": 3}
+    task_collection.delete_many.assert_awaited_once_with({"_id": {"$in": task_ids}})
@@ -0,0 +1,80 @@
+import asyncio
+from uuid import uuid4
+from datetime import UTC, datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.services.task_service import TaskService
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTask, BeanieTaskDatasource, task_count_cache
+
+
+@pytest.fixture
+def collection(mocker: MockerFixture):
+    asyncio.run(task_count_cache.bump())
+    collection = mocker.Mock()
+    collection.count_documents = mocker.AsyncMock(return_value=7)
+    collection.estimated_document_count = mocker.AsyncMock(return_value=1500)
+    mocker.patch.object(BeanieTask, "get_motor_collection", return_value=collection)
+    yield collection
+    asyncio.run(task_count_cache.bump())
+
+
+@pytest.mark.asyncio
+async def test_count_without_filters_uses_estimated_count(collection) -> None:
+    assert await BeanieTaskDatasource().count_tasks(None) == 1500
+
+    collection.estimated_document_count.assert_awaited_once()
+    collection.count_documents.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_count_with_filters_is_cached_by_query(collection) -> None:
+    datasource = BeanieTaskDatasource()
+
+    assert await datasource.count_tasks({"status": 2}) == 7
+    assert await datasource.count_tasks({"status": 2}) == 7
+
+    collection.count_documents.assert_awaited_once_with({"status": 2})
+    collection.estimated_document_count.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_count_is_recomputed_after_a_task_write(collection) -> None:
+    datasource = BeanieTaskDatasource()
+
+    assert await datasource.count_tasks({"status": 2}) == 7
+    await TaskService._invalidate_task_lists()
+    collection.count_documents.return_value = 8
+
+    assert await datasource.count_tasks({"status": 2}) == 8
+    assert collection.count_documents.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_iterate_tasks_reads_through_a_batched_cursor(mocker: MockerFixture) -> None:
+    documents = [{"_id": 1}, {"_id": 2}]
+    cursor = mocker.MagicMock()
+    cursor.__aiter__.return_value = documents
+    cursor.close = mocker.AsyncMock()
+    collection = mocker.Mock()
+    collection.find.return_value = cursor
+    mocker.patch.object(BeanieTask, "get_motor_collection", return_value=collection)
+
+    assert [document async for document in BeanieTaskDatasource().iterate_tasks({"status": 2})] == documents
+    assert collection.find.call_args.args[0] == {"status": 2}
+    assert collection.find.call_args.kwargs["batch_size"] > 0
+    cursor.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_task_version_is_read_without_the_task(collection, mocker: MockerFixture) -> None:
+    collection.find_one = mocker.AsyncMock(return_value={"created_at": datetime(2025, 1, 1, tzinfo=UTC)})
+    datasource = BeanieTaskDatasource()
+    task_id = uuid4()
+
+    assert await datasource.get_task_version(str(task_id)) == datetime(2025, 1, 1, tzinfo=UTC)
+
+    query, projection = collection.find_one.await_args.args
+    assert query == {"_id": task_id}
+    assert set(projection) == {"_id", "updated_at", "created_at"}
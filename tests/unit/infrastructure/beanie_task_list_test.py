@@ -0,0 +1,57 @@
+from uuid import uuid4
+from datetime import UTC, datetime
+
+import pytest
+from bson import DBRef
+from pytest_mock import MockerFixture
+
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource
+from app.infrastructure.datasource.build_pagination_datasource import decode_cursor, with_tie_breaker
+
+
+@pytest.mark.asyncio
+async def test_next_cursor_keeps_the_stored_user_reference(mocker: MockerFixture, task_collection) -> None:
+    first_id, last_id, assignee_id = uuid4(), uuid4(), uuid4()
+    task_collection.aggregate.return_value.to_list = mocker.AsyncMock(
+        return_value=[
+            {"_id": first_id, "assigned_to": None, "users": []},
+            {
+                "_id": last_id,
+                "assigned_to": DBRef("users", assignee_id),
+                "users": [{"_id": assignee_id, "username": "assignee"}],
+            },
+        ],
+    )
+
+    tasks, next_cursor = await BeanieTaskDatasource().list_tasks(None, ["+assigned_to"], 0, 2)
+
+    assert tasks[-1]["assigned_to"] == {"username": "assignee"}
+    assert decode_cursor(with_tie_breaker({"assigned_to": 1}), next_cursor) == [
+        DBRef("users", assignee_id),
+        last_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_next_cursor(mocker: MockerFixture, task_collection) -> None:
+    task_collection.aggregate.return_value.to_list = mocker.AsyncMock(return_value=[{"_id": uuid4(), "users": []}])
+
+    tasks, next_cursor = await BeanieTaskDatasource().list_tasks(None, None, 0, 2)
+
+    assert len(tasks) == 1
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_last_modified_reads_a_single_projected_task(mocker: MockerFixture, task_collection) -> None:
+    updated_at = datetime(2025, 1, 2, tzinfo=UTC)
+    cursor = task_collection.find.return_value.sort.return_value.limit.return_value
+    cursor.to_list = mocker.AsyncMock(side_effect=[[{"updated_at": updated_at}], []])
+    datasource = BeanieTaskDatasource()
+
+    assert await datasource.get_tasks_last_modified({"status": 2}) == updated_at
+    assert await datasource.get_tasks_last_modified(None) is None
+
+    task_collection.find.assert_called_with({}, {"_id": 0, "updated_at": 1})
+    task_collection.find.return_value.sort.assert_called_with("updated_at", -1)
+    task_collection.find.return_value.sort.return_value.limit.assert_called_with(1)
@@ -0,0 +1,70 @@
+from uuid import uuid4
+
+import pytest
+from bson import DBRef
+from pytest_mock import MockerFixture
+
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTask, BeanieTaskDatasource
+
+
+@pytest.mark.asyncio
+async def test_read_many_keeps_the_requested_order(mocker: MockerFixture, task_collection) -> None:
+    first_id, second_id, missing_id, sub_task_id, user_id = uuid4(), uuid4(), uuid4(), uuid4(), uuid4()
+    task_collection.aggregate.return_value.to_list = mocker.AsyncMock(
+        return_value=[
+            {
+                "_id": first_id,
+                "sub_tasks": [],
+                "created_by": DBRef("users", user_id),
+                "users": [{"_id": user_id, "username": "creator"}],
+            },
+            {
+                "_id": second_id,
+                "sub_tasks": [{"id": sub_task_id, "relation_type": "blocks"}],
+                "created_by": DBRef("users", user_id),
+                "users": [{"_id": user_id, "username": "creator"}],
+            },
+        ],
+    )
+    fetch_sub_task_summaries = mocker.patch.object(
+        BeanieTask,
+        "fetch_sub_task_summaries",
+        mocker.AsyncMock(return_value={}),
+    )
+
+    tasks, missing = await BeanieTaskDatasource().get_tasks_by_ids([second_id, missing_id, first_id, second_id])
+
+    task_collection.aggregate.assert_called_once()
+    assert task_collection.aggregate.call_args.args[0][0] == {
+        "$match": {"_id": {"$in": [second_id, missing_id, first_id]}}
+    }
+    fetch_sub_task_summaries.assert_awaited_once_with([sub_task_id])
+    assert [task["id"] for task in tasks] == [second_id, first_id]
+    assert missing == [missing_id]
+    assert tasks[0]["created_by"] == {"username": "creator"}
+    assert tasks[0]["sub_tasks"] == []
+
+
+@pytest.mark.asyncio
+async def test_read_many_without_ids_does_not_query(mocker: MockerFixture) -> None:
+    get_motor_collection = mocker.patch.object(BeanieTask, "get_motor_collection")
+
+    assert await BeanieTaskDatasource().get_tasks_by_ids([]) == ([], [])
+    get_motor_collection.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_one_goes_through_the_projection(mocker: MockerFixture) -> None:
+    task_id = uuid4()
+    get_tasks_by_ids = mocker.patch.object(
+        BeanieTaskDatasource,
+        "get_tasks_by_ids",
+        mocker.AsyncMock(side_effect=[([{"id": task_id}], []), ([], [task_id])]),
+    )
+    datasource = BeanieTaskDatasource()
+
+    assert await datasource.get_task_by_id(str(task_id)) == {"id": task_id}
+    get_tasks_by_ids.assert_awaited_with([task_id])
+
+    with pytest.raises(ValueError, match="Task not found"):
+        await datasource.get_task_by_id(str(task_id))
@@ -0,0 +1,94 @@
+from uuid import uuid4
+from datetime import UTC, datetime
+
+import pytest
+from bson import DBRef, Binary
+from pymongo import ReturnDocument
+from pytest_mock import MockerFixture
+
+from app.domain.entities.user import User
+from app.schemas.pydantic.task_schemas import TaskUpdate
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTask, BeanieTaskDatasource
+from app.infrastructure.datasource.build_aggregations_datasource import TASK_READ_PROJECTION
+
+
+def _updated_document(current_user: User, creator_id) -> dict:
+    return {
+        "_id": uuid4(),
+        "title": "New title",
+        "sub_tasks": [],
+        "assigned_to": None,
+        "created_by": DBRef("users", creator_id),
+        "updated_by": DBRef("users", current_user.id),
+        "updated_at": datetime.now(tz=UTC),
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_is_a_single_find_one_and_update(
+    mocker: MockerFixture,
+    current_user: User,
+    task_collection,
+    user_collection,
+) -> None:
+    creator_id = uuid4()
+    task_id = uuid4()
+    task_collection.find_one_and_update = mocker.AsyncMock(return_value=_updated_document(current_user, creator_id))
+    user_collection.find.return_value.to_list = mocker.AsyncMock(return_value=[{"_id": creator_id, "username": "c"}])
+    validate_sub_tasks = mocker.patch.object(BeanieTask, "validate_sub_tasks", new=mocker.AsyncMock())
+    fetch_sub_task_summaries = mocker.patch.object(BeanieTask, "fetch_sub_task_summaries", new=mocker.AsyncMock())
+
+    task = await BeanieTaskDatasource().update_task(current_user, str(task_id), TaskUpdate(title="New title"))
+
+    query, update = task_collection.find_one_and_update.await_args.args
+    kwargs = task_collection.find_one_and_update.await_args.kwargs
+    assert query == {"_id": task_id}
+    assert update["$set"]["title"] == "New title"
+    assert update["$set"]["updated_by"] == DBRef("users", current_user.id)
+    assert isinstance(update["$set"]["updated_at"], datetime)
+    assert "sub_tasks" not in update["$set"]
+    assert kwargs == {"projection": TASK_READ_PROJECTION, "return_document": ReturnDocument.AFTER}
+
+    # The current user is already known, only the creator is looked up and the empty sub tasks are not resolved
+    assert user_collection.find.call_args.args[0] == {"_id": {"$in": [creator_id]}}
+    validate_sub_tasks.assert_not_awaited()
+    fetch_sub_task_summaries.assert_not_awaited()
+    assert task["updated_by"]["username"] == current_user.username
+    assert task["created_by"] == {"username": "c"}
+    assert task["assigned_to"] is None
+
+
+@pytest.mark.asyncio
+async def test_update_with_sub_tasks_reuses_their_validation(
+    mocker: MockerFixture,
+    current_user: User,
+    task_collection,
+    user_collection,
+) -> None:
+    sub_task_id = uuid4()
+    summary = {"id": sub_task_id, "relation_type": "relates_to", "title": "Sub task"}
+    document = _updated_document(current_user, current_user.id)
+    document["sub_tasks"] = [{"id": sub_task_id, "relation_type": "relates_to"}]
+    task_collection.find_one_and_update = mocker.AsyncMock(return_value=document)
+    mocker.patch.object(BeanieTask, "validate_sub_tasks", new=mocker.AsyncMock(return_value=[summary]))
+    fetch_sub_task_summaries = mocker.patch.object(BeanieTask, "fetch_sub_task_summaries", new=mocker.AsyncMock())
+
+    task = await BeanieTaskDatasource().update_task(
+        current_user,
+        str(uuid4()),
+        {"sub_tasks": [{"id": sub_task_id, "relation_type": "relates_to"}]},
+    )
+
+    update = task_collection.find_one_and_update.await_args.args[1]
+    assert update["$set"]["sub_tasks"] == [{"id": Binary.from_uuid(sub_task_id), "relation_type": "relates_to"}]
+    fetch_sub_task_summaries.assert_not_awaited()
+    user_collection.find.assert_not_called()
+    assert task["sub_tasks"] == [summary]
+
+
+@pytest.mark.asyncio
+async def test_update_of_missing_task_raises(mocker: MockerFixture, current_user: User, task_collection) -> None:
+    task_collection.find_one_and_update = mocker.AsyncMock(return_value=None)
+
+    with pytest.raises(ValueError, match="Task not found"):
+        await BeanieTaskDatasource().update_task(current_user, str(uuid4()), {"title": "New title"})
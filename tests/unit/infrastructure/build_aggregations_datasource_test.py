@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+import pymongo
+from bson import DBRef
+
+from app.infrastructure.datasource.build_aggregations_datasource import (
+    USER_READ_PROJECTION,
+    TASK_USER_LINK_FIELDS,
+    build_sort_stage,
+    hydrate_task_users,
+    build_task_list_pipeline,
+)
+
+
+def test_sort_stage_defaults_to_newest_first() -> None:
+    assert build_sort_stage(None) == {"created_at": pymongo.DESCENDING}
+    assert build_sort_stage([]) == {"created_at": pymongo.DESCENDING}
+
+
+def test_sort_stage_keeps_the_requested_order() -> None:
+    sort_stage = build_sort_stage(["-priority", "+title"])
+
+    assert list(sort_stage.items()) == [("priority", pymongo.DESCENDING), ("title", pymongo.ASCENDING)]
+
+
+def test_pipeline_looks_users_up_for_each_task() -> None:
+    pipeline = build_task_list_pipeline({"is_archived": False}, {"created_at": -1}, 20, 10)
+
+    assert pipeline[:4] == [
+        {"$match": {"is_archived": False}},
+        {"$sort": {"created_at": -1}},
+        {"$skip": 20},
+        {"$limit": 10},
+    ]
+    assert len(pipeline[4]["$project"]["user_ids"]) == len(TASK_USER_LINK_FIELDS)
+    assert pipeline[5]["$lookup"] == {
+        "from": "users",
+        "localField": "user_ids",
+        "foreignField": "_id",
+        "pipeline": [{"$project": USER_READ_PROJECTION}],
+        "as": "users",
+    }
+    assert pipeline[6] == {"$unset": "user_ids"}
+    assert "hashed_password" not in USER_READ_PROJECTION
+
+
+def test_hydrate_task_users_replaces_references() -> None:
+    creator_id, assignee_id = uuid4(), uuid4()
+    task_id = uuid4()
+    tasks = [
+        {
+            "_id": task_id,
+            "title": "Task",
+            "revision_id": None,
+            "created_by": DBRef("users", creator_id),
+            "assigned_to": DBRef("users", assignee_id),
+            "updated_by": None,
+            "users": [{"_id": creator_id, "username": "creator"}],
+        },
+    ]
+    users = [{"_id": assignee_id, "username": "assignee"}]
+
+    hydrated_task = hydrate_task_users(tasks, users)[0]
+
+    assert hydrated_task["id"] == task_id
+    assert "_id" not in hydrated_task
+    assert "revision_id" not in hydrated_task
+    assert "users" not in hydrated_task
+    assert hydrated_task["created_by"] == {"username": "creator"}
+    assert hydrated_task["assigned_to"] == {"username": "assignee"}
+    assert hydrated_task["updated_by"] is None
@@ -0,0 +1,69 @@
+from uuid import uuid4
+
+import pytest
+from bson import Binary
+from pytest_mock import MockerFixture
+
+from app.utils.lru_ttl_cache import LRUTTLCache
+from app.infrastructure.datasource import build_filters_datasource
+from app.schemas.pydantic.task_schemas import TaskFilters
+from app.schemas.pydantic.common_schemas import FilterCapabilities
+from app.infrastructure.datasource.build_filters_datasource import build_beanie_filter, compiled_filters_stats
+
+TaskFilterCapabilities = FilterCapabilities[TaskFilters]
+
+
+@pytest.fixture(autouse=True)
+def compiled_filters(mocker: MockerFixture) -> LRUTTLCache:
+    cache = LRUTTLCache(max_size=8)
+    mocker.patch.object(build_filters_datasource, "_compiled_filters", cache)
+    return cache
+
+
+def test_filters_with_the_same_shape_share_the_template(compiled_filters: LRUTTLCache) -> None:
+    first_query = build_beanie_filter(
+        TaskFilterCapabilities(
+            fields={"status": {"value": [1, 2], "operator": "in"}, "is_archived": {"value": False, "operator": "eq"}},
+            logical_operator="and",
+        ),
+    )
+    second_query = build_beanie_filter(
+        TaskFilterCapabilities(
+            fields={"is_archived": {"value": True, "operator": "eq"}, "status": {"value": [3], "operator": "in"}},
+            logical_operator="and",
+        ),
+    )
+
+    assert first_query == {"$and": [{"is_archived": False}, {"status": {"$in": [1, 2]}}]}
+    assert second_query == {"$and": [{"is_archived": True}, {"status": {"$in": [3]}}]}
+    assert len(compiled_filters) == 1
+
+    stats = compiled_filters_stats()
+    assert stats["shapes"] == [
+        {"fields": ["is_archived:eq", "status:in"], "logical_operator": "and", "hits": 1, "hit_ratio": 0.5},
+    ]
+
+
+def test_not_negates_the_whole_expression() -> None:
+    assignee_id = uuid4()
+
+    query = build_beanie_filter(
+        TaskFilterCapabilities(
+            fields={
+                "assigned_to": {"value": assignee_id, "operator": "eq"},
+                "priority": {"value": 1, "operator": "eq"},
+            },
+            logical_operator="not",
+        ),
+    )
+
+    assert query == {
+        "$nor": [{"$and": [{"assigned_to.$id": Binary.from_uuid(assignee_id)}, {"priority": 1}]}],
+    }
+
+
+def test_filters_without_operator_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Operator is required for field status"):
+        build_beanie_filter(
+            TaskFilterCapabilities(fields={"status": {"value": 1, "operator": ""}}, logical_operator="and"),
+        )
@@ -0,0 +1,77 @@
+from uuid import uuid4
+from datetime import UTC, datetime
+
+import pytest
+import pymongo
+
+from app.infrastructure.datasource.build_pagination_datasource import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    with_tie_breaker,
+    build_cursor_query,
+)
+
+
+def test_tie_breaker_follows_the_last_sort_direction() -> None:
+    assert with_tie_breaker({"created_at": pymongo.DESCENDING}) == {
+        "created_at": pymongo.DESCENDING,
+        "_id": pymongo.DESCENDING,
+    }
+    assert with_tie_breaker({"_id": pymongo.ASCENDING}) == {"_id": pymongo.ASCENDING}
+
+
+def test_cursor_round_trip_keeps_value_types() -> None:
+    sort_stage = with_tie_breaker({"priority": pymongo.ASCENDING, "created_at": pymongo.DESCENDING})
+    task_id = uuid4()
+    created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+    cursor = encode_cursor(sort_stage, {"id": task_id, "priority": 2, "created_at": created_at})
+
+    assert "=" not in cursor
+    assert decode_cursor(sort_stage, cursor) == [2, created_at, task_id]
+
+
+def test_cursor_is_rejected_for_another_sort() -> None:
+    cursor = encode_cursor(with_tie_breaker({"title": pymongo.ASCENDING}), {"id": uuid4(), "title": "Task"})
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(with_tie_breaker({"priority": pymongo.ASCENDING}), cursor)
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(with_tie_breaker({"title": pymongo.ASCENDING}), "not-a-cursor")
+
+
+def test_cursor_query_compares_each_sort_key() -> None:
+    task_id = uuid4()
+    sort_stage = {"priority": pymongo.ASCENDING, "created_at": pymongo.DESCENDING, "_id": pymongo.DESCENDING}
+    created_at = datetime(2025, 1, 2, tzinfo=UTC)
+
+    query = build_cursor_query(sort_stage, [2, created_at, task_id])
+
+    assert query == {
+        "$or": [
+            {"priority": {"$gt": 2}},
+            {"$and": [{"priority": 2}, {"$or": [{"created_at": {"$lt": created_at}}, {"created_at": None}]}]},
+            {
+                "$and": [
+                    {"priority": 2},
+                    {"created_at": created_at},
+                    {"$or": [{"_id": {"$lt": task_id}}, {"_id": None}]},
+                ]
+            },
+        ],
+    }
+
+
+def test_cursor_query_handles_null_sort_values() -> None:
+    task_id = uuid4()
+
+    query = build_cursor_query({"due_date": pymongo.ASCENDING, "_id": pymongo.ASCENDING}, [None, task_id])
+
+    assert query == {
+        "$or": [
+            {"due_date": {"$ne": None}},
+            {"$and": [{"due_date": None}, {"_id": {"$gt": task_id}}]},
+        ],
+    }
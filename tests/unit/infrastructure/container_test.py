@@ -0,0 +1,43 @@
+from app.infrastructure.container import (
+    DATASOURCE_FACTORIES,
+    AppContainer,
+    DatasourceFactories,
+    get_container,
+    init_container,
+    register_datasources,
+)
+from app.api.routers.dependencies.service_deps import get_task_service, get_user_service
+from app.infrastructure.datasource.beanie_task_datasource import BeanieTaskDatasource
+
+
+def test_dependency_providers_return_singletons() -> None:
+    container = init_container("mongodb")
+
+    assert get_container() is container
+    assert get_task_service() is get_task_service()
+    assert get_user_service() is container.user_service
+    assert container.task_service.task_repository is container.task_repository
+    assert container.task_repository.datasource is container.task_datasource
+
+
+def test_unknown_db_type_falls_back_to_mongodb() -> None:
+    container = AppContainer("unknown")
+
+    assert isinstance(container.task_datasource, BeanieTaskDatasource)
+
+
+def test_registered_datasources_are_used_for_their_db_type() -> None:
+    class InMemoryTaskDatasource(BeanieTaskDatasource):
+        pass
+
+    register_datasources(
+        "in_memory",
+        DatasourceFactories(
+            task_datasource=InMemoryTaskDatasource,
+            user_datasource=DATASOURCE_FACTORIES["mongodb"].user_datasource,
+        ),
+    )
+    try:
+        assert isinstance(AppContainer("in_memory").task_datasource, InMemoryTaskDatasource)
+    finally:
+        DATASOURCE_FACTORIES.pop("in_memory")
@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.domain.entities.task_enum import SubTaskRelationType
+from app.infrastructure.models.odm.beanie_task_model import (
+    BeanieTask,
+    BeanieSubTask,
+    BeanieSubTaskSummary,
+    SubTaskNotFoundError,
+)
+
+
+def build_summary(title: str) -> BeanieSubTaskSummary:
+    return BeanieSubTaskSummary(_id=uuid4(), title=title, description=f"{title} description")
+
+
+@pytest.mark.asyncio
+async def test_retrieve_sub_tasks_preserves_order_and_skips_dangling_ids(mocker: MockerFixture) -> None:
+    first = build_summary("First sub task")
+    second = build_summary("Second sub task")
+    dangling_id = uuid4()
+    fetch_summaries = mocker.patch.object(
+        BeanieTask,
+        "fetch_sub_task_summaries",
+        mocker.AsyncMock(return_value={first.id: first, second.id: second}),
+    )
+    parent = BeanieTask.model_construct(
+        sub_tasks=[
+            BeanieSubTask(id=second.id, relation_type=SubTaskRelationType.BLOCKS),
+            BeanieSubTask(id=dangling_id),
+            BeanieSubTask(id=first.id),
+        ],
+    )
+
+    sub_tasks = await parent.retrieve_sub_tasks()
+
+    fetch_summaries.assert_awaited_once_with([second.id, dangling_id, first.id])
+    assert [sub_task["id"] for sub_task in sub_tasks] == [second.id, first.id]
+    assert sub_tasks[0]["title"] == "Second sub task"
+    assert sub_tasks[0]["relation_type"] == SubTaskRelationType.BLOCKS
+    assert sub_tasks[1]["description"] == "First sub task description"
+
+
+@pytest.mark.asyncio
+async def test_fetch_sub_task_summaries_ignores_empty_input(mocker: MockerFixture) -> None:
+    find = mocker.patch.object(BeanieTask, "find")
+
+    assert await BeanieTask.fetch_sub_task_summaries([]) == {}
+    find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_validate_sub_tasks_rejects_unknown_ids(mocker: MockerFixture) -> None:
+    known = build_summary("Known sub task")
+    unknown_id = uuid4()
+    mocker.patch.object(BeanieTask, "fetch_sub_task_summaries", mocker.AsyncMock(return_value={known.id: known}))
+
+    with pytest.raises(SubTaskNotFoundError) as error:
+        await BeanieTask.validate_sub_tasks([{"id": known.id}, {"id": unknown_id}, {"id": unknown_id}])
+
+    assert error.value.sub_task_ids == [unknown_id]
+    assert str(unknown_id) in str(error.value)
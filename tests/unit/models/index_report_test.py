@@ -0,0 +1,28 @@
+import pytest
+
+from app.infrastructure.datasource.index_report import declared_indexes, build_index_report
+from app.infrastructure.models.odm.beanie_task_model import BeanieTask
+
+
+def test_declared_indexes_keep_the_key_order() -> None:
+    indexes = declared_indexes(BeanieTask)
+
+    assert indexes[(("title", 1),)] == "title_1"
+    assert indexes[(("is_archived", 1), ("status", 1), ("created_at", -1), ("_id", -1))] == (
+        "is_archived_status_created_at_id"
+    )
+
+
+@pytest.mark.asyncio
+async def test_index_report_lists_undeclared_and_missing_indexes() -> None:
+    collection = BeanieTask.get_motor_collection()
+
+    report = await build_index_report(BeanieTask)
+    assert report == {"collection": "tasks", "undeclared": [], "missing": []}
+
+    await collection.create_index([("description", 1)], name="description_1")
+    await collection.drop_index("created_at_id")
+
+    report = await build_index_report(BeanieTask)
+    assert report["undeclared"] == ["description_1"]
+    assert report["missing"] == ["created_at_id"]
@@ -0,0 +1,143 @@
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.domain.entities.user import User
+from app.domain.entities.task_enum import Priority, SubTaskRelationType
+from app.schemas.pydantic.task_schemas import TaskCreate
+from app.infrastructure.mappers.task_mapper import (
+    to_beanie_task_from_schema_task_create,
+    to_beanie_tasks_from_schema_task_create_many,
+)
+from app.infrastructure.models.odm.beanie_task_model import BeanieTask
+from app.infrastructure.models.odm.beanie_user_model import BeanieUser
+
+
+def build_user(username: str) -> BeanieUser:
+    return BeanieUser(
+        id=uuid4(),
+        email=f"{username}@example.com",
+        username=username,
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed1234",
+    )
+
+
+def build_creator() -> User:
+    # The creator is the authenticated user, a domain entity rather than a document
+    return User(
+        id=uuid4(),
+        email="creator@example.com",
+        username="creator",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed1234",
+    )
+
+
+@pytest.mark.asyncio
+async def test_task_creation_reuses_validated_sub_tasks(mocker: MockerFixture) -> None:
+    creator = build_creator()
+    assignee = build_user("assignee")
+    sub_task_id = uuid4()
+    validated_sub_tasks = [
+        {
+            "id": sub_task_id,
+            "title": "Existing task",
+            "description": "Existing task description",
+            "due_date": None,
+            "relation_type": SubTaskRelationType.BLOCKS,
+        },
+    ]
+    validate_sub_tasks = mocker.patch.object(
+        BeanieTask,
+        "validate_sub_tasks",
+        mocker.AsyncMock(return_value=validated_sub_tasks),
+    )
+    get_user = mocker.patch.object(BeanieUser, "get", mocker.AsyncMock(return_value=assignee))
+
+    task, sub_task_summaries = await to_beanie_task_from_schema_task_create(
+        TaskCreate(
+            title="New task",
+            description="New task description",
+            priority=Priority.HIGH,
+            assigned_to=assignee.id,
+            sub_tasks=[{"id": sub_task_id, "relation_type": SubTaskRelationType.BLOCKS}],
+        ),
+        creator,
+    )
+
+    validate_sub_tasks.assert_awaited_once()
+    get_user.assert_awaited_once_with(assignee.id)
+    assert sub_task_summaries is validated_sub_tasks
+    assert task.priority == Priority.HIGH
+    assert task.assigned_to is assignee
+    assert task.created_by.ref.id == creator.id
+    assert [sub_task.id for sub_task in task.sub_tasks] == [sub_task_id]
+    assert task.sub_tasks[0].relation_type == SubTaskRelationType.BLOCKS
+
+
+@pytest.mark.asyncio
+async def test_task_creation_skips_lookups_when_not_needed(mocker: MockerFixture) -> None:
+    validate_sub_tasks = mocker.patch.object(BeanieTask, "validate_sub_tasks", mocker.AsyncMock())
+    get_user = mocker.patch.object(BeanieUser, "get", mocker.AsyncMock())
+
+    task, sub_task_summaries = await to_beanie_task_from_schema_task_create(
+        TaskCreate(title="Lonely task", description="Nothing to resolve"),
+        build_creator(),
+    )
+
+    validate_sub_tasks.assert_not_awaited()
+    get_user.assert_not_awaited()
+    assert task.assigned_to is None
+    assert sub_task_summaries == []
+
+
+@pytest.mark.asyncio
+async def test_task_creation_fails_for_unknown_assignee(mocker: MockerFixture) -> None:
+    mocker.patch.object(BeanieUser, "get", mocker.AsyncMock(return_value=None))
+
+    with pytest.raises(ValueError, match="Assigned user not found"):
+        await to_beanie_task_from_schema_task_create(
+            TaskCreate(title="Orphan task", description="Assigned to nobody", assigned_to=uuid4()),
+            build_creator(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_conversion_resolves_the_batch_at_once(mocker: MockerFixture) -> None:
+    creator = build_creator()
+    assignee_id = uuid4()
+    sub_task_id = uuid4()
+    user_collection = mocker.Mock()
+    user_collection.find.return_value.to_list = mocker.AsyncMock(return_value=[{"_id": assignee_id}])
+    mocker.patch.object(BeanieUser, "get_motor_collection", return_value=user_collection)
+    fetch_sub_task_summaries = mocker.patch.object(
+        BeanieTask,
+        "fetch_sub_task_summaries",
+        mocker.AsyncMock(return_value={}),
+    )
+
+    converted_tasks = await to_beanie_tasks_from_schema_task_create_many(
+        [
+            TaskCreate(title="Assigned", description="Known assignee", assigned_to=assignee_id),
+            TaskCreate(title="Orphan", description="Unknown assignee", assigned_to=uuid4()),
+            TaskCreate(
+                title="Dangling",
+                description="Unknown sub task",
+                sub_tasks=[{"id": sub_task_id, "relation_type": SubTaskRelationType.BLOCKS}],
+            ),
+        ],
+        creator,
+    )
+
+    user_collection.find.assert_called_once()
+    fetch_sub_task_summaries.assert_awaited_once_with([sub_task_id])
+    assigned_task, error = converted_tasks[0]
+    assert error is None
+    assert assigned_task.assigned_to.ref.id == assignee_id
+    assert assigned_task.created_by.ref.id == creator.id
+    assert converted_tasks[1] == (None, "Assigned user not found")
+    assert converted_tasks[2] == (None, f"Sub tasks not found: {sub_task_id}")
@@ -0,0 +1,39 @@
+import json
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.fastapi.responses import PydanticJSONResponse, get_type_adapter
+from app.schemas.pydantic.task_schemas import TaskRead
+from app.schemas.pydantic.common_schemas import CommonResponse, CommonListResponse
+
+
+def test_type_adapter_is_built_once_per_schema() -> None:
+    assert get_type_adapter(CommonListResponse[TaskRead]) is get_type_adapter(CommonListResponse[TaskRead])
+
+
+def test_projection_is_serialized_straight_to_bytes() -> None:
+    task_id = uuid4()
+    user = {"username": "creator", "email": "creator@example.com", "first_name": "Cre", "last_name": "Ator"}
+
+    response = PydanticJSONResponse(
+        {
+            "total": 1,
+            "data": [{"id": task_id, "title": "Task", "description": "Projected", "created_by": user}],
+        },
+        CommonListResponse[TaskRead],
+    )
+
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert body["total"] == 1
+    assert body["next_cursor"] is None
+    assert body["data"][0]["id"] == str(task_id)
+    assert body["data"][0]["created_by"] == user
+    assert body["data"][0]["status"] == 0
+
+
+def test_invalid_payload_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        PydanticJSONResponse({"message": "Missing result"}, CommonResponse[TaskRead])
@@ -0,0 +1,23 @@
+from datetime import UTC, datetime
+
+from app.utils.etag import build_etag, etag_matches
+
+
+def test_etag_is_stable_and_depends_on_every_part() -> None:
+    updated_at = datetime(2025, 1, 1, tzinfo=UTC)
+
+    etag = build_etag({"b": 1, "a": 2}, updated_at)
+
+    assert etag == build_etag({"a": 2, "b": 1}, updated_at)
+    assert etag != build_etag({"a": 2, "b": 1}, datetime(2025, 1, 2, tzinfo=UTC))
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+
+
+def test_if_none_match_lists_and_wildcards() -> None:
+    etag = build_etag("task")
+
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,54 @@
+from pytest_mock import MockerFixture
+
+from app.utils.lru_ttl_cache import LRUTTLCache
+
+
+def test_get_counts_hits_and_misses() -> None:
+    cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=2)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(mocker: MockerFixture) -> None:
+    clock = mocker.patch("app.utils.lru_ttl_cache.monotonic", return_value=100.0)
+    cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=2, ttl_seconds=10)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.return_value = 111.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_invalidate_and_disabled_cache() -> None:
+    cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=2)
+    cache.set("a", 1)
+
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+
+    disabled: LRUTTLCache[str, int] = LRUTTLCache(max_size=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
@@ -0,0 +1,71 @@
+import csv
+import gzip
+import json
+from uuid import uuid4
+from datetime import UTC, datetime
+
+import pytest
+from bson import DBRef
+
+from app.utils.task_export import EXPORT_FIELDS, stream_task_export
+from app.utils.enums.export_format_enum import ExportFormat
+
+
+def build_documents(count: int) -> list[dict]:
+    creator_id = uuid4()
+    return [
+        {
+            "_id": uuid4(),
+            "title": f"Task {index}",
+            "description": "Exported, with a comma",
+            "status": 2,
+            "priority": 1,
+            "is_archived": False,
+            "sub_tasks": [{"id": uuid4(), "relation_type": "blocks"}],
+            "due_date": None,
+            "assigned_to": None,
+            "created_by": DBRef("users", creator_id),
+            "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+        }
+        for index in range(count)
+    ]
+
+
+async def iterate(documents: list[dict]):
+    for document in documents:
+        yield document
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_has_one_task_per_line() -> None:
+    documents = build_documents(3)
+
+    body = await collect(stream_task_export(iterate(documents), ExportFormat.NDJSON))
+
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert [row["id"] for row in rows] == [str(document["_id"]) for document in documents]
+    assert rows[0]["created_by"] == str(documents[0]["created_by"].id)
+    assert rows[0]["assigned_to"] is None
+    assert rows[0]["created_at"] == "2025-01-01T00:00:00+00:00"
+    assert rows[0]["sub_tasks"] == [{"id": str(documents[0]["sub_tasks"][0]["id"]), "relation_type": "blocks"}]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_is_chunked_and_gzipped() -> None:
+    documents = build_documents(50)
+
+    chunks = [chunk async for chunk in stream_task_export(iterate(documents), ExportFormat.CSV, chunk_size=512)]
+    compressed_body = await collect(stream_task_export(iterate(documents), ExportFormat.CSV, compress=True))
+
+    assert len(chunks) > 2
+    assert all(len(chunk) >= 512 for chunk in chunks[:-1])
+    assert gzip.decompress(compressed_body) == b"".join(chunks)
+    rows = list(csv.reader(b"".join(chunks).decode().splitlines()))
+    assert tuple(rows[0]) == EXPORT_FIELDS
+    assert len(rows) == 51
+    assert rows[1][EXPORT_FIELDS.index("description")] == "Exported, with a comma"
+    assert rows[1][EXPORT_FIELDS.index("sub_tasks")] == f"{documents[0]['sub_tasks'][0]['id']}:blocks"
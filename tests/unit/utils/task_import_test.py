@@ -0,0 +1,127 @@
+import gzip
+import json
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.utils.task_import import iter_lines, gunzip_chunks, iter_import_records
+from app.domain.entities.user import User
+from app.services.task_service import TaskService
+from app.utils.enums.export_format_enum import ExportFormat
+
+
+async def iterate(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+def split(body: bytes, chunk_size: int) -> list[bytes]:
+    return [body[index : index + chunk_size] for index in range(0, len(body), chunk_size)]
+
+
+async def read_records(body: bytes, import_format: ExportFormat, chunk_size: int = 7) -> list:
+    lines = iter_lines(iterate(split(body, chunk_size)))
+    return [record async for record in iter_import_records(lines, import_format)]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_rows_are_validated_across_chunk_boundaries() -> None:
+    body = "\n".join(
+        [
+            json.dumps({"title": "Première tâche", "description": "Accents", "priority": 2}),
+            "",
+            json.dumps({"description": "no title"}),
+            "{not json",
+        ],
+    ).encode()
+
+    records = await read_records(body, ExportFormat.NDJSON)
+
+    assert [line_number for line_number, _, _ in records] == [1, 3, 4]
+    assert records[0][1].title == "Première tâche"
+    assert records[0][2] is None
+    assert records[1][1] is None
+    assert "title" in records[1][2]
+    assert records[2][1] is None
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_handle_quoted_line_breaks_and_sub_tasks() -> None:
+    sub_task_id = uuid4()
+    body = (
+        "title,description,priority,sub_tasks\r\n"
+        f'First,"Spans\ntwo lines",1,{sub_task_id}:blocks\r\n'
+        "Second,Plain,not a priority,\r\n"
+    ).encode()
+
+    records = await read_records(body, ExportFormat.CSV)
+
+    assert [line_number for line_number, _, _ in records] == [2, 4]
+    first_task = records[0][1]
+    assert first_task.description == "Spans\ntwo lines"
+    assert first_task.sub_tasks[0].id == sub_task_id
+    assert records[1][1] is None
+    assert "priority" in records[1][2]
+
+
+@pytest.mark.asyncio
+async def test_gzipped_upload_is_decompressed_incrementally() -> None:
+    body = b"".join(json.dumps({"title": f"Task {index}"}).encode() + b"\n" for index in range(100))
+
+    chunks = split(gzip.compress(body), 64)
+    decompressed_body = b"".join([chunk async for chunk in gunzip_chunks(iterate(chunks))])
+
+    assert decompressed_body == body
+
+
+@pytest.mark.asyncio
+async def test_import_writes_batches_and_keeps_an_error_report(
+    current_user: User,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("app.services.task_service.get_settings").return_value = mocker.Mock(
+        TASK_IMPORT_BATCH_SIZE=2,
+        TASK_IMPORT_MAX_REPORTED_ERRORS=10,
+        TASK_IMPORT_REPORT_TTL_SECONDS=60,
+    )
+    repository = mocker.Mock()
+    repository.create_tasks = mocker.AsyncMock(
+        side_effect=[
+            {"created": 2, "failed": 0, "results": [{"index": 0, "error": None}, {"index": 1, "error": None}]},
+            {"created": 0, "failed": 1, "results": [{"index": 0, "error": "Assigned user not found"}]},
+        ],
+    )
+    body = "\n".join(
+        [
+            json.dumps({"title": "One", "description": "Imported"}),
+            json.dumps({"title": "Two", "description": "Imported"}),
+            json.dumps({"description": "no title"}),
+            json.dumps({"title": "Four", "description": "Imported"}),
+        ],
+    ).encode()
+
+    summary = await TaskService(repository).import_tasks(
+        current_user,
+        iterate([gzip.compress(body)]),
+        ExportFormat.NDJSON,
+        compressed=True,
+    )
+
+    assert summary["processed"] == 4
+    assert summary["created"] == 2
+    assert summary["failed"] == 2
+    assert summary["errors_truncated"] is False
+    assert repository.create_tasks.await_count == 2
+    first_call, second_call = repository.create_tasks.await_args_list
+    assert [task.title for task in first_call.args[1]] == ["One", "Two"]
+    assert [task.title for task in second_call.args[1]] == ["Four"]
+    # The assignees cache is shared by every batch of the import
+    assert first_call.args[2] is second_call.args[2]
+
+    report = await TaskService(repository).get_import_report(current_user, summary["import_id"])
+    assert [error["line"] for error in report] == [3, 4]
+    assert report[1]["error"] == "Assigned user not found"
+    # Only the user who ran the import may read its report
+    other_user = current_user.model_copy(update={"id": uuid4()})
+    assert await TaskService(repository).get_import_report(other_user, summary["import_id"]) is None
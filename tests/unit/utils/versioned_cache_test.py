@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import RedisCacheBackend, MemoryCacheBackend
+from app.utils.versioned_cache import VersionedCache, canonical_key
+
+
+def test_canonical_key_ignores_the_order_of_keys() -> None:
+    assert canonical_key({"a": 1, "b": [1, 2]}, 0) == canonical_key({"b": [1, 2], "a": 1}, 0)
+    assert canonical_key({"a": 1}, 0) != canonical_key({"a": 1}, 1)
+
+
+@pytest.mark.asyncio
+async def test_bump_outdates_every_entry() -> None:
+    cache = VersionedCache(MemoryCacheBackend(max_size=10), ttl_seconds=60)
+    computed = []
+
+    async def compute() -> bytes:
+        computed.append(cache.version)
+        return str(len(computed)).encode()
+
+    assert await cache.get_or_compute("page", compute) == b"1"
+    assert await cache.get_or_compute("page", compute) == b"1"
+
+    assert await cache.bump() == 1
+
+    assert await cache.get_or_compute("page", compute) == b"2"
+    assert computed == [0, 1]
+    assert cache.stats()["hit_ratio"] == round(1 / 3, 4)
+
+
+@pytest.mark.asyncio
+async def test_bump_in_a_worker_outdates_the_entries_of_the_others() -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis()
+    # Each worker holds its own cache object, only the store is shared
+    first_worker = VersionedCache(RedisCacheBackend(namespace="task_lists", client=client), ttl_seconds=60)
+    second_worker = VersionedCache(RedisCacheBackend(namespace="task_lists", client=client), ttl_seconds=60)
+    rendered = iter([b"old", b"new"])
+
+    async def compute() -> bytes:
+        return next(rendered)
+
+    assert await first_worker.get_or_compute("page", compute) == b"old"
+    assert await second_worker.get_or_compute("page", compute) == b"old"
+
+    await first_worker.bump()
+
+    assert await second_worker.get_or_compute("page", compute) == b"new"
+    assert await first_worker.get_or_compute("page", compute) == b"new"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation() -> None:
+    cache = VersionedCache(MemoryCacheBackend(max_size=10), ttl_seconds=60)
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"rendered"
+
+    results = await asyncio.gather(*(cache.get_or_compute("page", compute) for _ in range(5)))
+
+    assert results == [b"rendered"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_computes_every_lookup() -> None:
+    cache = VersionedCache(MemoryCacheBackend(max_size=10), ttl_seconds=60, enabled=False)
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        return b"rendered"
+
+    await cache.get_or_compute("page", compute)
+    await cache.get_or_compute("page", compute)
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_outdated_entry_is_served_while_a_slow_computation_refreshes_it() -> None:
+    cache = VersionedCache(
+        MemoryCacheBackend(max_size=10),
+        ttl_seconds=60,
+        stale_ttl_seconds=60,
+        stale_timeout_seconds=0.01,
+    )
+    refreshed = asyncio.Event()
+
+    async def compute_old() -> bytes:
+        return b"old"
+
+    async def compute_slow() -> bytes:
+        await asyncio.sleep(0.05)
+        refreshed.set()
+        return b"new"
+
+    await cache.get_or_compute("page", compute_old)
+    await cache.bump()
+
+    assert await cache.get_or_compute("page", compute_slow) == b"old"
+    await refreshed.wait()
+    await asyncio.sleep(0)
+    assert await cache.get_or_compute("page", compute_old) == b"new"
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_outdated_entries_are_not_served_without_a_stale_timeout() -> None:
+    cache = VersionedCache(MemoryCacheBackend(max_size=10), ttl_seconds=60, stale_ttl_seconds=60)
+
+    async def compute_old() -> bytes:
+        return b"old"
+
+    async def compute_new() -> bytes:
+        await asyncio.sleep(0.01)
+        return b"new"
+
+    await cache.get_or_compute("page", compute_old)
+    await cache.bump()
+
+    assert await cache.get_or_compute("page", compute_new) == b"new"